@@ -0,0 +1,82 @@
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1)
+MEDICOS = 10
+REPETICIONES = 2000
+
+
+def horarios(cantidad: int, inicio: datetime = INICIO):
+    instante = inicio
+    for _ in range(cantidad):
+        yield instante.strftime("%d/%m/%Y"), instante.strftime("%H:%M")
+        instante += timedelta(minutes=1)
+
+
+def crear_clinica(turnos_existentes: int) -> Clinica:
+    clinica = Clinica()
+    clinica.registrar_paciente("Paciente Benchmark", "10000000", "01/01/1980")
+    for i in range(MEDICOS):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+    for i, (fecha, hora) in enumerate(horarios(turnos_existentes)):
+        clinica.agendar_turno("10000000", f"M{i % MEDICOS}", fecha, hora, "Clínica")
+    return clinica
+
+
+def conflicto_lineal(clinica: Clinica, matricula: str, fecha: str, hora: str) -> bool:
+    for turno in clinica.__turnos__:
+        if (
+            turno.obtener_medico().obtener_matricula() == matricula
+            and turno.obtener_fecha() == fecha
+            and turno.obtener_hora() == hora
+            and turno.obtener_estado() != "Cancelado"
+        ):
+            return True
+    return False
+
+
+def medir_agenda(clinica: Clinica) -> float:
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        clave = ("M0", INICIO)
+        clave in clinica.__agenda__
+    return (time.perf_counter() - inicio) / REPETICIONES
+
+
+def medir_lineal(clinica: Clinica) -> float:
+    repeticiones = max(1, REPETICIONES // max(1, len(clinica.__turnos__) // 1000))
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        conflicto_lineal(clinica, "M0", "31/12/2099", "23:59")
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def medir_agendar(clinica: Clinica) -> float:
+    fechas = list(horarios(REPETICIONES, INICIO + timedelta(days=3650)))
+    inicio = time.perf_counter()
+    for fecha, hora in fechas:
+        clinica.agendar_turno("10000000", "M0", fecha, hora, "Clínica")
+    return (time.perf_counter() - inicio) / REPETICIONES
+
+
+def main(tamanios: list[int]):
+    print(
+        f"{'turnos':>10} {'agenda (us)':>14} {'escaneo (us)':>14} {'agendar_turno (us)':>20}"
+    )
+    for tamanio in tamanios:
+        clinica = crear_clinica(tamanio)
+        agenda = medir_agenda(clinica) * 1e6
+        lineal = medir_lineal(clinica) * 1e6
+        agendar = medir_agendar(clinica) * 1e6
+        print(f"{tamanio:>10} {agenda:>14.2f} {lineal:>14.2f} {agendar:>20.2f}")
+
+
+if __name__ == "__main__":
+    tamanios = [int(arg) for arg in sys.argv[1:]] or [0, 1000, 10000, 100000]
+    main(tamanios)
@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica
+from src.api import ServidorClinica
+from src.api.protocolo import formatear_solicitud, leer_respuesta
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+
+
+def servidor_local(conexion):
+    async def servir():
+        servidor = ServidorClinica(Clinica(), puerto=0)
+        conexion.send(await servidor.iniciar())
+        await asyncio.Event().wait()
+
+    asyncio.run(servir())
+
+
+def horarios(medicos: int):
+    instante = INICIO
+    while True:
+        fecha = instante.strftime("%d/%m/%Y")
+        hora = instante.strftime("%H:%M")
+        for medico in range(medicos):
+            yield f"M{medico}", fecha, hora
+        instante += timedelta(minutes=15)
+
+
+class Carga:
+
+    def __init__(self, args):
+        self.args = args
+        self.azar = random.Random(args.semilla)
+        self.horarios = horarios(args.medicos)
+        self.latencias = []
+        self.estados = Counter()
+
+    def dni(self) -> str:
+        return str(10000000 + self.azar.randrange(self.args.pacientes))
+
+    def siguiente(self) -> tuple[str, str, dict | None]:
+        if self.azar.random() < self.args.escrituras:
+            matricula, fecha, hora = next(self.horarios)
+            return (
+                "POST",
+                "/turnos",
+                {
+                    "dni": self.dni(),
+                    "matricula": matricula,
+                    "fecha": fecha,
+                    "hora": hora,
+                    "especialidad": "Clínica",
+                },
+            )
+        eleccion = self.azar.random()
+        if eleccion < 0.5:
+            return "GET", f"/pacientes/{self.dni()}", None
+        if eleccion < 0.8:
+            return "GET", f"/pacientes/{self.dni()}/historia", None
+        matricula = f"M{self.azar.randrange(self.args.medicos)}"
+        ruta = f"/medicos/{matricula}/turnos?desde=01/01/2025&hasta=07/01/2025"
+        return "GET", ruta, None
+
+    async def poblar(self, host: str, puerto: int):
+        solicitudes = [
+            (
+                "POST",
+                "/pacientes",
+                {
+                    "nombre": f"Paciente {i}",
+                    "dni": str(10000000 + i),
+                    "fecha_nacimiento": "01/01/1980",
+                },
+            )
+            for i in range(self.args.pacientes)
+        ]
+        for i in range(self.args.medicos):
+            solicitudes.append(
+                ("POST", "/medicos", {"nombre": f"Medico {i}", "matricula": f"M{i}"})
+            )
+            solicitudes.append(
+                (
+                    "POST",
+                    f"/medicos/M{i}/especialidades",
+                    {"especialidad": "Clínica", "dias": DIAS},
+                )
+            )
+
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        escritor.write(b"".join(formatear_solicitud(*s) for s in solicitudes))
+        await escritor.drain()
+        for _ in solicitudes:
+            estado, _, cuerpo = await leer_respuesta(lector)
+            if estado != 201:
+                raise RuntimeError(cuerpo.decode("utf-8"))
+        escritor.close()
+        await escritor.wait_closed()
+
+    async def conexion(self, host: str, puerto: int, cantidad: int):
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        enviados = deque()
+        ventana = asyncio.Semaphore(self.args.canalizacion)
+
+        async def enviar():
+            for _ in range(cantidad):
+                await ventana.acquire()
+                enviados.append(time.perf_counter())
+                escritor.write(formatear_solicitud(*self.siguiente()))
+                await escritor.drain()
+
+        envio = asyncio.create_task(enviar())
+        for _ in range(cantidad):
+            estado, _, _ = await leer_respuesta(lector)
+            self.latencias.append(time.perf_counter() - enviados.popleft())
+            self.estados[estado] += 1
+            ventana.release()
+        await envio
+        escritor.close()
+        await escritor.wait_closed()
+
+    async def ejecutar(self, host: str, puerto: int) -> float:
+        await self.poblar(host, puerto)
+        por_conexion = self.args.solicitudes // self.args.conexiones
+        inicio = time.perf_counter()
+        await asyncio.gather(
+            *(
+                self.conexion(host, puerto, por_conexion)
+                for _ in range(self.args.conexiones)
+            )
+        )
+        return time.perf_counter() - inicio
+
+
+def percentil(ordenadas: list[float], fraccion: float) -> float:
+    return ordenadas[min(len(ordenadas) - 1, int(fraccion * len(ordenadas)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prueba de carga de la API HTTP/JSON con conexiones persistentes"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--puerto", type=int, help="Servidor existente; si se omite se inicia uno"
+    )
+    parser.add_argument("--conexiones", type=int, default=16)
+    parser.add_argument("--canalizacion", type=int, default=8)
+    parser.add_argument("--solicitudes", type=int, default=40000)
+    parser.add_argument("--escrituras", type=float, default=0.1)
+    parser.add_argument("--pacientes", type=int, default=2000)
+    parser.add_argument("--medicos", type=int, default=20)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    proceso = None
+    puerto = args.puerto
+    if puerto is None:
+        receptor, emisor = multiprocessing.Pipe(duplex=False)
+        proceso = multiprocessing.Process(
+            target=servidor_local, args=(emisor,), daemon=True
+        )
+        proceso.start()
+        puerto = receptor.recv()
+
+    try:
+        carga = Carga(args)
+        duracion = asyncio.run(carga.ejecutar(args.host, puerto))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.join()
+
+    latencias = sorted(carga.latencias)
+    print(
+        f"{len(latencias)} solicitudes en {duracion:.2f} s "
+        f"({len(latencias) / duracion:,.0f} sol/s) con {args.conexiones} conexiones "
+        f"x {args.canalizacion} en vuelo"
+    )
+    print(
+        f"latencia p50 {percentil(latencias, 0.5) * 1000:.2f} ms, "
+        f"p99 {percentil(latencias, 0.99) * 1000:.2f} ms, "
+        f"máx {latencias[-1] * 1000:.2f} ms"
+    )
+    print("estados: " + ", ".join(f"{e}={n}" for e, n in sorted(carga.estados.items())))
+
+
+if __name__ == "__main__":
+    main()
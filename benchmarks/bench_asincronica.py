@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica, ClinicaAsincronica
+from src.persistencia.sqlite import RepositorioSQLite
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+
+
+class ClinicaEnvuelta:
+
+    def __init__(self, clinica: Clinica):
+        self.__clinica__ = clinica
+
+    async def agendar_turno(self, *solicitud):
+        turno = self.__clinica__.agendar_turno(*solicitud)
+        self.__clinica__.confirmar()
+        return turno
+
+    async def detener(self):
+        pass
+
+
+def crear(ruta: str, medicos: int, pacientes: int) -> Clinica:
+    clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+    for i in range(pacientes):
+        clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), "01/01/1980")
+    for i in range(medicos):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+    clinica.confirmar()
+    return clinica
+
+
+def solicitudes(cantidad: int, medicos: int, pacientes: int):
+    for i in range(cantidad):
+        instante = INICIO + timedelta(minutes=15 * (i // medicos))
+        yield (
+            str(10000000 + i % pacientes),
+            f"M{i % medicos}",
+            instante.strftime("%d/%m/%Y"),
+            instante.strftime("%H:%M"),
+            "Clínica",
+        )
+
+
+async def medir_retraso(detener: asyncio.Event, retrasos: list[float]):
+    while not detener.is_set():
+        antes = time.perf_counter()
+        await asyncio.sleep(0.001)
+        retrasos.append(time.perf_counter() - antes - 0.001)
+
+
+async def ejecutar(fachada, args) -> tuple[float, float]:
+    pendientes = list(solicitudes(args.turnos, args.medicos, args.pacientes))
+    cola = asyncio.Queue()
+    for solicitud in pendientes:
+        cola.put_nowait(solicitud)
+
+    async def cliente():
+        while not cola.empty():
+            await fachada.agendar_turno(*cola.get_nowait())
+
+    detener = asyncio.Event()
+    retrasos = []
+    monitor = asyncio.create_task(medir_retraso(detener, retrasos))
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(args.clientes)))
+    duracion = time.perf_counter() - inicio
+    detener.set()
+    await monitor
+    await fachada.detener()
+    return args.turnos / duracion, max(retrasos, default=0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Turnos concurrentes en asyncio: envoltorio directo vs. "
+        "ClinicaAsincronica con escrituras agrupadas"
+    )
+    parser.add_argument("--turnos", type=int, default=20000)
+    parser.add_argument("--clientes", type=int, default=256)
+    parser.add_argument("--medicos", type=int, default=20)
+    parser.add_argument("--pacientes", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for indice, (nombre, crear_fachada) in enumerate(
+            (
+                ("envoltorio directo", ClinicaEnvuelta),
+                ("ClinicaAsincronica", ClinicaAsincronica),
+            )
+        ):
+            ruta = os.path.join(directorio, f"clinica{indice}.db")
+            clinica = crear(ruta, args.medicos, args.pacientes)
+            rendimiento, retraso = asyncio.run(ejecutar(crear_fachada(clinica), args))
+            clinica.cerrar()
+            print(
+                f"{nombre:>20}: {rendimiento:>9,.0f} turnos/s, "
+                f"retraso máximo del bucle {retraso * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
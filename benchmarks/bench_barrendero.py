@@ -0,0 +1,86 @@
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import BarrenderoTurnos, Clinica, EstadoTurno
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+MEDICOS = 10
+
+
+def crear(turnos: int) -> Clinica:
+    clinica = Clinica()
+    clinica.registrar_paciente("Paciente Benchmark", "10000000", "01/01/1980")
+    for i in range(MEDICOS):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+    solicitudes = []
+    instante = INICIO
+    for i in range(turnos):
+        if i % MEDICOS == 0:
+            instante += timedelta(minutes=15)
+        solicitudes.append(
+            (
+                "10000000",
+                f"M{i % MEDICOS}",
+                instante.strftime("%d/%m/%Y"),
+                instante.strftime("%H:%M"),
+                "Clínica",
+            )
+        )
+    clinica.agendar_turnos_lote(solicitudes)
+    return clinica
+
+
+def barrer_recorriendo(clinica: Clinica, ahora: datetime) -> int:
+    barridos = 0
+    for turno in clinica.iter_turnos():
+        if (
+            turno.obtener_estado_turno() is EstadoTurno.PROGRAMADO
+            and turno.obtener_fecha_hora() <= ahora
+        ):
+            turno.marcar_completado()
+            barridos += 1
+    clinica.confirmar()
+    return barridos
+
+
+def medir(barrer, vencidos: int, rondas: int) -> float:
+    paso = timedelta(minutes=15 * vencidos // MEDICOS)
+    ahora = INICIO
+    inicio = time.perf_counter()
+    for _ in range(rondas):
+        ahora += paso
+        barrer(ahora)
+    return (time.perf_counter() - inicio) / rondas
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Costo de barrer los turnos vencidos según el total de turnos"
+    )
+    parser.add_argument("--vencidos", type=int, default=100)
+    parser.add_argument("--rondas", type=int, default=50)
+    parser.add_argument(
+        "--totales", type=int, nargs="+", default=[10000, 100000, 400000]
+    )
+    args = parser.parse_args()
+
+    for total in args.totales:
+        clinica = crear(total)
+        recorrido = medir(
+            lambda ahora: barrer_recorriendo(clinica, ahora), args.vencidos, args.rondas
+        )
+        barrendero = BarrenderoTurnos(crear(total))
+        monticulo = medir(barrendero.barrer, args.vencidos, args.rondas)
+        print(
+            f"{total:>7} turnos, {args.vencidos} vencidos por ronda: "
+            f"recorrido {recorrido * 1e3:8.2f} ms, "
+            f"montículo {monticulo * 1e3:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica, ClinicaConcurrente
+from src.excepciones import TurnoOcupadoException
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+
+
+class ClinicaBloqueoGlobal(Clinica):
+
+    def __init__(self, *argumentos, **opciones):
+        self.__cerrojo__ = threading.Lock()
+        super().__init__(*argumentos, **opciones)
+
+    def agendar_turno(self, *argumentos) -> object:
+        with self.__cerrojo__:
+            return super().agendar_turno(*argumentos)
+
+
+def crear(clase, hilos: int, medicos: int):
+    clinica = clase()
+    for i in range(hilos):
+        clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), "01/01/1980")
+    for i in range(medicos):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+    return clinica
+
+
+def horarios(cantidad: int) -> list[tuple[str, str]]:
+    return [
+        (
+            (INICIO + timedelta(minutes=15 * i)).strftime("%d/%m/%Y"),
+            (INICIO + timedelta(minutes=15 * i)).strftime("%H:%M"),
+        )
+        for i in range(cantidad)
+    ]
+
+
+def medir(clase, hilos: int, turnos: int, compartidos: bool) -> tuple[float, int, int]:
+    medicos = 4 if compartidos else hilos
+    clinica = crear(clase, hilos, medicos)
+    agenda = horarios(turnos)
+    agendados = [0] * hilos
+    barrera = threading.Barrier(hilos + 1)
+
+    def trabajar(indice):
+        dni = str(10000000 + indice)
+        barrera.wait()
+        for posicion, (fecha, hora) in enumerate(agenda):
+            matricula = f"M{posicion % medicos if compartidos else indice}"
+            try:
+                clinica.agendar_turno(dni, matricula, fecha, hora, "Clínica")
+                agendados[indice] += 1
+            except TurnoOcupadoException:
+                pass
+
+    trabajadores = [threading.Thread(target=trabajar, args=(i,)) for i in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    barrera.wait()
+    inicio = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.join()
+    duracion = time.perf_counter() - inicio
+
+    intentos = hilos * turnos
+    esperados = turnos if compartidos else intentos
+    return intentos / duracion, sum(agendados), sum(agendados) - esperados
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reservas concurrentes: cerrojos por franja vs. cerrojo global"
+    )
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--turnos", type=int, default=5000)
+    args = parser.parse_args()
+
+    for compartidos in (False, True):
+        escenario = "médicos compartidos" if compartidos else "un médico por hilo"
+        print(escenario)
+        for hilos in args.hilos:
+            for clase in (ClinicaBloqueoGlobal, ClinicaConcurrente):
+                rendimiento, agendados, duplicados = medir(
+                    clase, hilos, args.turnos, compartidos
+                )
+                print(
+                    f"  {hilos} hilos {clase.__name__:>21}: "
+                    f"{rendimiento:>9,.0f} intentos/s, {agendados} agendados, "
+                    f"{duplicados} duplicados"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import gc
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from src.modelo import Clinica
+from src.persistencia.diario import RepositorioDiario
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado"]
+
+
+def poblar(clinica: Clinica, args):
+    for i in range(args.pacientes):
+        clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), "01/01/1980")
+    for i in range(args.medicos):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+    dia = date(2025, 1, 1)
+    paciente = 0
+    for _ in range(args.dias):
+        while dia.weekday() == 6:
+            dia += timedelta(days=1)
+        lote = []
+        for medico in range(args.medicos):
+            inicio = datetime.combine(dia, datetime.min.time()) + timedelta(hours=8)
+            for turno in range(args.turnos_por_dia):
+                instante = inicio + timedelta(minutes=20 * turno)
+                lote.append(
+                    (
+                        str(10000000 + paciente % args.pacientes),
+                        f"M{medico}",
+                        instante.strftime("%d/%m/%Y"),
+                        instante.strftime("%H:%M"),
+                        "Clínica",
+                    )
+                )
+                paciente += 1
+        clinica.agendar_turnos_lote(lote)
+        dia += timedelta(days=1)
+
+    for i in range(args.recetas):
+        clinica.emitir_receta(
+            str(10000000 + i % args.pacientes),
+            f"M{i % args.medicos}",
+            "15/07/2025",
+            ["Paracetamol 500mg"],
+            "Tomar cada 8 horas",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Tiempo de arranque desde instantánea + diario"
+    )
+    parser.add_argument("--pacientes", type=int, default=20000)
+    parser.add_argument("--medicos", type=int, default=40)
+    parser.add_argument("--dias", type=int, default=300)
+    parser.add_argument("--turnos-por-dia", type=int, default=16)
+    parser.add_argument("--recetas", type=int, default=20000)
+    parser.add_argument("--cola", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        repositorio = RepositorioDiario(directorio, sincronizar_cada=1000)
+        clinica = Clinica(repositorio=repositorio)
+
+        inicio = time.perf_counter()
+        poblar(clinica, args)
+        repositorio.tomar_instantanea()
+        for i in range(args.cola):
+            clinica.registrar_paciente(f"Nuevo {i}", str(90000000 + i), "01/01/1990")
+        clinica.cerrar()
+        print(f"Escritura: {time.perf_counter() - inicio:.2f} s")
+        del clinica, repositorio
+        gc.collect()
+
+        inicio = time.perf_counter()
+        recargada = Clinica(repositorio=RepositorioDiario(directorio))
+        duracion = time.perf_counter() - inicio
+        print(
+            f"Arranque: {duracion:.2f} s "
+            f"({recargada.contar_turnos()} turnos, "
+            f"{len(recargada.listar_pacientes())} pacientes, "
+            f"cola de {args.cola} registros)"
+        )
+        recargada.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica, TipoEvento
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+MEDICOS = 10
+
+
+def crear() -> Clinica:
+    clinica = Clinica()
+    clinica.registrar_paciente("Paciente Benchmark", "10000000", "01/01/1980")
+    for i in range(MEDICOS):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+    return clinica
+
+
+def medir(clinica: Clinica, turnos: int) -> tuple[float, float]:
+    latencias = []
+    instante = INICIO
+    for i in range(turnos):
+        if i % MEDICOS == 0:
+            instante += timedelta(minutes=15)
+        fecha = instante.strftime("%d/%m/%Y")
+        hora = instante.strftime("%H:%M")
+        inicio = time.perf_counter()
+        clinica.agendar_turno("10000000", f"M{i % MEDICOS}", fecha, hora, "Clínica")
+        latencias.append(time.perf_counter() - inicio)
+    latencias.sort()
+    return latencias[len(latencias) // 2], latencias[int(len(latencias) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Latencia de agendar_turno según los suscriptores de eventos"
+    )
+    parser.add_argument("--turnos", type=int, default=50000)
+    parser.add_argument("--capacidad", type=int, default=1024)
+    args = parser.parse_args()
+
+    escenarios = []
+
+    clinica = crear()
+    escenarios.append(("sin suscriptores", clinica, []))
+
+    clinica = crear()
+    suscripciones = [
+        clinica.obtener_eventos().suscribir(capacidad=args.turnos) for _ in range(4)
+    ]
+    escenarios.append(("4 suscriptores con espacio", clinica, suscripciones))
+
+    clinica = crear()
+    suscripciones = [
+        clinica.obtener_eventos().suscribir(
+            [TipoEvento.TURNO_AGENDADO], capacidad=args.capacidad
+        )
+        for _ in range(4)
+    ]
+    escenarios.append(("4 suscriptores detenidos", clinica, suscripciones))
+
+    for nombre, clinica, suscripciones in escenarios:
+        mediana, p99 = medir(clinica, args.turnos)
+        descartados = sum(s.obtener_descartados() for s in suscripciones)
+        print(
+            f"{nombre:>27}: p50 {mediana * 1e6:6.1f} µs, p99 {p99 * 1e6:6.1f} µs, "
+            f"{descartados} eventos descartados"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.modelo import Clinica
+from src.persistencia.binario import InstantaneaBinaria, escribir_instantanea_binaria
+from src.persistencia.diario import RepositorioDiario
+from benchmarks.bench_diario import poblar
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Arranque de una réplica de lectura desde la instantánea binaria"
+    )
+    parser.add_argument("--escalas", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--dias", type=int, default=300)
+    parser.add_argument("--turnos-por-dia", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for medicos in args.escalas:
+            escala = argparse.Namespace(
+                pacientes=500 * medicos,
+                medicos=medicos,
+                dias=args.dias,
+                turnos_por_dia=args.turnos_por_dia,
+                recetas=500 * medicos,
+            )
+            diario = os.path.join(directorio, f"diario_{medicos}")
+            repositorio = RepositorioDiario(diario, sincronizar_cada=1000)
+            clinica = Clinica(repositorio=repositorio)
+            poblar(clinica, escala)
+            repositorio.tomar_instantanea()
+            clinica.cerrar()
+
+            ruta = os.path.join(directorio, f"clinica_{medicos}.bin")
+            escribir_instantanea_binaria(clinica, ruta)
+            turnos = clinica.contar_turnos()
+            del clinica, repositorio
+            gc.collect()
+
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            instantanea = InstantaneaBinaria.abrir(ruta)
+            historia = instantanea.obtener_historia_clinica(str(10000000 + medicos))
+            binaria = time.perf_counter() - inicio
+            memoria = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            instantanea.cerrar()
+
+            inicio = time.perf_counter()
+            Clinica(repositorio=RepositorioDiario(diario)).cerrar()
+            completa = time.perf_counter() - inicio
+
+            print(
+                f"{turnos:>7} turnos ({os.path.getsize(ruta) / 1e6:.1f} MB): "
+                f"réplica binaria {binaria * 1000:.2f} ms / {memoria / 1024:.0f} KB "
+                f"({len(historia.obtener_turnos())} turnos leídos), "
+                f"carga completa {completa:.2f} s"
+            )
+            gc.collect()
+
+
+if __name__ == "__main__":
+    main()
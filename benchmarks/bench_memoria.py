@@ -0,0 +1,117 @@
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+
+
+def rss_actual_kb() -> int | None:
+    try:
+        with open("/proc/self/statm") as archivo:
+            paginas = int(archivo.read().split()[1])
+    except OSError:
+        return None
+
+    import resource
+
+    return paginas * resource.getpagesize() // 1024
+
+
+def rss_maximo_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def medir(etapa: str, cantidad: int, funcion, resultados: list):
+    gc.collect()
+    antes = tracemalloc.get_traced_memory()[0]
+    funcion()
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    por_entidad = (despues - antes) / cantidad if cantidad else 0
+    resultados.append((etapa, cantidad, despues - antes, por_entidad))
+
+
+def construir(clinica: Clinica, args) -> list:
+    resultados = []
+
+    def pacientes():
+        for i in range(args.pacientes):
+            fecha = (datetime(1950, 1, 1) + timedelta(days=i % 25000)).strftime(
+                "%d/%m/%Y"
+            )
+            clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), fecha)
+
+    def medicos():
+        for i in range(args.medicos):
+            clinica.registrar_medico(f"Medico {i}", f"M{i}")
+            clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+    def turnos():
+        instante = INICIO
+        for i in range(args.turnos):
+            medico = i % args.medicos
+            if medico == 0 and i:
+                instante += timedelta(minutes=15)
+            clinica.agendar_turno(
+                str(10000000 + i % args.pacientes),
+                f"M{medico}",
+                instante.strftime("%d/%m/%Y"),
+                instante.strftime("%H:%M"),
+                "Clínica",
+            )
+
+    def recetas():
+        for i in range(args.recetas):
+            clinica.emitir_receta(
+                str(10000000 + i % args.pacientes),
+                f"M{i % args.medicos}",
+                "15/07/2025",
+                ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+                "Tomar cada 8 horas",
+            )
+
+    medir("pacientes + historias", args.pacientes, pacientes, resultados)
+    medir("medicos", args.medicos, medicos, resultados)
+    medir("turnos", args.turnos, turnos, resultados)
+    medir("recetas", args.recetas, recetas, resultados)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Memoria por entidad de una clínica sintética"
+    )
+    parser.add_argument("--pacientes", type=int, default=10000)
+    parser.add_argument("--medicos", type=int, default=50)
+    parser.add_argument("--turnos", type=int, default=100000)
+    parser.add_argument("--recetas", type=int, default=20000)
+    args = parser.parse_args()
+
+    rss_inicial = rss_actual_kb()
+    tracemalloc.start()
+    clinica = Clinica()
+    resultados = construir(clinica, args)
+    tracemalloc.stop()
+    rss_final = rss_actual_kb()
+
+    print(f"{'entidad':<24} {'cantidad':>10} {'bytes totales':>15} {'bytes/entidad':>14}")
+    for etapa, cantidad, total, por_entidad in resultados:
+        print(f"{etapa:<24} {cantidad:>10} {total:>15} {por_entidad:>14.1f}")
+
+    if rss_final is not None:
+        print(f"\nRSS actual: {rss_final} KB (creció {rss_final - rss_inicial} KB)")
+    maximo = rss_maximo_kb()
+    if maximo is not None:
+        print(f"RSS máximo: {maximo} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import os
+import time
+from datetime import date, datetime, timedelta
+
+from src.modelo import Clinica
+from src.distribucion import ClinicaParticionada
+from benchmarks.bench_diario import DIAS
+
+
+def registrar(clinica, args):
+    for i in range(args.pacientes):
+        clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), "01/01/1980")
+    for i in range(args.medicos):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+
+def lotes(args):
+    dia = date(2025, 1, 1)
+    paciente = 0
+    for _ in range(args.dias):
+        while dia.weekday() == 6:
+            dia += timedelta(days=1)
+        lote = []
+        for medico in range(args.medicos):
+            inicio = datetime.combine(dia, datetime.min.time()) + timedelta(hours=8)
+            for turno in range(args.turnos_por_dia):
+                instante = inicio + timedelta(minutes=20 * turno)
+                lote.append(
+                    (
+                        str(10000000 + paciente % args.pacientes),
+                        f"M{medico}",
+                        instante.strftime("%d/%m/%Y"),
+                        instante.strftime("%H:%M"),
+                        "Clínica",
+                    )
+                )
+                paciente += 1
+        yield lote
+        dia += timedelta(days=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rendimiento de la clínica particionada según la cantidad de procesos"
+    )
+    parser.add_argument(
+        "--particiones", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    parser.add_argument("--pacientes", type=int, default=20000)
+    parser.add_argument("--medicos", type=int, default=64)
+    parser.add_argument("--dias", type=int, default=60)
+    parser.add_argument("--turnos-por-dia", type=int, default=16)
+    args = parser.parse_args()
+
+    solicitudes = list(lotes(args))
+    print(f"{os.cpu_count()} núcleos disponibles")
+    base = None
+    for particiones in [0] + sorted(set(args.particiones)):
+        clinica = Clinica() if particiones == 0 else ClinicaParticionada(particiones)
+        inicio = time.perf_counter()
+        registrar(clinica, args)
+        registro = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for lote in solicitudes:
+            clinica.agendar_turnos_lote(lote)
+        agenda = time.perf_counter() - inicio
+        turnos = clinica.contar_turnos()
+        clinica.cerrar()
+
+        rendimiento = turnos / agenda
+        if base is None:
+            base = rendimiento
+        nombre = "Clinica" if particiones == 0 else f"{particiones} particiones"
+        print(
+            f"{nombre:>14}: registro {registro:.2f} s, {turnos} turnos en lotes "
+            f"{agenda:.2f} s ({rendimiento:,.0f} turnos/s, x{rendimiento / base:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import multiprocessing
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.modelo import Clinica
+from src.distribucion import PublicadorReplica, ReplicaClinica
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+INICIO = datetime(2025, 1, 1, 8, 0)
+
+
+def crear(pacientes: int, medicos: int) -> Clinica:
+    clinica = Clinica()
+    for i in range(pacientes):
+        clinica.registrar_paciente(f"Paciente {i}", str(10000000 + i), "01/01/1980")
+    for i in range(medicos):
+        clinica.registrar_medico(f"Medico {i}", f"M{i}")
+        clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+    return clinica
+
+
+def consultar(fuente, pacientes: int, detener, contador, semilla: int):
+    azar = random.Random(semilla)
+    consultas = 0
+    while not detener.is_set():
+        dni = str(10000000 + azar.randrange(pacientes))
+        fuente.buscar_paciente(dni)
+        fuente.obtener_historia_clinica(dni)
+        consultas += 1
+    with contador.get_lock():
+        contador.value += consultas
+
+
+def consultar_replica(nombre: str, pacientes: int, detener, contador, semilla: int):
+    replica = ReplicaClinica(nombre)
+    consultar(replica, pacientes, detener, contador, semilla)
+    replica.cerrar()
+
+
+def agendar(clinica: Clinica, args, publicador=None) -> float:
+    inicio = time.perf_counter()
+    instante = INICIO
+    for i in range(args.turnos):
+        if i % args.medicos == 0:
+            instante += timedelta(minutes=15)
+        clinica.agendar_turno(
+            str(10000000 + i % args.pacientes),
+            f"M{i % args.medicos}",
+            instante.strftime("%d/%m/%Y"),
+            instante.strftime("%H:%M"),
+            "Clínica",
+        )
+        if publicador is not None and (i + 1) % args.publicar_cada == 0:
+            publicador.publicar()
+    return args.turnos / (time.perf_counter() - inicio)
+
+
+def medir(args, modo: str) -> tuple[float, float]:
+    clinica = crear(args.pacientes, args.medicos)
+    detener = multiprocessing.Event()
+    contador = multiprocessing.Value("q", 0)
+    publicador = None
+    lectores = []
+
+    if modo == "hilos":
+        lectores = [
+            threading.Thread(
+                target=consultar,
+                args=(clinica, args.pacientes, detener, contador, i),
+            )
+            for i in range(args.lectores)
+        ]
+    elif modo == "réplicas":
+        publicador = PublicadorReplica(clinica)
+        publicador.publicar()
+        lectores = [
+            multiprocessing.Process(
+                target=consultar_replica,
+                args=(
+                    publicador.obtener_nombre(),
+                    args.pacientes,
+                    detener,
+                    contador,
+                    i,
+                ),
+            )
+            for i in range(args.lectores)
+        ]
+
+    for lector in lectores:
+        lector.start()
+    inicio = time.perf_counter()
+    rendimiento = agendar(clinica, args, publicador)
+    duracion = time.perf_counter() - inicio
+    detener.set()
+    for lector in lectores:
+        lector.join()
+    if publicador is not None:
+        publicador.cerrar()
+    return rendimiento, contador.value / duracion
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reservas en el proceso primario con lectores en hilos "
+        "o en procesos con réplicas en memoria compartida"
+    )
+    parser.add_argument("--turnos", type=int, default=20000)
+    parser.add_argument("--pacientes", type=int, default=2000)
+    parser.add_argument("--medicos", type=int, default=20)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--publicar-cada", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{multiprocessing.cpu_count()} núcleos, {args.lectores} lectores")
+    for modo in ("sin lectores", "hilos", "réplicas"):
+        reservas, consultas = medir(args, modo)
+        print(
+            f"{modo:>12}: {reservas:>9,.0f} reservas/s en el primario, "
+            f"{consultas:>9,.0f} consultas/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
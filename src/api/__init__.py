@@ -0,0 +1,3 @@
+from .servidor import ServidorClinica
+
+__all__ = ["ServidorClinica"]
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+from ..excepciones import DatosInvalidosException
+
+LIMITE_CUERPO = 1 << 20
+
+RAZONES = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class SolicitudHTTP:
+    __slots__ = ("metodo", "ruta", "consulta", "version", "encabezados", "cuerpo")
+
+    def __init__(
+        self,
+        metodo: str,
+        ruta: str,
+        consulta: dict[str, str],
+        version: str,
+        encabezados: dict[str, str],
+        cuerpo: bytes,
+    ):
+        self.metodo = metodo
+        self.ruta = ruta
+        self.consulta = consulta
+        self.version = version
+        self.encabezados = encabezados
+        self.cuerpo = cuerpo
+
+    def mantener_conexion(self) -> bool:
+        conexion = self.encabezados.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return conexion == "keep-alive"
+        return conexion != "close"
+
+    def json(self) -> dict:
+        try:
+            datos = json.loads(self.cuerpo or b"{}")
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise DatosInvalidosException(f"JSON inválido: {e}")
+        if not isinstance(datos, dict):
+            raise DatosInvalidosException("El cuerpo debe ser un objeto JSON")
+        return datos
+
+
+async def _leer_encabezados(lector: asyncio.StreamReader) -> list[str] | None:
+    try:
+        bloque = await lector.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise DatosInvalidosException("Mensaje HTTP incompleto")
+    except asyncio.LimitOverrunError:
+        raise DatosInvalidosException("Encabezados HTTP demasiado largos")
+    return bloque.decode("latin-1").split("\r\n")[:-2]
+
+
+def _parsear_encabezados(lineas: list[str]) -> dict[str, str]:
+    encabezados = {}
+    for linea in lineas:
+        nombre, separador, valor = linea.partition(":")
+        if not separador:
+            raise DatosInvalidosException(f"Encabezado HTTP inválido: {linea}")
+        encabezados[nombre.strip().lower()] = valor.strip()
+    return encabezados
+
+
+async def _leer_cuerpo(lector: asyncio.StreamReader, encabezados: dict) -> bytes:
+    try:
+        longitud = int(encabezados.get("content-length", "0"))
+    except ValueError:
+        raise DatosInvalidosException("Content-Length inválido")
+    if longitud < 0 or longitud > LIMITE_CUERPO:
+        raise DatosInvalidosException(
+            f"El cuerpo debe ocupar entre 0 y {LIMITE_CUERPO} bytes"
+        )
+    try:
+        return await lector.readexactly(longitud)
+    except asyncio.IncompleteReadError:
+        raise DatosInvalidosException("Mensaje HTTP incompleto")
+
+
+async def leer_solicitud(lector: asyncio.StreamReader) -> SolicitudHTTP | None:
+
+    lineas = await _leer_encabezados(lector)
+    if lineas is None:
+        return None
+
+    partes = lineas[0].split(" ")
+    if len(partes) != 3 or not partes[2].startswith("HTTP/1."):
+        raise DatosInvalidosException(f"Línea de solicitud inválida: {lineas[0]}")
+    metodo, destino, version = partes
+
+    encabezados = _parsear_encabezados(lineas[1:])
+    if "chunked" in encabezados.get("transfer-encoding", "").lower():
+        raise DatosInvalidosException("No se admite Transfer-Encoding: chunked")
+
+    url = urlsplit(destino)
+    return SolicitudHTTP(
+        metodo.upper(),
+        unquote(url.path),
+        dict(parse_qsl(url.query)),
+        version,
+        encabezados,
+        await _leer_cuerpo(lector, encabezados),
+    )
+
+
+async def leer_respuesta(
+    lector: asyncio.StreamReader,
+) -> tuple[int, dict[str, str], bytes] | None:
+
+    lineas = await _leer_encabezados(lector)
+    if lineas is None:
+        return None
+
+    partes = lineas[0].split(" ", 2)
+    if len(partes) < 2 or not partes[1].isdigit():
+        raise DatosInvalidosException(f"Línea de estado inválida: {lineas[0]}")
+    encabezados = _parsear_encabezados(lineas[1:])
+    return int(partes[1]), encabezados, await _leer_cuerpo(lector, encabezados)
+
+
+def formatear_solicitud(
+    metodo: str, ruta: str, datos: dict | None = None, anfitrion: str = "localhost"
+) -> bytes:
+
+    cuerpo = b"" if datos is None else json.dumps(datos).encode("utf-8")
+    ruta = quote(ruta, safe="/?=&")
+    encabezados = f"{metodo} {ruta} HTTP/1.1\r\nHost: {anfitrion}\r\n"
+    if cuerpo:
+        encabezados += "Content-Type: application/json\r\n"
+    encabezados += f"Content-Length: {len(cuerpo)}\r\n\r\n"
+    return encabezados.encode("latin-1") + cuerpo
+
+
+def formatear_respuesta(estado: int, cuerpo: bytes, mantener: bool) -> bytes:
+    encabezados = (
+        f"HTTP/1.1 {estado} {RAZONES.get(estado, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        f"Connection: {'keep-alive' if mantener else 'close'}\r\n\r\n"
+    )
+    return encabezados.encode("latin-1") + cuerpo
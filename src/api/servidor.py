@@ -0,0 +1,657 @@
+import argparse
+import asyncio
+import json
+import re
+import sys
+from datetime import timedelta
+from collections.abc import Callable, Iterable
+from functools import partial
+from ..excepciones import (
+    ClinicaException,
+    DatosInvalidosException,
+    LoteInvalidoException,
+    RepositorioNoDisponibleException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    TurnoNoEncontradoException,
+    TurnoOcupadoException,
+    EstadoTurnoInvalidoException,
+    VersionObsoletaException,
+)
+from ..modelo.clinica import Clinica, ESTADOS_VENCIDOS
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.historia_clinica import HistoriaClinica
+from ..modelo.barrendero import BarrenderoTurnos
+from ..modelo.confirmador import ConfirmadorEscrituras
+from ..distribucion.replica import PublicadorReplica
+from ..persistencia.exportador import (
+    documento_turno,
+    documento_receta,
+    documento_historia,
+)
+from .protocolo import (
+    SolicitudHTTP,
+    leer_solicitud,
+    formatear_respuesta,
+)
+
+LIMITE_ENCABEZADOS = 64 * 1024
+PROFUNDIDAD_CANALIZACION = 64
+
+ESTADOS_ERROR = {
+    PacienteNoEncontradoException: 404,
+    MedicoNoEncontradoException: 404,
+    TurnoNoEncontradoException: 404,
+    TurnoOcupadoException: 409,
+    EstadoTurnoInvalidoException: 409,
+    VersionObsoletaException: 409,
+    RepositorioNoDisponibleException: 503,
+}
+
+RUTAS = [
+    ("GET", r"/pacientes", "_listar_pacientes", False),
+    ("POST", r"/pacientes", "_registrar_paciente", True),
+    ("GET", r"/pacientes/(?P<dni>[^/]+)", "_buscar_paciente", False),
+    ("GET", r"/pacientes/(?P<dni>[^/]+)/historia", "_obtener_historia", False),
+    ("GET", r"/medicos", "_listar_medicos", False),
+    ("POST", r"/medicos", "_registrar_medico", True),
+    ("GET", r"/medicos/(?P<matricula>[^/]+)", "_buscar_medico", False),
+    (
+        "POST",
+        r"/medicos/(?P<matricula>[^/]+)/especialidades",
+        "_agregar_especialidad",
+        True,
+    ),
+    ("GET", r"/medicos/(?P<matricula>[^/]+)/turnos", "_turnos_medico", False),
+    ("GET", r"/especialidades/(?P<especialidad>[^/]+)/medicos", "_medicos", False),
+    ("GET", r"/turnos", "_listar_turnos", False),
+    ("POST", r"/turnos", "_agendar_turno", True),
+    ("POST", r"/turnos/lote", "_agendar_turnos_lote", True),
+    ("GET", r"/turnos/disponibles", "_turnos_disponibles", False),
+    ("GET", r"/turnos/(?P<identificador>\d+)", "_buscar_turno", False),
+    ("POST", r"/turnos/(?P<identificador>\d+)/cancelar", "_cancelar_turno", True),
+    ("POST", r"/turnos/(?P<identificador>\d+)/completar", "_completar_turno", True),
+    ("POST", r"/turnos/(?P<identificador>\d+)/ausente", "_registrar_ausencia", True),
+    ("POST", r"/recetas", "_emitir_receta", True),
+    ("GET", r"/estadisticas", "_estadisticas", False),
+]
+
+
+def documento_paciente(paciente: Paciente) -> dict:
+    return {
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+    }
+
+
+def documento_medico(medico: Medico) -> dict:
+    return {
+        "matricula": medico.obtener_matricula(),
+        "nombre": medico.obtener_nombre(),
+        "especialidades": [
+            {
+                "especialidad": especialidad.obtener_especialidad(),
+                "dias": especialidad.obtener_dias(),
+            }
+            for especialidad in medico.obtener_especialidades()
+        ],
+    }
+
+
+def documento_turno_api(turno: Turno) -> dict:
+    documento = documento_turno(turno)
+    documento["dni"] = turno.obtener_paciente().obtener_dni()
+    documento["version"] = turno.obtener_version()
+    return documento
+
+
+def documento_historia_api(historia: HistoriaClinica) -> dict:
+    documento = documento_historia(historia)
+    documento["version"] = historia.obtener_version()
+    return documento
+
+
+def _campos(datos: dict, *nombres: str) -> list:
+    valores = []
+    for nombre in nombres:
+        valor = datos.get(nombre)
+        if valor is None or valor == "":
+            raise DatosInvalidosException(f"Falta el campo {nombre}")
+        valores.append(valor)
+    return valores
+
+
+def _entero(
+    consulta: dict[str, str], nombre: str, defecto: int | None = None
+) -> int | None:
+    valor = consulta.get(nombre)
+    if valor is None:
+        return defecto
+    try:
+        return int(valor)
+    except ValueError:
+        raise DatosInvalidosException(f"El parámetro {nombre} debe ser un entero")
+
+
+def _version(datos: dict, nombre: str = "version") -> int | None:
+    valor = datos.get(nombre)
+    if valor is not None and (not isinstance(valor, int) or isinstance(valor, bool)):
+        raise DatosInvalidosException(f"El campo {nombre} debe ser un entero")
+    return valor
+
+
+def _descendente(consulta: dict[str, str]) -> bool:
+    return consulta.get("orden", "asc").lower() == "desc"
+
+
+class ServidorClinica:
+
+    def __init__(
+        self,
+        clinica: Clinica,
+        host: str = "127.0.0.1",
+        puerto: int = 8080,
+        tamanio_cola: int = 1024,
+    ):
+        self.__clinica__ = clinica
+        self.__host__ = host
+        self.__puerto__ = puerto
+        self.__cola__ = asyncio.Queue(tamanio_cola)
+        self.__servidor__ = None
+        self.__aplicador__ = None
+        self.__confirmador__ = ConfirmadorEscrituras(clinica)
+        self.__conexiones__ = {}
+        self.__rutas__ = [
+            (metodo, re.compile(patron), getattr(self, manejador), escritura)
+            for metodo, patron, manejador, escritura in RUTAS
+        ]
+
+    async def iniciar(self) -> int:
+        self.__servidor__ = await asyncio.start_server(
+            self._atender, self.__host__, self.__puerto__, limit=LIMITE_ENCABEZADOS
+        )
+        self.__aplicador__ = asyncio.create_task(self._aplicar_escrituras())
+        self.__puerto__ = self.__servidor__.sockets[0].getsockname()[1]
+        return self.__puerto__
+
+    def obtener_puerto(self) -> int:
+        return self.__puerto__
+
+    async def detener(self):
+        self.__servidor__.close()
+        for escritor in self.__conexiones__:
+            escritor.close()
+        await asyncio.gather(*self.__conexiones__.values(), return_exceptions=True)
+        await self.__cola__.put(None)
+        await self.__aplicador__
+        await self.__servidor__.wait_closed()
+
+    async def _atender(
+        self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter
+    ):
+        self.__conexiones__[escritor] = asyncio.current_task()
+        pendientes = asyncio.Queue(PROFUNDIDAD_CANALIZACION)
+        respondedor = asyncio.create_task(self._responder(escritor, pendientes))
+        ultima_escritura = None
+        try:
+            while True:
+                try:
+                    solicitud = await leer_solicitud(lector)
+                except DatosInvalidosException as e:
+                    await pendientes.put((self._resuelta(self._error(e)), False))
+                    break
+                if solicitud is None:
+                    break
+
+                futuro, escritura = await self._despachar(solicitud, ultima_escritura)
+                if escritura:
+                    ultima_escritura = futuro
+                mantener = solicitud.mantener_conexion()
+                await pendientes.put((futuro, mantener))
+                if not mantener:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            await pendientes.put(None)
+            await respondedor
+            self.__conexiones__.pop(escritor, None)
+            escritor.close()
+
+    async def _responder(
+        self, escritor: asyncio.StreamWriter, pendientes: asyncio.Queue
+    ):
+        conectado = True
+        while True:
+            pendiente = await pendientes.get()
+            if pendiente is None:
+                return
+            futuro, mantener = pendiente
+            estado, cuerpo = await futuro
+            if not conectado:
+                continue
+            try:
+                escritor.write(formatear_respuesta(estado, cuerpo, mantener))
+                if pendientes.empty() or not mantener:
+                    await escritor.drain()
+            except ConnectionError:
+                conectado = False
+            conectado = conectado and mantener
+
+    async def _despachar(
+        self, solicitud: SolicitudHTTP, ultima_escritura: asyncio.Future | None
+    ) -> tuple[asyncio.Future, bool]:
+
+        operacion, escritura = self._enrutar(solicitud)
+        if escritura:
+            futuro = asyncio.get_running_loop().create_future()
+            await self.__cola__.put((operacion, futuro))
+            return futuro, True
+        if ultima_escritura is not None and not ultima_escritura.done():
+            lectura = self._leer_despues(ultima_escritura, operacion)
+            return asyncio.ensure_future(lectura), False
+        return self._resuelta(self._ejecutar(operacion)), False
+
+    async def _leer_despues(
+        self, escritura: asyncio.Future, operacion: Callable
+    ) -> tuple[int, bytes]:
+        await asyncio.wait([escritura])
+        return self._ejecutar(operacion)
+
+    async def aplicar(self, operacion: Callable):
+        resultado = asyncio.get_running_loop().create_future()
+
+        def manejador() -> tuple[int, None]:
+            try:
+                resultado.set_result(operacion())
+            except Exception as e:
+                resultado.set_exception(e)
+            return 200, None
+
+        futuro = asyncio.get_running_loop().create_future()
+        await self.__cola__.put((manejador, futuro))
+        _, cuerpo = await futuro
+        if not resultado.done():
+            raise RepositorioNoDisponibleException(json.loads(cuerpo)["error"])
+        return await resultado
+
+    async def _aplicar_escrituras(self):
+        while True:
+            lote = [await self.__cola__.get()]
+            while not self.__cola__.empty():
+                lote.append(self.__cola__.get_nowait())
+            pendientes = [pendiente for pendiente in lote if pendiente is not None]
+
+            try:
+                self.__confirmador__.verificar_disponible()
+            except RepositorioNoDisponibleException as e:
+                respuestas = [(futuro, self._error(e)) for _, futuro in pendientes]
+            else:
+                respuestas = [
+                    (futuro, self._ejecutar(operacion))
+                    for operacion, futuro in pendientes
+                ]
+                if not self.__confirmador__.confirmar():
+                    respuestas = [
+                        (futuro, self._pendiente(respuesta))
+                        for futuro, respuesta in respuestas
+                    ]
+
+            for futuro, respuesta in respuestas:
+                if not futuro.done():
+                    futuro.set_result(respuesta)
+
+            if None in lote:
+                return
+
+    def _pendiente(self, respuesta: tuple[int, bytes]) -> tuple[int, bytes]:
+        estado, cuerpo = respuesta
+        if not 200 <= estado < 300:
+            return respuesta
+        return self._cuerpo(
+            202,
+            {
+                "pendiente": True,
+                "error": "Aplicado pero sin confirmar en el repositorio: "
+                f"{self.__confirmador__.obtener_error()}",
+                "resultado": json.loads(cuerpo),
+            },
+        )
+
+    def _enrutar(self, solicitud: SolicitudHTTP) -> tuple[Callable, bool]:
+
+        ruta_existente = False
+        for metodo, patron, manejador, escritura in self.__rutas__:
+            coincidencia = patron.fullmatch(solicitud.ruta)
+            if coincidencia is None:
+                continue
+            ruta_existente = True
+            if metodo == solicitud.metodo:
+                parametros = coincidencia.groupdict()
+                return partial(manejador, solicitud, **parametros), escritura
+
+        if ruta_existente:
+            return partial(self._rechazar, 405, "Método no permitido"), False
+        mensaje = f"Ruta inexistente: {solicitud.ruta}"
+        return partial(self._rechazar, 404, mensaje), False
+
+    @staticmethod
+    def _rechazar(estado: int, mensaje: str) -> tuple[int, dict]:
+        return estado, {"error": mensaje}
+
+    @staticmethod
+    def _resuelta(respuesta: tuple[int, bytes]) -> asyncio.Future:
+        futuro = asyncio.get_running_loop().create_future()
+        futuro.set_result(respuesta)
+        return futuro
+
+    def _ejecutar(self, operacion: Callable) -> tuple[int, bytes]:
+        try:
+            estado, documento = operacion()
+        except ClinicaException as e:
+            return self._error(e)
+        except Exception as e:
+            return self._cuerpo(500, {"error": f"Error interno: {e}"})
+        return self._cuerpo(estado, documento)
+
+    def _error(self, error: ClinicaException) -> tuple[int, bytes]:
+        documento = {"error": str(error)}
+        if isinstance(error, LoteInvalidoException):
+            documento["errores"] = [
+                {"indice": indice, "error": str(causa)}
+                for indice, causa in error.errores
+            ]
+        return self._cuerpo(ESTADOS_ERROR.get(type(error), 400), documento)
+
+    @staticmethod
+    def _cuerpo(estado: int, documento) -> tuple[int, bytes]:
+        return estado, json.dumps(
+            documento, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def _listar_pacientes(self, solicitud: SolicitudHTTP) -> tuple[int, list]:
+        consulta = solicitud.consulta
+        pacientes = self.__clinica__.iter_pacientes(
+            consulta.get("despues_de"),
+            _entero(consulta, "limite"),
+            _descendente(consulta),
+        )
+        return 200, [documento_paciente(paciente) for paciente in pacientes]
+
+    def _registrar_paciente(self, solicitud: SolicitudHTTP) -> tuple[int, dict]:
+        nombre, dni, fecha_nacimiento = _campos(
+            solicitud.json(), "nombre", "dni", "fecha_nacimiento"
+        )
+        paciente = self.__clinica__.registrar_paciente(nombre, dni, fecha_nacimiento)
+        return 201, documento_paciente(paciente)
+
+    def _buscar_paciente(
+        self, solicitud: SolicitudHTTP, dni: str
+    ) -> tuple[int, dict]:
+        return 200, documento_paciente(self.__clinica__.buscar_paciente(dni))
+
+    def _obtener_historia(
+        self, solicitud: SolicitudHTTP, dni: str
+    ) -> tuple[int, dict]:
+        historia = self.__clinica__.obtener_historia_clinica(dni)
+        return 200, documento_historia_api(historia)
+
+    def _listar_medicos(self, solicitud: SolicitudHTTP) -> tuple[int, list]:
+        consulta = solicitud.consulta
+        medicos = self.__clinica__.iter_medicos(
+            consulta.get("despues_de"),
+            _entero(consulta, "limite"),
+            _descendente(consulta),
+        )
+        return 200, [documento_medico(medico) for medico in medicos]
+
+    def _registrar_medico(self, solicitud: SolicitudHTTP) -> tuple[int, dict]:
+        nombre, matricula = _campos(solicitud.json(), "nombre", "matricula")
+        return 201, documento_medico(
+            self.__clinica__.registrar_medico(nombre, matricula)
+        )
+
+    def _buscar_medico(
+        self, solicitud: SolicitudHTTP, matricula: str
+    ) -> tuple[int, dict]:
+        return 200, documento_medico(self.__clinica__.buscar_medico(matricula))
+
+    def _agregar_especialidad(
+        self, solicitud: SolicitudHTTP, matricula: str
+    ) -> tuple[int, dict]:
+        especialidad, dias = _campos(solicitud.json(), "especialidad", "dias")
+        self.__clinica__.agregar_especialidad_a_medico(matricula, especialidad, dias)
+        return 201, documento_medico(self.__clinica__.buscar_medico(matricula))
+
+    def _turnos_medico(
+        self, solicitud: SolicitudHTTP, matricula: str
+    ) -> tuple[int, list]:
+        desde, hasta = _campos(solicitud.consulta, "desde", "hasta")
+        turnos = self.__clinica__.obtener_turnos_medico(matricula, desde, hasta)
+        return 200, [documento_turno_api(turno) for turno in turnos]
+
+    def _medicos(
+        self, solicitud: SolicitudHTTP, especialidad: str
+    ) -> tuple[int, list]:
+        dia = solicitud.consulta.get("dia")
+        if dia is None:
+            medicos = self.__clinica__.buscar_medicos_por_especialidad(especialidad)
+        else:
+            medicos = self.__clinica__.buscar_medicos_por_especialidad_y_dia(
+                especialidad, dia
+            )
+        return 200, [documento_medico(medico) for medico in medicos]
+
+    def _listar_turnos(self, solicitud: SolicitudHTTP) -> tuple[int, list]:
+        consulta = solicitud.consulta
+        turnos = self.__clinica__.iter_turnos(
+            _entero(consulta, "despues_de"),
+            _entero(consulta, "limite"),
+            _descendente(consulta),
+        )
+        return 200, [documento_turno_api(turno) for turno in turnos]
+
+    def _agendar_turno(self, solicitud: SolicitudHTTP) -> tuple[int, dict]:
+        turno = self.__clinica__.agendar_turno(
+            *_campos(
+                solicitud.json(), "dni", "matricula", "fecha", "hora", "especialidad"
+            )
+        )
+        return 201, documento_turno_api(turno)
+
+    def _agendar_turnos_lote(self, solicitud: SolicitudHTTP) -> tuple[int, list]:
+        (solicitudes,) = _campos(solicitud.json(), "solicitudes")
+        if not isinstance(solicitudes, list):
+            raise DatosInvalidosException("solicitudes debe ser una lista")
+        turnos = self.__clinica__.agendar_turnos_lote(
+            [
+                tuple(
+                    _campos(datos, "dni", "matricula", "fecha", "hora", "especialidad")
+                )
+                if isinstance(datos, dict)
+                else datos
+                for datos in solicitudes
+            ]
+        )
+        return 201, [documento_turno_api(turno) for turno in turnos]
+
+    def _turnos_disponibles(self, solicitud: SolicitudHTTP) -> tuple[int, list]:
+        consulta = solicitud.consulta
+        especialidad, desde, hasta = _campos(
+            consulta, "especialidad", "desde", "hasta"
+        )
+        disponibles = self.__clinica__.buscar_turnos_disponibles(
+            especialidad,
+            desde,
+            hasta,
+            _entero(consulta, "duracion", 30),
+            _entero(consulta, "cantidad", 100),
+            consulta.get("hora_inicio", "08:00"),
+            consulta.get("hora_fin", "18:00"),
+        )
+        return 200, [
+            {"matricula": matricula, "fecha": fecha, "hora": hora}
+            for matricula, fecha, hora in disponibles
+        ]
+
+    def _buscar_turno(
+        self, solicitud: SolicitudHTTP, identificador: str
+    ) -> tuple[int, dict]:
+        turno = self.__clinica__.buscar_turno(int(identificador))
+        return 200, documento_turno_api(turno)
+
+    def _cancelar_turno(
+        self, solicitud: SolicitudHTTP, identificador: str
+    ) -> tuple[int, dict]:
+        turno = self.__clinica__.cancelar_turno(
+            int(identificador), _version(solicitud.json())
+        )
+        return 200, documento_turno_api(turno)
+
+    def _completar_turno(
+        self, solicitud: SolicitudHTTP, identificador: str
+    ) -> tuple[int, dict]:
+        turno = self.__clinica__.completar_turno(
+            int(identificador), _version(solicitud.json())
+        )
+        return 200, documento_turno_api(turno)
+
+    def _registrar_ausencia(
+        self, solicitud: SolicitudHTTP, identificador: str
+    ) -> tuple[int, dict]:
+        turno = self.__clinica__.registrar_ausencia(
+            int(identificador), _version(solicitud.json())
+        )
+        return 200, documento_turno_api(turno)
+
+    def _emitir_receta(self, solicitud: SolicitudHTTP) -> tuple[int, dict]:
+        datos = solicitud.json()
+        receta = self.__clinica__.emitir_receta(
+            *_campos(
+                datos, "dni", "matricula", "fecha", "medicamentos", "indicaciones"
+            ),
+            _version(datos, "version_historia"),
+        )
+        return 201, documento_receta(receta)
+
+    def _estadisticas(self, solicitud: SolicitudHTTP) -> tuple[int, dict]:
+        return 200, {
+            "pacientes": self.__clinica__.contar_pacientes(),
+            "medicos": self.__clinica__.contar_medicos(),
+            "turnos": {
+                estado.value: self.__clinica__.contar_turnos(estado)
+                for estado in EstadoTurno
+            },
+        }
+
+
+async def servir(
+    servidor: ServidorClinica,
+    publicador: PublicadorReplica | None = None,
+    intervalo_replica: float = 1.0,
+    barrendero: BarrenderoTurnos | None = None,
+    intervalo_barrido: float = 60.0,
+):
+    puerto = await servidor.iniciar()
+    print(f"Escuchando en el puerto {puerto}", file=sys.stderr)
+    tareas = []
+    if publicador is not None:
+        tareas.append(
+            asyncio.create_task(publicador.publicar_periodicamente(intervalo_replica))
+        )
+        print(
+            f"Publicando réplicas en {publicador.obtener_nombre()}", file=sys.stderr
+        )
+    if barrendero is not None:
+        tareas.append(
+            asyncio.create_task(
+                barrendero.barrer_periodicamente(intervalo_barrido, servidor.aplicar)
+            )
+        )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for tarea in tareas:
+            tarea.cancel()
+        await servidor.detener()
+
+
+def main(argumentos: Iterable[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Expone la clínica como una API HTTP/JSON"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    origen = parser.add_mutually_exclusive_group()
+    origen.add_argument("--diario", metavar="DIRECTORIO")
+    origen.add_argument("--sqlite", metavar="RUTA")
+    parser.add_argument(
+        "--replica",
+        metavar="NOMBRE",
+        help="Publica instantáneas de solo lectura en memoria compartida",
+    )
+    parser.add_argument(
+        "--intervalo-replica",
+        type=float,
+        default=1.0,
+        help="Segundos entre réplicas; se alarga si publicar detiene al servidor",
+    )
+    parser.add_argument(
+        "--barrer-vencidos",
+        choices=[estado.value for estado in ESTADOS_VENCIDOS],
+        help="Pasa periódicamente los turnos vencidos al estado indicado",
+    )
+    parser.add_argument("--intervalo-barrido", type=float, default=60.0)
+    parser.add_argument(
+        "--tolerancia-barrido",
+        type=int,
+        default=15,
+        metavar="MINUTOS",
+        help="Minutos de espera tras el horario antes de barrer un turno",
+    )
+    args = parser.parse_args(argumentos)
+
+    repositorio = None
+    if args.diario is not None:
+        from ..persistencia.diario import RepositorioDiario
+
+        repositorio = RepositorioDiario(args.diario)
+    elif args.sqlite is not None:
+        from ..persistencia.sqlite import RepositorioSQLite
+
+        repositorio = RepositorioSQLite(args.sqlite)
+
+    clinica = Clinica(repositorio=repositorio)
+    publicador = None
+    if args.replica is not None:
+        publicador = PublicadorReplica(clinica, args.replica)
+    barrendero = None
+    if args.barrer_vencidos is not None:
+        barrendero = BarrenderoTurnos(
+            clinica,
+            args.barrer_vencidos,
+            tolerancia=timedelta(minutes=args.tolerancia_barrido),
+        )
+    try:
+        asyncio.run(
+            servir(
+                ServidorClinica(clinica, args.host, args.puerto),
+                publicador,
+                args.intervalo_replica,
+                barrendero,
+                args.intervalo_barrido,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if publicador is not None:
+            publicador.cerrar()
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from ..modelo import Clinica, Paciente, Medico, Especialidad, Turno, Receta
 from ..excepciones import ClinicaException
 
+TAMANIO_PAGINA = 20
+
 
 class CLI:
 
@@ -47,6 +49,27 @@ class CLI:
             except Exception as e:
                 print(f"\nError inesperado: {str(e)}")
 
+    def mostrar_paginas(self, iterar, clave):
+        cursor = None
+        numero = 0
+        while True:
+            pagina = list(iterar(despues_de=cursor, limite=TAMANIO_PAGINA))
+            for entidad in pagina:
+                numero += 1
+                print(f"{numero}. {entidad}")
+            if len(pagina) < TAMANIO_PAGINA:
+                return
+            cursor = clave(pagina[-1])
+            respuesta = input("Enter para ver más, 'q' para continuar: ")
+            if respuesta.strip().lower() == "q":
+                return
+
+    def mostrar_pacientes(self):
+        self.mostrar_paginas(self.clinica.iter_pacientes, Paciente.obtener_dni)
+
+    def mostrar_medicos(self):
+        self.mostrar_paginas(self.clinica.iter_medicos, Medico.obtener_matricula)
+
     def registrar_paciente(self):
         print("\n" + "-" * 30)
         print("   REGISTRAR PACIENTE")
@@ -82,14 +105,12 @@ class CLI:
         print("   AGREGAR ESPECIALIDAD A MÉDICO")
         print("-" * 40)
         try:
-            medicos = self.clinica.listar_medicos()
-            if not medicos:
+            if not self.clinica.contar_medicos():
                 print("No hay médicos registrados. Registre un médico primero.")
                 return
 
             print("\nMédicos disponibles:")
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}. {medico}")
+            self.mostrar_medicos()
 
             matricula = input("\nMatrícula del médico: ").strip()
             tipo_especialidad = input("Nombre de la especialidad: ").strip()
@@ -118,23 +139,18 @@ class CLI:
         print("   AGENDAR TURNO")
         print("-" * 30)
         try:
-            pacientes = self.clinica.listar_pacientes()
-            medicos = self.clinica.listar_medicos()
-
-            if not pacientes:
+            if not self.clinica.contar_pacientes():
                 print("No hay pacientes registrados. Registre un paciente primero.")
                 return
-            if not medicos:
+            if not self.clinica.contar_medicos():
                 print("No hay médicos registrados. Registre un médico primero.")
                 return
 
             print("\nPacientes disponibles:")
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
+            self.mostrar_pacientes()
 
             print("\nMédicos disponibles:")
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}. {medico}")
+            self.mostrar_medicos()
 
             dni_paciente = input("\nDNI del paciente: ").strip()
             matricula_medico = input("Matrícula del médico: ").strip()
@@ -166,23 +182,18 @@ class CLI:
         print("   EMITIR RECETA")
         print("-" * 30)
         try:
-            pacientes = self.clinica.listar_pacientes()
-            medicos = self.clinica.listar_medicos()
-
-            if not pacientes:
+            if not self.clinica.contar_pacientes():
                 print("No hay pacientes registrados.")
                 return
-            if not medicos:
+            if not self.clinica.contar_medicos():
                 print("No hay médicos registrados.")
                 return
 
             print("\nPacientes disponibles:")
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
+            self.mostrar_pacientes()
 
             print("\nMédicos disponibles:")
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}. {medico}")
+            self.mostrar_medicos()
 
             dni_paciente = input("\nDNI del paciente: ").strip()
             matricula_medico = input("Matrícula del médico: ").strip()
@@ -209,14 +220,12 @@ class CLI:
         print("   VER HISTORIA CLÍNICA")
         print("-" * 35)
         try:
-            pacientes = self.clinica.listar_pacientes()
-            if not pacientes:
+            if not self.clinica.contar_pacientes():
                 print("No hay pacientes registrados.")
                 return
 
             print("\nPacientes disponibles:")
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
+            self.mostrar_pacientes()
 
             dni_paciente = input("\nDNI del paciente: ").strip()
 
@@ -225,22 +234,20 @@ class CLI:
             print(f"\n{historia}")
             print("\n" + "=" * 60)
 
-            turnos = historia.obtener_turnos()
-            if turnos:
+            if historia.contar_turnos():
                 print("TURNOS:")
                 print("-" * 60)
-                for i, turno in enumerate(turnos, 1):
+                for i, turno in enumerate(historia.iter_turnos(), 1):
                     print(f"{i}. {turno}")
             else:
                 print("No hay turnos registrados")
 
             print("\n" + "=" * 60)
 
-            recetas = historia.obtener_recetas()
-            if recetas:
+            if historia.contar_recetas():
                 print("RECETAS:")
                 print("-" * 60)
-                for i, receta in enumerate(recetas, 1):
+                for i, receta in enumerate(historia.iter_recetas(), 1):
                     print(f"{i}. {receta}")
                     print(
                         f"    Medicamentos: {', '.join(receta.obtener_medicamentos())}"
@@ -258,15 +265,14 @@ class CLI:
         print("   LISTAR PACIENTES")
         print("-" * 30)
         try:
-            pacientes = self.clinica.listar_pacientes()
-            if not pacientes:
+            total = self.clinica.contar_pacientes()
+            if not total:
                 print("No hay pacientes registrados")
                 return
 
-            print(f"\nTotal de pacientes: {len(pacientes)}")
+            print(f"\nTotal de pacientes: {total}")
             print("-" * 50)
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
+            self.mostrar_pacientes()
         except Exception as e:
             print(f"Error al listar pacientes: {str(e)}")
 
@@ -275,14 +281,13 @@ class CLI:
         print("   LISTAR MÉDICOS")
         print("-" * 30)
         try:
-            medicos = self.clinica.listar_medicos()
-            if not medicos:
+            total = self.clinica.contar_medicos()
+            if not total:
                 print(" No hay médicos registrados")
                 return
 
-            print(f"\nTotal de médicos: {len(medicos)}")
+            print(f"\nTotal de médicos: {total}")
             print("-" * 50)
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}. {medico}")
+            self.mostrar_medicos()
         except Exception as e:
             print(f"Error al listar médicos: {str(e)}")
\ No newline at end of file
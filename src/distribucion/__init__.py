@@ -0,0 +1,11 @@
+from .particion import Particion, particion_de
+from .clinica_particionada import ClinicaParticionada
+from .replica import PublicadorReplica, ReplicaClinica
+
+__all__ = [
+    "Particion",
+    "particion_de",
+    "ClinicaParticionada",
+    "PublicadorReplica",
+    "ReplicaClinica",
+]
@@ -0,0 +1,529 @@
+import heapq
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from itertools import chain, count, islice
+from operator import itemgetter, methodcaller
+from ..excepciones import (
+    DatosInvalidosException,
+    LoteInvalidoException,
+    MedicoNoEncontradoException,
+    TurnoNoEncontradoException,
+)
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from ..modelo.historia_clinica import HistoriaClinica
+from ..modelo.fechas import parsear_fecha
+from ..modelo.cerrojos import CerrojosRayados
+from .particion import atender, particion_de
+
+TAMANIO_BLOQUE_HISTORIAS = 256
+
+
+class ClinicaParticionada:
+
+    def __init__(self, particiones: int | None = None, contexto: str | None = None):
+        if particiones is None:
+            particiones = os.cpu_count() or 1
+        if not isinstance(particiones, int) or particiones <= 0:
+            raise DatosInvalidosException(
+                "La cantidad de particiones debe ser un entero positivo"
+            )
+
+        self.__particiones__ = particiones
+        self.__transacciones__ = count()
+        self.__cerrojo__ = threading.Lock()
+        self.__cerrojos__ = CerrojosRayados(particiones)
+        self.__conexiones__ = []
+        self.__procesos__ = []
+
+        procesos = multiprocessing.get_context(contexto)
+        for indice in range(particiones):
+            local, remota = procesos.Pipe()
+            proceso = procesos.Process(
+                target=atender, args=(remota, indice, particiones), daemon=True
+            )
+            proceso.start()
+            remota.close()
+            self.__conexiones__.append(local)
+            self.__procesos__.append(proceso)
+
+    def obtener_particiones(self) -> int:
+        return self.__particiones__
+
+    def _particion(self, clave: str) -> int:
+        return particion_de(clave, self.__particiones__)
+
+    def _llamar(self, indice: int, metodo: str, *argumentos):
+        return self._difundir(metodo, {indice: argumentos})[indice]
+
+    def _difundir(
+        self, metodo: str, argumentos: dict[int, tuple] | None = None
+    ) -> dict:
+
+        if argumentos is None:
+            argumentos = dict.fromkeys(range(self.__particiones__), ())
+
+        with self.__cerrojos__.bloquear(list(argumentos)):
+            if not self.__conexiones__:
+                raise DatosInvalidosException("La clínica particionada está cerrada")
+            for indice, valores in argumentos.items():
+                self.__conexiones__[indice].send((metodo, valores))
+            respuestas = {
+                indice: self.__conexiones__[indice].recv() for indice in argumentos
+            }
+
+        for exito, resultado in respuestas.values():
+            if not exito:
+                raise resultado
+        return {indice: resultado for indice, (_, resultado) in respuestas.items()}
+
+    def registrar_paciente(
+        self, nombre: str, dni: str, fecha_nacimiento: str
+    ) -> Paciente:
+        return self._llamar(
+            self._particion(dni), "registrar_paciente", nombre, dni, fecha_nacimiento
+        )
+
+    def registrar_medico(self, nombre: str, matricula: str) -> Medico:
+        return self._llamar(
+            self._particion(matricula), "registrar_medico", nombre, matricula
+        )
+
+    def agregar_especialidad_a_medico(
+        self, matricula: str, tipo_especialidad: str, dias: list[str]
+    ) -> Especialidad:
+        return self._llamar(
+            self._particion(matricula),
+            "agregar_especialidad_a_medico",
+            matricula,
+            tipo_especialidad,
+            dias,
+        )
+
+    def buscar_medicos_por_especialidad(self, especialidad: str) -> list[Medico]:
+        return self._reunir(
+            self._difundir(
+                "buscar_medicos_por_especialidad",
+                dict.fromkeys(range(self.__particiones__), (especialidad,)),
+            )
+        )
+
+    def buscar_medicos_por_especialidad_y_dia(
+        self, especialidad: str, dia: str
+    ) -> list[Medico]:
+        return self._reunir(
+            self._difundir(
+                "buscar_medicos_por_especialidad_y_dia",
+                dict.fromkeys(range(self.__particiones__), (especialidad, dia)),
+            )
+        )
+
+    @staticmethod
+    def _reunir(resultados: dict[int, list]) -> list:
+        return list(chain.from_iterable(resultados[i] for i in sorted(resultados)))
+
+    def agendar_turno(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        hora: str,
+        especialidad: str,
+    ) -> Turno:
+
+        try:
+            (turno,) = self.agendar_turnos_lote(
+                [(dni_paciente, matricula_medico, fecha, hora, especialidad)]
+            )
+        except LoteInvalidoException as e:
+            raise e.errores[0][1]
+        return turno
+
+    def agendar_turnos_lote(
+        self, solicitudes: Iterable[tuple[str, str, str, str, str]]
+    ) -> list[Turno]:
+
+        errores = []
+        por_medico = {}
+        origenes = {}
+        remotos = {}
+        for indice, solicitud in enumerate(solicitudes):
+            try:
+                dni_paciente, matricula_medico, _, _, _ = solicitud
+            except (TypeError, ValueError):
+                errores.append(
+                    (
+                        indice,
+                        DatosInvalidosException(
+                            "Cada solicitud debe ser "
+                            "(dni, matrícula, fecha, hora, especialidad)"
+                        ),
+                    )
+                )
+                continue
+
+            destino = self._particion(matricula_medico)
+            por_medico.setdefault(destino, []).append((indice, tuple(solicitud)))
+            origen = origenes[indice] = self._particion(dni_paciente)
+            if origen != destino:
+                remotos.setdefault(origen, {}).setdefault(dni_paciente, set()).add(
+                    destino
+                )
+
+        involucradas = set(por_medico).union(remotos)
+        with self.__cerrojo__ if len(involucradas) > 1 else nullcontext():
+            replicas = {destino: [] for destino in por_medico}
+            if remotos:
+                encontrados = self._difundir(
+                    "buscar_pacientes",
+                    {origen: (list(dnis),) for origen, dnis in remotos.items()},
+                )
+                for origen, pacientes in encontrados.items():
+                    for paciente in pacientes:
+                        for destino in remotos[origen][paciente.obtener_dni()]:
+                            replicas[destino].append(paciente)
+
+            transaccion = next(self.__transacciones__)
+            try:
+                rechazos = self._difundir(
+                    "preparar_turnos",
+                    {
+                        destino: (transaccion, pendientes, replicas[destino])
+                        for destino, pendientes in por_medico.items()
+                    },
+                )
+            except Exception:
+                self._difundir(
+                    "abortar_turnos", {destino: (transaccion,) for destino in por_medico}
+                )
+                raise
+            for rechazados in rechazos.values():
+                errores.extend(rechazados)
+
+            if errores:
+                self._difundir(
+                    "abortar_turnos",
+                    {
+                        destino: (transaccion,)
+                        for destino, rechazados in rechazos.items()
+                        if not rechazados
+                    },
+                )
+                errores.sort(key=itemgetter(0))
+                raise LoteInvalidoException(
+                    f"Se rechazó el lote: {len(errores)} solicitudes inválidas", errores
+                )
+
+            confirmados = self._difundir(
+                "confirmar_turnos",
+                {destino: (transaccion,) for destino in por_medico},
+            )
+
+            turnos = [None] * sum(len(pendientes) for pendientes in por_medico.values())
+            copias = {}
+            for destino, agendados in confirmados.items():
+                for (indice, _), turno in zip(por_medico[destino], agendados):
+                    turnos[indice] = turno
+                    origen = origenes[indice]
+                    if origen != destino:
+                        copias.setdefault(origen, []).append(turno)
+
+            if copias:
+                self._difundir(
+                    "registrar_copias",
+                    {origen: (agendados,) for origen, agendados in copias.items()},
+                )
+
+        return turnos
+
+    def _ubicar_turno(self, identificador: int) -> tuple[int, int]:
+        if not isinstance(identificador, int) or identificador < 0:
+            raise TurnoNoEncontradoException(
+                f"No existe un turno con identificador {identificador}"
+            )
+        return divmod(identificador, self.__particiones__)[::-1]
+
+    def buscar_turno(self, identificador: int) -> Turno:
+        indice, local = self._ubicar_turno(identificador)
+        try:
+            return self._llamar(indice, "buscar_turno", local)
+        except TurnoNoEncontradoException:
+            raise TurnoNoEncontradoException(
+                f"No existe un turno con identificador {identificador}"
+            )
+
+    def completar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._cambiar_estado_turno(identificador, version, "completar_turno")
+
+    def cancelar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._cambiar_estado_turno(identificador, version, "cancelar_turno")
+
+    def registrar_ausencia(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return self._cambiar_estado_turno(identificador, version, "registrar_ausencia")
+
+    def _cambiar_estado_turno(
+        self, identificador: int, version: int | None, metodo: str
+    ) -> Turno:
+
+        indice, local = self._ubicar_turno(identificador)
+        try:
+            turno = self._llamar(indice, metodo, local, version)
+        except TurnoNoEncontradoException:
+            raise TurnoNoEncontradoException(
+                f"No existe un turno con identificador {identificador}"
+            )
+        origen = self._particion(turno.obtener_paciente().obtener_dni())
+        if origen != indice:
+            self._llamar(
+                origen, "actualizar_copia", identificador, turno.obtener_estado_turno()
+            )
+        return turno
+
+    def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        return self._sumar("contar_turnos", estado)
+
+    def contar_turnos_medico(
+        self, matricula: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self._llamar(
+            self._particion(matricula), "contar_turnos_medico", matricula, estado
+        )
+
+    def contar_turnos_dia(
+        self, fecha: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self._sumar("contar_turnos_dia", fecha, estado)
+
+    def _sumar(self, metodo: str, *argumentos) -> int:
+        return sum(
+            self._difundir(
+                metodo, dict.fromkeys(range(self.__particiones__), argumentos)
+            ).values()
+        )
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> Iterator[Turno]:
+        return iter(
+            self._llamar(
+                self._particion(matricula),
+                "obtener_turnos_medico",
+                matricula,
+                desde,
+                hasta,
+            )
+        )
+
+    def buscar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: str,
+        hasta: str,
+        duracion: int,
+        cantidad: int | None = None,
+        hora_inicio: str = "08:00",
+        hora_fin: str = "18:00",
+    ) -> Iterator[tuple[str, str, str]]:
+
+        argumentos = (
+            especialidad,
+            desde,
+            hasta,
+            duracion,
+            cantidad,
+            hora_inicio,
+            hora_fin,
+        )
+        disponibles = self._difundir(
+            "buscar_turnos_disponibles",
+            dict.fromkeys(range(self.__particiones__), argumentos),
+        )
+        return islice(
+            heapq.merge(
+                *(disponibles[i] for i in sorted(disponibles)),
+                key=lambda hueco: (parsear_fecha(hueco[1]), hueco[2], hueco[0]),
+            ),
+            cantidad,
+        )
+
+    def emitir_receta(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        medicamentos: list[str],
+        indicaciones: str,
+        version_historia: int | None = None,
+    ) -> Receta:
+
+        origen = self._particion(dni_paciente)
+        destino = self._particion(matricula_medico)
+        medico = None
+        if origen != destino:
+            try:
+                medico = self._llamar(destino, "buscar_medico", matricula_medico)
+            except MedicoNoEncontradoException:
+                medico = None
+        return self._llamar(
+            origen,
+            "emitir_receta",
+            dni_paciente,
+            matricula_medico,
+            fecha,
+            medicamentos,
+            indicaciones,
+            medico,
+            version_historia,
+        )
+
+    def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        return self._llamar(
+            self._particion(dni_paciente), "obtener_historia_clinica", dni_paciente
+        )
+
+    def iter_historias_clinicas(
+        self, dnis: Iterable[str] | None = None
+    ) -> Iterator[HistoriaClinica]:
+
+        if dnis is None:
+            dnis = (paciente.obtener_dni() for paciente in self.iter_pacientes())
+        dnis = iter(dnis)
+        return chain.from_iterable(
+            self._obtener_historias(bloque)
+            for bloque in iter(
+                lambda: list(islice(dnis, TAMANIO_BLOQUE_HISTORIAS)), []
+            )
+        )
+
+    def _obtener_historias(self, dnis: list[str]) -> list[HistoriaClinica]:
+
+        por_particion = {}
+        for dni in dnis:
+            por_particion.setdefault(self._particion(dni), []).append(dni)
+
+        historias = {
+            historia.obtener_paciente().obtener_dni(): historia
+            for grupo in self._difundir(
+                "obtener_historias_clinicas",
+                {indice: (grupo,) for indice, grupo in por_particion.items()},
+            ).values()
+            for historia in grupo
+        }
+        return [historias[dni] for dni in dnis]
+
+    def obtener_estadisticas_historias(self) -> dict[str, int]:
+        estadisticas = {}
+        for parcial in self._difundir("obtener_estadisticas_historias").values():
+            for clave, valor in parcial.items():
+                estadisticas[clave] = estadisticas.get(clave, 0) + valor
+        return estadisticas
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return self._reunir(self._difundir("listar_pacientes"))
+
+    def listar_medicos(self) -> list[Medico]:
+        return self._reunir(self._difundir("listar_medicos"))
+
+    def buscar_paciente(self, dni: str) -> Paciente:
+        return self._llamar(self._particion(dni), "buscar_paciente", dni)
+
+    def buscar_medico(self, matricula: str) -> Medico:
+        return self._llamar(self._particion(matricula), "buscar_medico", matricula)
+
+    def contar_pacientes(self) -> int:
+        return self._sumar("contar_pacientes")
+
+    def contar_medicos(self) -> int:
+        return self._sumar("contar_medicos")
+
+    def iter_pacientes(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Paciente]:
+        return self._combinar(
+            "iter_pacientes",
+            (despues_de, limite, descendente),
+            methodcaller("obtener_dni"),
+            limite,
+            descendente,
+        )
+
+    def iter_medicos(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Medico]:
+        return self._combinar(
+            "iter_medicos",
+            (despues_de, limite, descendente),
+            methodcaller("obtener_matricula"),
+            limite,
+            descendente,
+        )
+
+    def iter_turnos(
+        self,
+        despues_de: int | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Turno]:
+
+        if despues_de is not None and not isinstance(despues_de, int):
+            raise DatosInvalidosException("El cursor de turnos debe ser un entero")
+
+        argumentos = {}
+        for indice in range(self.__particiones__):
+            cursor = None
+            if despues_de is not None:
+                cursor = (
+                    -((indice - despues_de) // self.__particiones__)
+                    if descendente
+                    else (despues_de - indice) // self.__particiones__
+                )
+            argumentos[indice] = (cursor, limite, descendente)
+        return self._combinar(
+            "iter_turnos", argumentos, methodcaller("obtener_id"), limite, descendente
+        )
+
+    def _combinar(
+        self,
+        metodo: str,
+        argumentos: tuple | dict[int, tuple],
+        clave,
+        limite: int | None,
+        descendente: bool,
+    ) -> Iterator:
+
+        if isinstance(argumentos, tuple):
+            argumentos = dict.fromkeys(range(self.__particiones__), argumentos)
+        paginas = self._difundir(metodo, argumentos)
+        return islice(
+            heapq.merge(
+                *(paginas[i] for i in sorted(paginas)), key=clave, reverse=descendente
+            ),
+            limite,
+        )
+
+    def confirmar(self):
+        pass
+
+    def cerrar(self):
+        with self.__cerrojo__, self.__cerrojos__.bloquear(range(self.__particiones__)):
+            for conexion in self.__conexiones__:
+                conexion.send(None)
+                conexion.close()
+            for proceso in self.__procesos__:
+                proceso.join()
+            self.__conexiones__ = []
+            self.__procesos__ = []
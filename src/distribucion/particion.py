@@ -0,0 +1,362 @@
+import zlib
+from collections.abc import Iterable
+from itertools import islice
+from multiprocessing.connection import Connection
+from ..excepciones import (
+    LoteInvalidoException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+)
+from ..modelo.clinica import Clinica
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from ..modelo.historia_clinica import HistoriaClinica
+
+
+def particion_de(clave: str, particiones: int) -> int:
+    return zlib.crc32(str(clave).encode("utf-8")) % particiones
+
+
+class Particion:
+
+    def __init__(self, indice: int, particiones: int):
+        self.__indice__ = indice
+        self.__particiones__ = particiones
+        self.__clinica__ = Clinica()
+        self.__pacientes_propios__ = 0
+        self.__medicos_propios__ = 0
+        self.__copias__ = {}
+        self.__estados_copias__ = {}
+        self.__reservas__ = {}
+        self.__reservados__ = set()
+
+    def _es_propio(self, clave: str) -> bool:
+        return particion_de(clave, self.__particiones__) == self.__indice__
+
+    def _id_global(self, identificador: int) -> int:
+        return identificador * self.__particiones__ + self.__indice__
+
+    def _exportar_turno(self, turno: Turno) -> Turno:
+        if not self._es_propio(turno.obtener_medico().obtener_matricula()):
+            return turno
+        return Turno.reconstruir(
+            turno.obtener_paciente(),
+            turno.obtener_medico(),
+            turno.obtener_fecha_hora(),
+            turno.obtener_especialidad(),
+            turno.obtener_estado_turno(),
+            self._id_global(turno.obtener_id()),
+            turno.obtener_version(),
+        )
+
+    def _replicar_paciente(self, paciente: Paciente) -> Paciente:
+        try:
+            return self.__clinica__.buscar_paciente(paciente.obtener_dni())
+        except PacienteNoEncontradoException:
+            return self.__clinica__.registrar_paciente(
+                paciente.obtener_nombre(),
+                paciente.obtener_dni(),
+                paciente.obtener_fecha_nacimiento(),
+            )
+
+    def _replicar_medico(self, medico: Medico) -> Medico:
+        try:
+            return self.__clinica__.buscar_medico(medico.obtener_matricula())
+        except MedicoNoEncontradoException:
+            return self.__clinica__.registrar_medico(
+                medico.obtener_nombre(), medico.obtener_matricula()
+            )
+
+    def registrar_paciente(
+        self, nombre: str, dni: str, fecha_nacimiento: str
+    ) -> Paciente:
+        paciente = self.__clinica__.registrar_paciente(nombre, dni, fecha_nacimiento)
+        self.__pacientes_propios__ += 1
+        return paciente
+
+    def registrar_medico(self, nombre: str, matricula: str) -> Medico:
+        medico = self.__clinica__.registrar_medico(nombre, matricula)
+        self.__medicos_propios__ += 1
+        return medico
+
+    def agregar_especialidad_a_medico(
+        self, matricula: str, tipo_especialidad: str, dias: list[str]
+    ) -> Especialidad:
+        return self.__clinica__.agregar_especialidad_a_medico(
+            matricula, tipo_especialidad, dias
+        )
+
+    def buscar_medicos_por_especialidad(self, especialidad: str) -> list[Medico]:
+        return self.__clinica__.buscar_medicos_por_especialidad(especialidad)
+
+    def buscar_medicos_por_especialidad_y_dia(
+        self, especialidad: str, dia: str
+    ) -> list[Medico]:
+        return self.__clinica__.buscar_medicos_por_especialidad_y_dia(especialidad, dia)
+
+    def buscar_paciente(self, dni: str) -> Paciente:
+        return self.__clinica__.buscar_paciente(dni)
+
+    def buscar_medico(self, matricula: str) -> Medico:
+        return self.__clinica__.buscar_medico(matricula)
+
+    def buscar_pacientes(self, dnis: Iterable[str]) -> list[Paciente]:
+        pacientes = []
+        for dni in dnis:
+            try:
+                pacientes.append(self.__clinica__.buscar_paciente(dni))
+            except PacienteNoEncontradoException:
+                continue
+        return pacientes
+
+    def preparar_turnos(
+        self,
+        transaccion: int,
+        solicitudes: list[tuple[int, tuple[str, str, str, str, str]]],
+        pacientes: list[Paciente],
+    ) -> list[tuple[int, Exception]]:
+
+        for paciente in pacientes:
+            self._replicar_paciente(paciente)
+
+        try:
+            turnos = self.__clinica__.validar_turnos_lote(
+                [solicitud for _, solicitud in solicitudes], self.__reservados__
+            )
+        except LoteInvalidoException as e:
+            return [(solicitudes[posicion][0], error) for posicion, error in e.errores]
+
+        claves = [
+            (turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+            for turno in turnos
+        ]
+        self.__reservados__.update(claves)
+        self.__reservas__[transaccion] = (turnos, claves)
+        return []
+
+    def confirmar_turnos(self, transaccion: int) -> list[Turno]:
+        turnos, claves = self.__reservas__.pop(transaccion)
+        self.__reservados__.difference_update(claves)
+        self.__clinica__._registrar_turnos(turnos)
+        return [self._exportar_turno(turno) for turno in turnos]
+
+    def abortar_turnos(self, transaccion: int):
+        reserva = self.__reservas__.pop(transaccion, None)
+        if reserva is not None:
+            self.__reservados__.difference_update(reserva[1])
+
+    def registrar_copias(self, turnos: list[Turno]):
+
+        por_paciente = {}
+        for turno in turnos:
+            dni = turno.obtener_paciente().obtener_dni()
+            copia = Turno.reconstruir(
+                self.__clinica__.buscar_paciente(dni),
+                self._replicar_medico(turno.obtener_medico()),
+                turno.obtener_fecha_hora(),
+                turno.obtener_especialidad(),
+                turno.obtener_estado_turno(),
+                turno.obtener_id(),
+                turno.obtener_version(),
+            )
+            estado = self.__estados_copias__.pop(copia.obtener_id(), None)
+            if estado is not None:
+                self._aplicar_estado_copia(copia, estado)
+            self.__copias__[copia.obtener_id()] = copia
+            por_paciente.setdefault(dni, []).append(copia)
+
+        for dni, copias in por_paciente.items():
+            self.__clinica__.obtener_historia_clinica(dni).agregar_turnos(copias)
+
+    def actualizar_copia(self, identificador: int, estado: EstadoTurno):
+        copia = self.__copias__.get(identificador)
+        if copia is None:
+            self.__estados_copias__[identificador] = estado
+            return
+        self._aplicar_estado_copia(copia, estado)
+
+    @staticmethod
+    def _aplicar_estado_copia(copia: Turno, estado: EstadoTurno):
+        if estado is EstadoTurno.COMPLETADO:
+            copia.marcar_completado()
+        elif estado is EstadoTurno.CANCELADO:
+            copia.marcar_cancelado()
+        elif estado is EstadoTurno.AUSENTE:
+            copia.marcar_ausente()
+
+    def buscar_turno(self, identificador: int) -> Turno:
+        return self._exportar_turno(self.__clinica__.buscar_turno(identificador))
+
+    def completar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._exportar_turno(
+            self.__clinica__.completar_turno(identificador, version)
+        )
+
+    def cancelar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._exportar_turno(
+            self.__clinica__.cancelar_turno(identificador, version)
+        )
+
+    def registrar_ausencia(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return self._exportar_turno(
+            self.__clinica__.registrar_ausencia(identificador, version)
+        )
+
+    def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        return self.__clinica__.contar_turnos(estado)
+
+    def contar_turnos_medico(
+        self, matricula: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self.__clinica__.contar_turnos_medico(matricula, estado)
+
+    def contar_turnos_dia(
+        self, fecha: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self.__clinica__.contar_turnos_dia(fecha, estado)
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> list[Turno]:
+        return [
+            self._exportar_turno(turno)
+            for turno in self.__clinica__.obtener_turnos_medico(matricula, desde, hasta)
+        ]
+
+    def buscar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: str,
+        hasta: str,
+        duracion: int,
+        cantidad: int | None = None,
+        hora_inicio: str = "08:00",
+        hora_fin: str = "18:00",
+    ) -> list[tuple[str, str, str]]:
+        return list(
+            self.__clinica__.buscar_turnos_disponibles(
+                especialidad, desde, hasta, duracion, cantidad, hora_inicio, hora_fin
+            )
+        )
+
+    def emitir_receta(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        medicamentos: list[str],
+        indicaciones: str,
+        medico: Medico | None = None,
+        version_historia: int | None = None,
+    ) -> Receta:
+
+        if medico is not None:
+            self._replicar_medico(medico)
+        return self.__clinica__.emitir_receta(
+            dni_paciente,
+            matricula_medico,
+            fecha,
+            medicamentos,
+            indicaciones,
+            version_historia,
+        )
+
+    def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        historia = self.__clinica__.obtener_historia_clinica(dni_paciente)
+        return HistoriaClinica.reconstruir(
+            historia.obtener_paciente(),
+            [self._exportar_turno(turno) for turno in historia.iter_turnos()],
+            historia.obtener_recetas(),
+        )
+
+    def obtener_historias_clinicas(
+        self, dnis: Iterable[str]
+    ) -> list[HistoriaClinica]:
+        return [self.obtener_historia_clinica(dni) for dni in dnis]
+
+    def obtener_estadisticas_historias(self) -> dict[str, int]:
+        return self.__clinica__.obtener_estadisticas_historias()
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return [
+            paciente
+            for paciente in self.__clinica__.listar_pacientes()
+            if self._es_propio(paciente.obtener_dni())
+        ]
+
+    def listar_medicos(self) -> list[Medico]:
+        return [
+            medico
+            for medico in self.__clinica__.listar_medicos()
+            if self._es_propio(medico.obtener_matricula())
+        ]
+
+    def contar_pacientes(self) -> int:
+        return self.__pacientes_propios__
+
+    def contar_medicos(self) -> int:
+        return self.__medicos_propios__
+
+    def iter_pacientes(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Paciente]:
+        pacientes = self.__clinica__.iter_pacientes(despues_de, None, descendente)
+        return list(
+            islice(
+                (p for p in pacientes if self._es_propio(p.obtener_dni())), limite
+            )
+        )
+
+    def iter_medicos(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Medico]:
+        medicos = self.__clinica__.iter_medicos(despues_de, None, descendente)
+        return list(
+            islice(
+                (m for m in medicos if self._es_propio(m.obtener_matricula())), limite
+            )
+        )
+
+    def iter_turnos(
+        self,
+        despues_de: int | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Turno]:
+        return [
+            self._exportar_turno(turno)
+            for turno in self.__clinica__.iter_turnos(despues_de, limite, descendente)
+        ]
+
+
+def atender(conexion: Connection, indice: int, particiones: int):
+
+    particion = Particion(indice, particiones)
+    while True:
+        try:
+            mensaje = conexion.recv()
+        except EOFError:
+            return
+        if mensaje is None:
+            conexion.close()
+            return
+
+        metodo, argumentos = mensaje
+        try:
+            if metodo.startswith("_"):
+                raise AttributeError(metodo)
+            respuesta = (True, getattr(particion, metodo)(*argumentos))
+        except Exception as e:
+            respuesta = (False, e)
+        conexion.send(respuesta)
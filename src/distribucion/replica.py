@@ -0,0 +1,309 @@
+import asyncio
+import os
+import struct
+import sys
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterator
+from multiprocessing import resource_tracker, shared_memory
+
+from ..excepciones import ClinicaException, DatosInvalidosException
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.historia_clinica import HistoriaClinica
+from ..persistencia.binario import InstantaneaBinaria, volcar_instantanea_binaria
+
+CONTROL = struct.Struct("<Q64s")
+GENERACION = struct.Struct("<Q")
+FACTOR_PAUSA = 10
+INTENTOS_LECTURA = 1000
+PAUSA_LECTURA = 0.001
+
+
+def _adjuntar(nombre: str) -> tuple[memoryview, Callable[[], None]]:
+    memoria = shared_memory.SharedMemory(nombre, create=False)
+    if os.name == "posix":
+        resource_tracker.unregister(f"/{nombre}", "shared_memory")
+    return memoria.buf, memoria.close
+
+
+def _volcar_en_segmento(clinica, nombre: str) -> shared_memory.SharedMemory:
+    datos = volcar_instantanea_binaria(clinica)
+    segmento = shared_memory.SharedMemory(nombre, create=True, size=len(datos))
+    segmento.buf[: len(datos)] = datos
+    return segmento
+
+
+class PublicadorReplica:
+
+    def __init__(self, clinica, nombre: str | None = None, conservar: int = 2):
+        if not isinstance(conservar, int) or conservar <= 0:
+            raise DatosInvalidosException(
+                "La cantidad de instantáneas a conservar debe ser positiva"
+            )
+
+        self.__clinica__ = clinica
+        self.__conservar__ = conservar
+        self.__control__ = shared_memory.SharedMemory(
+            nombre, create=True, size=CONTROL.size
+        )
+        self.__control__.buf[: CONTROL.size] = bytes(CONTROL.size)
+        self.__nombre__ = self.__control__.name
+        self.__segmentos__ = deque()
+        self.__generacion__ = 0
+        self.__ultima_pausa__ = 0.0
+        self.__pendiente__ = None
+
+    def obtener_nombre(self) -> str:
+        return self.__nombre__
+
+    def obtener_generacion(self) -> int:
+        return self.__generacion__
+
+    def obtener_ultima_pausa(self) -> float:
+        return self.__ultima_pausa__
+
+    def _nombre_segmento(self, generacion: int) -> str:
+        return f"{self.__nombre__}_{generacion}"
+
+    def publicar(self) -> int:
+        inicio = time.perf_counter()
+        generacion = self.__generacion__ + 1
+        segmento = _volcar_en_segmento(
+            self.__clinica__, self._nombre_segmento(generacion)
+        )
+        self._instalar(segmento, generacion)
+        self.__ultima_pausa__ = time.perf_counter() - inicio
+        return generacion
+
+    async def publicar_en_segundo_plano(self) -> int:
+
+        if not hasattr(os, "fork"):
+            return self.publicar()
+
+        inicio = time.perf_counter()
+        generacion = self.__generacion__ + 1
+        nombre = self._nombre_segmento(generacion)
+        lectura, escritura = os.pipe()
+        self.__pendiente__ = nombre
+        proceso = os.fork()
+        if proceso == 0:
+            os.close(lectura)
+            codigo = 0
+            try:
+                _volcar_en_segmento(self.__clinica__, nombre).close()
+            except BaseException as e:
+                os.write(escritura, str(e).encode()[:4096])
+                codigo = 1
+            os._exit(codigo)
+
+        os.close(escritura)
+        pausa = time.perf_counter() - inicio
+        try:
+            _, estado = await asyncio.get_running_loop().run_in_executor(
+                None, os.waitpid, proceso, 0
+            )
+            mensaje = os.read(lectura, 4096).decode(errors="replace")
+        finally:
+            os.close(lectura)
+        if os.waitstatus_to_exitcode(estado) != 0:
+            self._descartar_pendiente()
+            raise ClinicaException(
+                f"No se pudo generar la instantánea {generacion}: {mensaje}"
+            )
+
+        inicio = time.perf_counter()
+        self._instalar(shared_memory.SharedMemory(nombre), generacion)
+        self.__pendiente__ = None
+        self.__ultima_pausa__ = pausa + time.perf_counter() - inicio
+        return generacion
+
+    def _instalar(self, segmento: shared_memory.SharedMemory, generacion: int):
+        buffer = self.__control__.buf
+        GENERACION.pack_into(buffer, 0, 2 * generacion - 1)
+        CONTROL.pack_into(buffer, 0, 2 * generacion - 1, segmento.name.encode())
+        GENERACION.pack_into(buffer, 0, 2 * generacion)
+
+        self.__generacion__ = generacion
+        self.__segmentos__.append(segmento)
+        while len(self.__segmentos__) > self.__conservar__:
+            self._liberar(self.__segmentos__.popleft())
+
+    async def publicar_periodicamente(self, intervalo: float):
+        while True:
+            try:
+                await self.publicar_en_segundo_plano()
+            except Exception as e:
+                print(f"No se pudo publicar la réplica: {e}", file=sys.stderr)
+            await asyncio.sleep(max(intervalo, FACTOR_PAUSA * self.__ultima_pausa__))
+
+    @staticmethod
+    def _liberar(segmento: shared_memory.SharedMemory):
+        segmento.close()
+        if os.name == "posix":
+            resource_tracker.register(f"/{segmento.name}", "shared_memory")
+        segmento.unlink()
+
+    def _descartar_pendiente(self):
+        nombre, self.__pendiente__ = self.__pendiente__, None
+        if nombre is None:
+            return
+        try:
+            self._liberar(shared_memory.SharedMemory(nombre))
+        except FileNotFoundError:
+            pass
+
+    def cerrar(self):
+        self._descartar_pendiente()
+        while self.__segmentos__:
+            self._liberar(self.__segmentos__.popleft())
+        self._liberar(self.__control__)
+
+
+class _Generacion:
+    __slots__ = ("__instantanea__", "__cerrar__", "__lectores__", "__retirada__")
+
+    def __init__(self, instantanea: InstantaneaBinaria, cerrar: Callable[[], None]):
+        self.__instantanea__ = instantanea
+        self.__cerrar__ = cerrar
+        self.__lectores__ = 0
+        self.__retirada__ = False
+
+    def adquirir(self):
+        self.__lectores__ += 1
+
+    def soltar(self):
+        self.__lectores__ -= 1
+        self._liberar_si_corresponde()
+
+    def retirar(self):
+        self.__retirada__ = True
+        self._liberar_si_corresponde()
+
+    def _liberar_si_corresponde(self):
+        if self.__retirada__ and self.__lectores__ == 0:
+            self.__instantanea__.cerrar()
+            self.__cerrar__()
+
+
+class _Recorrido:
+    __slots__ = ("__iterador__", "__soltar__", "__weakref__")
+
+    def __init__(self, generacion: _Generacion, iterador: Iterator[Turno]):
+        generacion.adquirir()
+        self.__iterador__ = iterador
+        self.__soltar__ = weakref.finalize(self, generacion.soltar)
+
+    def __iter__(self) -> "_Recorrido":
+        return self
+
+    def __next__(self) -> Turno:
+        try:
+            return next(self.__iterador__)
+        except StopIteration:
+            self.__iterador__ = iter(())
+            self.__soltar__()
+            raise
+
+
+class ReplicaClinica:
+
+    def __init__(self, nombre: str):
+        self.__control__, self.__cerrar_control__ = _adjuntar(nombre)
+        self.__actual__ = None
+        self.__instantanea__ = None
+        self.__generacion__ = 0
+        if not self.actualizar():
+            self.__cerrar_control__()
+            raise DatosInvalidosException(
+                f"Todavía no se publicó ninguna instantánea en {nombre}"
+            )
+
+    def _leer_control(self) -> tuple[int, str]:
+        for _ in range(INTENTOS_LECTURA):
+            (inicio,) = GENERACION.unpack_from(self.__control__)
+            if inicio % 2 == 0:
+                _, nombre = CONTROL.unpack_from(self.__control__)
+                (fin,) = GENERACION.unpack_from(self.__control__)
+                if inicio == fin:
+                    return inicio // 2, nombre.rstrip(b"\0").decode()
+            time.sleep(PAUSA_LECTURA)
+        raise ClinicaException(
+            "No se pudo leer una instantánea estable: el publicador no terminó "
+            "de instalarla"
+        )
+
+    def actualizar(self) -> bool:
+
+        for _ in range(INTENTOS_LECTURA):
+            generacion, nombre = self._leer_control()
+            if generacion == self.__generacion__:
+                return False
+            try:
+                datos, cerrar = _adjuntar(nombre)
+            except FileNotFoundError:
+                time.sleep(PAUSA_LECTURA)
+                continue
+            break
+        else:
+            raise ClinicaException(
+                f"No se pudo abrir la instantánea {generacion}: ya fue liberada"
+            )
+
+        try:
+            instantanea = InstantaneaBinaria(datos)
+        except DatosInvalidosException:
+            cerrar()
+            raise
+        self._soltar()
+        self.__actual__ = _Generacion(instantanea, cerrar)
+        self.__instantanea__ = instantanea
+        self.__generacion__ = generacion
+        return True
+
+    def _soltar(self):
+        if self.__actual__ is not None:
+            self.__actual__.retirar()
+            self.__actual__ = None
+            self.__instantanea__ = None
+
+    def obtener_generacion(self) -> int:
+        return self.__generacion__
+
+    def cerrar(self):
+        self._soltar()
+        self.__cerrar_control__()
+
+    def buscar_paciente(self, dni: str) -> Paciente:
+        return self.__instantanea__.buscar_paciente(dni)
+
+    def buscar_medico(self, matricula: str) -> Medico:
+        return self.__instantanea__.buscar_medico(matricula)
+
+    def buscar_turno(self, identificador: int) -> Turno:
+        return self.__instantanea__.buscar_turno(identificador)
+
+    def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        return self.__instantanea__.obtener_historia_clinica(dni_paciente)
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return self.__instantanea__.listar_pacientes()
+
+    def listar_medicos(self) -> list[Medico]:
+        return self.__instantanea__.listar_medicos()
+
+    def iter_turnos(self) -> Iterator[Turno]:
+        return _Recorrido(self.__actual__, self.__instantanea__.iter_turnos())
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> Iterator[Turno]:
+        return _Recorrido(
+            self.__actual__,
+            self.__instantanea__.obtener_turnos_medico(matricula, desde, hasta),
+        )
+
+    def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        return self.__instantanea__.contar_turnos(estado)
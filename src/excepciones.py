@@ -22,5 +22,30 @@ class TurnoOcupadoException(ClinicaException):
     pass
 
 
+class TurnoNoEncontradoException(ClinicaException):
+    pass
+
+
 class DatosInvalidosException(ClinicaException):
-    pass
\ No newline at end of file
+    pass
+
+
+class EstadoTurnoInvalidoException(ClinicaException):
+    pass
+
+
+class VersionObsoletaException(ClinicaException):
+    pass
+
+
+class RepositorioNoDisponibleException(ClinicaException):
+    pass
+
+
+class LoteInvalidoException(ClinicaException):
+    def __init__(self, mensaje: str, errores: list[tuple[int, ClinicaException]]):
+        super().__init__(mensaje)
+        self.errores = errores
+
+    def __reduce__(self):
+        return (type(self), (str(self), self.errores))
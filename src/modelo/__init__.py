@@ -1,17 +1,34 @@
 from .paciente import Paciente
 from .especialidad import Especialidad
 from .medico import Medico
-from .turno import Turno
+from .turno import Turno, EstadoTurno
 from .receta import Receta
 from .historia_clinica import HistoriaClinica
+from .almacen_turnos import AlmacenTurnos, AlmacenTurnosColumnar
+from .eventos import BusEventos, Evento, Suscripcion, TipoEvento
 from .clinica import Clinica
+from .clinica_concurrente import ClinicaConcurrente
+from .clinica_asincronica import ClinicaAsincronica
+from .confirmador import ConfirmadorEscrituras
+from .barrendero import BarrenderoTurnos
 
 __all__ = [
     "Paciente",
     "Especialidad",
     "Medico",
     "Turno",
+    "EstadoTurno",
     "Receta",
     "HistoriaClinica",
+    "AlmacenTurnos",
+    "AlmacenTurnosColumnar",
+    "BusEventos",
+    "Evento",
+    "Suscripcion",
+    "TipoEvento",
     "Clinica",
+    "ClinicaConcurrente",
+    "ClinicaAsincronica",
+    "ConfirmadorEscrituras",
+    "BarrenderoTurnos",
 ]
\ No newline at end of file
@@ -0,0 +1,172 @@
+import threading
+from array import array
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from weakref import WeakValueDictionary
+
+from .turno import Turno, EstadoTurno
+
+ESTADOS = tuple(EstadoTurno)
+CODIGOS_ESTADO = {estado: codigo for codigo, estado in enumerate(ESTADOS)}
+
+EPOCA = datetime(1970, 1, 1)
+UN_MINUTO = timedelta(minutes=1)
+
+
+class AlmacenTurnos:
+
+    def __init__(self):
+        self.__turnos__ = []
+        self.__observadores__ = ()
+
+    def agregar_observador(self, observador):
+        self.__observadores__ += (observador,)
+
+    def agregar(self, turno: Turno) -> int:
+        fila = len(self.__turnos__)
+        turno.asignar_id(fila)
+        turno.agregar_observador(self._al_cambiar_estado)
+        self.__turnos__.append(turno)
+        return fila
+
+    def obtener(self, fila: int) -> Turno:
+        return self.__turnos__[fila]
+
+    def obtener_estado(self, fila: int) -> EstadoTurno:
+        return self.__turnos__[fila].obtener_estado_turno()
+
+    def descartar_desde(self, fila: int):
+        del self.__turnos__[fila:]
+
+    def _al_cambiar_estado(self, turno: Turno, estado_anterior: EstadoTurno):
+        for observador in self.__observadores__:
+            observador(turno, estado_anterior)
+
+    def __len__(self) -> int:
+        return len(self.__turnos__)
+
+    def __iter__(self) -> Iterator[Turno]:
+        return iter(self.__turnos__)
+
+
+class AlmacenTurnosColumnar(AlmacenTurnos):
+
+    def __init__(self):
+        self.__observadores__ = ()
+
+        self.__pacientes__ = array("I")
+        self.__medicos__ = array("I")
+        self.__minutos__ = array("q")
+        self.__especialidades__ = array("H")
+        self.__estados__ = array("B")
+        self.__versiones__ = array("I")
+
+        self.__tabla_pacientes__ = []
+        self.__ids_pacientes__ = {}
+        self.__tabla_medicos__ = []
+        self.__ids_medicos__ = {}
+        self.__tabla_especialidades__ = []
+        self.__ids_especialidades__ = {}
+
+        self.__vivos__ = WeakValueDictionary()
+        self.__cerrojo__ = threading.Lock()
+
+    @staticmethod
+    def _internar(tabla: list, ids: dict, clave, valor) -> int:
+        identificador = ids.get(clave)
+        if identificador is None:
+            identificador = len(tabla)
+            tabla.append(valor)
+            ids[clave] = identificador
+        return identificador
+
+    def agregar(self, turno: Turno) -> int:
+        with self.__cerrojo__:
+            fila = len(self.__minutos__)
+            turno.asignar_id(fila)
+
+            paciente = turno.obtener_paciente()
+            medico = turno.obtener_medico()
+            especialidad = turno.obtener_especialidad()
+
+            self.__pacientes__.append(
+                self._internar(
+                    self.__tabla_pacientes__,
+                    self.__ids_pacientes__,
+                    paciente.obtener_dni(),
+                    paciente,
+                )
+            )
+            self.__medicos__.append(
+                self._internar(
+                    self.__tabla_medicos__,
+                    self.__ids_medicos__,
+                    medico.obtener_matricula(),
+                    medico,
+                )
+            )
+            self.__minutos__.append((turno.obtener_fecha_hora() - EPOCA) // UN_MINUTO)
+            self.__especialidades__.append(
+                self._internar(
+                    self.__tabla_especialidades__,
+                    self.__ids_especialidades__,
+                    especialidad,
+                    especialidad,
+                )
+            )
+            self.__estados__.append(CODIGOS_ESTADO[turno.obtener_estado_turno()])
+            self.__versiones__.append(turno.obtener_version())
+
+            turno.agregar_observador(self._al_cambiar_estado)
+            self.__vivos__[fila] = turno
+            return fila
+
+    def obtener(self, fila: int) -> Turno:
+        turno = self.__vivos__.get(fila)
+        if turno is not None:
+            return turno
+        with self.__cerrojo__:
+            turno = self.__vivos__.get(fila)
+            if turno is None:
+                turno = Turno.reconstruir(
+                    self.__tabla_pacientes__[self.__pacientes__[fila]],
+                    self.__tabla_medicos__[self.__medicos__[fila]],
+                    EPOCA + self.__minutos__[fila] * UN_MINUTO,
+                    self.__tabla_especialidades__[self.__especialidades__[fila]],
+                    ESTADOS[self.__estados__[fila]],
+                    fila,
+                    self.__versiones__[fila],
+                )
+                turno.agregar_observador(self._al_cambiar_estado)
+                self.__vivos__[fila] = turno
+            return turno
+
+    def obtener_estado(self, fila: int) -> EstadoTurno:
+        return ESTADOS[self.__estados__[fila]]
+
+    def descartar_desde(self, fila: int):
+        with self.__cerrojo__:
+            for columna in (
+                self.__pacientes__,
+                self.__medicos__,
+                self.__minutos__,
+                self.__especialidades__,
+                self.__estados__,
+                self.__versiones__,
+            ):
+                del columna[fila:]
+            descartadas = [clave for clave in self.__vivos__.keys() if clave >= fila]
+            for descartada in descartadas:
+                self.__vivos__.pop(descartada, None)
+
+    def _al_cambiar_estado(self, turno: Turno, estado_anterior: EstadoTurno):
+        super()._al_cambiar_estado(turno, estado_anterior)
+        fila = turno.obtener_id()
+        self.__estados__[fila] = CODIGOS_ESTADO[turno.obtener_estado_turno()]
+        self.__versiones__[fila] = turno.obtener_version()
+
+    def __len__(self) -> int:
+        return len(self.__minutos__)
+
+    def __iter__(self) -> Iterator[Turno]:
+        return (self.obtener(fila) for fila in range(len(self.__minutos__)))
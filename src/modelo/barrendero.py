@@ -0,0 +1,103 @@
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from functools import partial
+from datetime import datetime, timedelta
+
+from ..excepciones import DatosInvalidosException
+from .clinica import Clinica, ESTADOS_VENCIDOS
+from .turno import Turno, EstadoTurno
+
+
+class BarrenderoTurnos:
+
+    def __init__(
+        self,
+        clinica: Clinica,
+        estado: EstadoTurno | str = EstadoTurno.COMPLETADO,
+        tamanio_lote: int = 512,
+        tolerancia: timedelta = timedelta(0),
+        reloj: Callable[[], datetime] = datetime.now,
+    ):
+        try:
+            estado = EstadoTurno(estado)
+        except ValueError:
+            raise DatosInvalidosException(f"Estado de turno inválido: {estado}")
+        if estado not in ESTADOS_VENCIDOS:
+            raise DatosInvalidosException(
+                f"Los turnos vencidos no pueden pasar a {estado.value}"
+            )
+        if not isinstance(tamanio_lote, int) or tamanio_lote <= 0:
+            raise DatosInvalidosException(
+                "El tamaño de lote del barrido debe ser un entero positivo"
+            )
+        if not isinstance(tolerancia, timedelta) or tolerancia < timedelta(0):
+            raise DatosInvalidosException(
+                "La tolerancia del barrido no puede ser negativa"
+            )
+
+        self.__clinica__ = clinica
+        self.__estado__ = estado
+        self.__tamanio_lote__ = tamanio_lote
+        self.__tolerancia__ = tolerancia
+        self.__reloj__ = reloj
+        self.__barridos__ = 0
+
+    def obtener_estado(self) -> EstadoTurno:
+        return self.__estado__
+
+    def obtener_barridos(self) -> int:
+        return self.__barridos__
+
+    def _limite(self, ahora: datetime | None) -> datetime:
+        if ahora is None:
+            ahora = self.__reloj__()
+        return ahora - self.__tolerancia__
+
+    def _vencer_hasta(self, limite: datetime) -> list[Turno]:
+        turnos = self.__clinica__.barrer_turnos_vencidos(
+            limite, self.__estado__, self.__tamanio_lote__
+        )
+        self.__barridos__ += len(turnos)
+        return turnos
+
+    def _barrer_hasta(self, limite: datetime) -> list[Turno]:
+        turnos = self._vencer_hasta(limite)
+        if turnos:
+            self.__clinica__.confirmar()
+        return turnos
+
+    def barrer_lote(self, ahora: datetime | None = None) -> list[Turno]:
+        return self._barrer_hasta(self._limite(ahora))
+
+    def barrer(self, ahora: datetime | None = None) -> int:
+        limite = self._limite(ahora)
+        total = 0
+        while True:
+            turnos = self._barrer_hasta(limite)
+            if not turnos:
+                return total
+            total += len(turnos)
+
+    async def _barrer_periodo(self, aplicar: Callable[[Callable], Awaitable] | None):
+        limite = self._limite(None)
+        if aplicar is None:
+            while self._barrer_hasta(limite):
+                await asyncio.sleep(0)
+            return
+        while await aplicar(partial(self._vencer_hasta, limite)):
+            pass
+
+    async def barrer_periodicamente(
+        self,
+        intervalo: float,
+        aplicar: Callable[[Callable], Awaitable] | None = None,
+    ):
+        while True:
+            try:
+                await self._barrer_periodo(aplicar)
+            except Exception as e:
+                print(
+                    f"No se pudieron barrer los turnos vencidos: {e}", file=sys.stderr
+                )
+            await asyncio.sleep(intervalo)
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+
+from ..excepciones import DatosInvalidosException
+
+
+class CacheLRU:
+
+    def __init__(
+        self,
+        capacidad: int | None = None,
+        limite_peso: int | None = None,
+        peso: Callable[[object], int] | None = None,
+    ):
+        if capacidad is not None and (not isinstance(capacidad, int) or capacidad <= 0):
+            raise DatosInvalidosException("La capacidad de la caché debe ser positiva")
+        if limite_peso is not None:
+            if not isinstance(limite_peso, int) or limite_peso <= 0:
+                raise DatosInvalidosException(
+                    "El límite de memoria de la caché debe ser positivo"
+                )
+            if peso is None:
+                raise DatosInvalidosException(
+                    "Se requiere una función de peso para limitar la memoria"
+                )
+
+        self.__entradas__ = OrderedDict()
+        self.__capacidad__ = capacidad
+        self.__limite_peso__ = limite_peso
+        self.__peso__ = peso
+        self.__peso_total__ = 0
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+        self.__desalojos__ = 0
+
+    def es_limitada(self) -> bool:
+        return self.__capacidad__ is not None or self.__limite_peso__ is not None
+
+    def obtener(self, clave: Hashable):
+        entrada = self.__entradas__.get(clave)
+        if entrada is None:
+            self.__fallos__ += 1
+            return None
+        self.__aciertos__ += 1
+        self.__entradas__.move_to_end(clave)
+        return entrada[0]
+
+    def consultar(self, clave: Hashable):
+        entrada = self.__entradas__.get(clave)
+        return None if entrada is None else entrada[0]
+
+    def agregar(self, clave: Hashable, valor):
+        self.quitar(clave)
+        peso = self.__peso__(valor) if self.__peso__ is not None else 0
+        self.__entradas__[clave] = (valor, peso)
+        self.__peso_total__ += peso
+        self._desalojar()
+
+    def actualizar(self, clave: Hashable):
+        if self.__peso__ is None or clave not in self.__entradas__:
+            return
+        valor, anterior = self.__entradas__[clave]
+        peso = self.__peso__(valor)
+        self.__entradas__[clave] = (valor, peso)
+        self.__peso_total__ += peso - anterior
+        self._desalojar()
+
+    def quitar(self, clave: Hashable):
+        entrada = self.__entradas__.pop(clave, None)
+        if entrada is not None:
+            self.__peso_total__ -= entrada[1]
+
+    def _desalojar(self):
+        while len(self.__entradas__) > 1 and (
+            (
+                self.__capacidad__ is not None
+                and len(self.__entradas__) > self.__capacidad__
+            )
+            or (
+                self.__limite_peso__ is not None
+                and self.__peso_total__ > self.__limite_peso__
+            )
+        ):
+            _, (_, peso) = self.__entradas__.popitem(last=False)
+            self.__peso_total__ -= peso
+            self.__desalojos__ += 1
+
+    def valores(self) -> Iterator:
+        return (valor for valor, _ in self.__entradas__.values())
+
+    def obtener_estadisticas(self) -> dict[str, int]:
+        return {
+            "aciertos": self.__aciertos__,
+            "fallos": self.__fallos__,
+            "desalojos": self.__desalojos__,
+            "entradas": len(self.__entradas__),
+            "peso": self.__peso_total__,
+        }
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return clave in self.__entradas__
+
+    def __len__(self) -> int:
+        return len(self.__entradas__)
@@ -0,0 +1,35 @@
+import threading
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+
+from ..excepciones import DatosInvalidosException
+
+
+class CerrojosRayados:
+    __slots__ = ("__cerrojos__",)
+
+    def __init__(self, franjas: int = 64):
+        if not isinstance(franjas, int) or franjas <= 0:
+            raise DatosInvalidosException(
+                "La cantidad de franjas de cerrojos debe ser positiva"
+            )
+        self.__cerrojos__ = tuple(threading.Lock() for _ in range(franjas))
+
+    def franjas(self, claves: Iterable[Hashable]) -> list[int]:
+        return sorted({hash(clave) % len(self.__cerrojos__) for clave in claves})
+
+    @contextmanager
+    def bloquear(self, claves: Iterable[Hashable]) -> Iterator[None]:
+        tomados = []
+        try:
+            for franja in self.franjas(claves):
+                cerrojo = self.__cerrojos__[franja]
+                cerrojo.acquire()
+                tomados.append(cerrojo)
+            yield
+        finally:
+            for cerrojo in reversed(tomados):
+                cerrojo.release()
+
+    def __len__(self) -> int:
+        return len(self.__cerrojos__)
@@ -1,24 +1,103 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from heapq import heapify, heappop, heappush
+from operator import itemgetter
+from collections.abc import Container, Iterable, Iterator
+from itertools import count, islice, takewhile
+from datetime import date, datetime, time, timedelta
 from ..excepciones import (
+    ClinicaException,
     DatosInvalidosException,
+    LoteInvalidoException,
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    EstadoTurnoInvalidoException,
 )
 from .paciente import Paciente
 from .medico import Medico
 from .especialidad import Especialidad
-from .turno import Turno
+from .turno import Turno, EstadoTurno
 from .receta import Receta
 from .historia_clinica import HistoriaClinica
+from .almacen_turnos import AlmacenTurnos, AlmacenTurnosColumnar, EPOCA, UN_MINUTO
+from .cache_lru import CacheLRU
+from .indice_ordenado import IndiceOrdenado
+from .eventos import BusEventos, TipoEvento
+from ..persistencia.repositorio import Repositorio
+from .fechas import (
+    DIAS_SEMANA,
+    INDICES_DIAS,
+    parsear_fecha,
+    parsear_hora,
+    formatear_fecha,
+    formatear_hora,
+)
+
+PESO_HISTORIA = 256
+PESO_TURNO = 200
+PESO_RECETA = 400
+
+BITS_FILA = 32
+MASCARA_FILA = (1 << BITS_FILA) - 1
+ESTADOS_VENCIDOS = (EstadoTurno.COMPLETADO, EstadoTurno.AUSENTE)
 
 
 class Clinica:
 
-    def __init__(self):
+    def __init__(
+        self,
+        almacen_turnos: AlmacenTurnos | None = None,
+        repositorio: Repositorio | None = None,
+        limite_historias: int | None = None,
+        limite_memoria_historias: int | None = None,
+        eventos: BusEventos | None = None,
+    ):
+        self.__historias_clinicas__ = CacheLRU(
+            limite_historias,
+            limite_memoria_historias,
+            self._peso_historia if limite_memoria_historias is not None else None,
+        )
+        self.__filas_paciente__ = None
+        if self.__historias_clinicas__.es_limitada():
+            if repositorio is None or not repositorio.permite_carga_perezosa():
+                raise DatosInvalidosException(
+                    "Limitar las historias en memoria requiere un repositorio "
+                    "que permita cargarlas bajo demanda"
+                )
+            self.__filas_paciente__ = {}
+
         self.__pacientes__ = {}
         self.__medicos__ = {}
-        self.__turnos__ = []
-        self.__historias_clinicas__ = {}
+        self.__indice_pacientes__ = IndiceOrdenado()
+        self.__indice_medicos__ = IndiceOrdenado()
+        if almacen_turnos is None:
+            almacen_turnos = (
+                AlmacenTurnosColumnar()
+                if self.__historias_clinicas__.es_limitada()
+                else AlmacenTurnos()
+            )
+        self.__turnos__ = almacen_turnos
+        self.__turnos__.agregar_observador(self._al_cambiar_estado_turno)
+        self.__agenda__ = {}
+        self.__ids_medicos__ = {}
+        self.__calendarios__ = {}
+        self.__vencimientos__ = []
+        self.__medicos_por_especialidad__ = {}
+        self.__medicos_por_especialidad_dia__ = {}
+        self.__conteo_estados__ = Counter()
+        self.__conteo_medicos__ = {}
+        self.__conteo_dias__ = {}
+        self.__eventos__ = BusEventos()
+
+        self.__repositorio__ = Repositorio()
+        if repositorio is not None:
+            repositorio.cargar(self)
+            self.__repositorio__ = repositorio
+        if eventos is not None:
+            self.__eventos__ = eventos
 
     def registrar_paciente(
         self, nombre: str, dni: str, fecha_nacimiento: str
@@ -28,9 +107,14 @@ class Clinica:
             raise DatosInvalidosException(f"Ya existe un paciente con DNI {dni}")
 
         paciente = Paciente(nombre, dni, fecha_nacimiento)
+        self.__repositorio__.guardar_paciente(paciente)
         self.__pacientes__[dni] = paciente
+        self.__indice_pacientes__.agregar(dni)
 
-        self.__historias_clinicas__[dni] = HistoriaClinica(paciente)
+        self.__historias_clinicas__.agregar(dni, HistoriaClinica(paciente))
+        if self.__filas_paciente__ is not None:
+            self.__filas_paciente__[dni] = array("I")
+        self.__eventos__.publicar(TipoEvento.PACIENTE_REGISTRADO, paciente)
 
         return paciente
 
@@ -42,7 +126,13 @@ class Clinica:
             )
 
         medico = Medico(nombre, matricula)
+        self.__repositorio__.guardar_medico(medico)
         self.__medicos__[matricula] = medico
+        self.__indice_medicos__.agregar(matricula)
+        self.__ids_medicos__[matricula] = len(self.__ids_medicos__)
+        self.__calendarios__[matricula] = (array("q"), array("I"))
+        self.__conteo_medicos__[matricula] = Counter()
+        self.__eventos__.publicar(TipoEvento.MEDICO_REGISTRADO, medico)
 
         return medico
 
@@ -57,10 +147,38 @@ class Clinica:
 
         especialidad = Especialidad(tipo_especialidad, dias)
 
-        self.__medicos__[matricula].agregar_especialidad(especialidad)
+        medico = self.__medicos__[matricula]
+        medico.verificar_especialidad(especialidad)
+        self.__repositorio__.guardar_especialidad(matricula, especialidad)
+        medico.agregar_especialidad(especialidad)
+
+        self.__medicos_por_especialidad__.setdefault(tipo_especialidad, {})[
+            matricula
+        ] = medico
+        for indice in range(len(DIAS_SEMANA)):
+            tipo_dia = medico.obtener_especialidad_para_dia_semana(indice)
+            if tipo_dia is not None:
+                self.__medicos_por_especialidad_dia__.setdefault(
+                    (tipo_dia, indice), {}
+                )[matricula] = medico
 
         return especialidad
 
+    def buscar_medicos_por_especialidad(self, especialidad: str) -> list[Medico]:
+        return list(self.__medicos_por_especialidad__.get(especialidad, {}).values())
+
+    def buscar_medicos_por_especialidad_y_dia(
+        self, especialidad: str, dia: str
+    ) -> list[Medico]:
+
+        indice = INDICES_DIAS.get(dia.lower()) if isinstance(dia, str) else None
+        if indice is None:
+            raise DatosInvalidosException(f"Día inválido: {dia}")
+
+        return list(
+            self.__medicos_por_especialidad_dia__.get((especialidad, indice), {}).values()
+        )
+
     def agendar_turno(
         self,
         dni_paciente: str,
@@ -70,6 +188,91 @@ class Clinica:
         especialidad: str,
     ) -> Turno:
 
+        turno = self._crear_turno(
+            dni_paciente, matricula_medico, fecha, hora, especialidad
+        )
+
+        if self._clave_horario(turno) in self.__agenda__:
+            raise TurnoOcupadoException(
+                f"El médico ya tiene un turno en {fecha} a las {hora}"
+            )
+
+        self._registrar_turnos([turno])
+
+        return turno
+
+    def agendar_turnos_lote(
+        self, solicitudes: Iterable[tuple[str, str, str, str, str]]
+    ) -> list[Turno]:
+
+        turnos = self.validar_turnos_lote(solicitudes)
+        self._registrar_turnos(turnos)
+
+        return turnos
+
+    def validar_turnos_lote(
+        self,
+        solicitudes: Iterable[tuple[str, str, str, str, str]],
+        ocupados: Container[tuple[str, datetime]] = frozenset(),
+    ) -> list[Turno]:
+
+        turnos = []
+        errores = []
+        claves_lote = set()
+
+        for indice, solicitud in enumerate(solicitudes):
+            try:
+                try:
+                    dni_paciente, matricula_medico, fecha, hora, especialidad = (
+                        solicitud
+                    )
+                except (TypeError, ValueError):
+                    raise DatosInvalidosException(
+                        "Cada solicitud debe ser (dni, matrícula, fecha, hora, especialidad)"
+                    )
+                if not isinstance(dni_paciente, str) or not isinstance(
+                    matricula_medico, str
+                ):
+                    raise DatosInvalidosException(
+                        "El DNI y la matrícula de cada solicitud deben ser texto"
+                    )
+
+                turno = self._crear_turno(
+                    dni_paciente, matricula_medico, fecha, hora, especialidad
+                )
+
+                clave = self._clave_horario(turno)
+                if (
+                    clave in self.__agenda__
+                    or clave in claves_lote
+                    or (matricula_medico, turno.obtener_fecha_hora()) in ocupados
+                ):
+                    raise TurnoOcupadoException(
+                        f"El médico ya tiene un turno en {fecha} a las {hora}"
+                    )
+            except ClinicaException as e:
+                errores.append((indice, e))
+                continue
+
+            claves_lote.add(clave)
+            turnos.append(turno)
+
+        if errores:
+            raise LoteInvalidoException(
+                f"Se rechazó el lote: {len(errores)} solicitudes inválidas", errores
+            )
+
+        return turnos
+
+    def _crear_turno(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        hora: str,
+        especialidad: str,
+    ) -> Turno:
+
         if dni_paciente not in self.__pacientes__:
             raise PacienteNoEncontradoException(
                 f"No existe un paciente con DNI {dni_paciente}"
@@ -79,18 +282,7 @@ class Clinica:
                 f"No existe un médico con matrícula {matricula_medico}"
             )
 
-        for turno in self.__turnos__:
-            if (
-                turno.obtener_medico().obtener_matricula() == matricula_medico
-                and turno.obtener_fecha() == fecha
-                and turno.obtener_hora() == hora
-                and turno.obtener_estado() != "Cancelado"
-            ):
-                raise TurnoOcupadoException(
-                    f"El médico ya tiene un turno en {fecha} a las {hora}"
-                )
-
-        turno = Turno(
+        return Turno(
             self.__pacientes__[dni_paciente],
             self.__medicos__[matricula_medico],
             fecha,
@@ -98,11 +290,278 @@ class Clinica:
             especialidad,
         )
 
-        self.__turnos__.append(turno)
+    def _registrar_turnos(self, turnos: list[Turno]):
+
+        por_medico = {}
+        por_paciente = {}
+        conteos = Counter()
+        vencimientos = []
+        agenda = self.__agenda__
+        ids_medicos = self.__ids_medicos__
+        agregar = self.__turnos__.agregar
+
+        primera = len(self.__turnos__)
+        for turno in turnos:
+            agregar(turno)
+        try:
+            self.__repositorio__.guardar_turnos(turnos)
+        except Exception:
+            self.__turnos__.descartar_desde(primera)
+            raise
+
+        for turno in turnos:
+            fila = turno.obtener_id()
+            estado = turno.obtener_estado_turno()
+            matricula = turno.obtener_medico().obtener_matricula()
+            fecha_hora = turno.obtener_fecha_hora()
+            minuto = (fecha_hora - EPOCA) // UN_MINUTO
+            if estado is not EstadoTurno.CANCELADO:
+                agenda[minuto << BITS_FILA | ids_medicos[matricula]] = fila
+            if estado is EstadoTurno.PROGRAMADO:
+                vencimientos.append(minuto << BITS_FILA | fila)
+            conteos[(matricula, fecha_hora.date(), estado)] += 1
+
+            por_medico.setdefault(matricula, []).append((minuto, fila))
+            por_paciente.setdefault(turno.obtener_paciente().obtener_dni(), []).append(
+                turno
+            )
+
+        for (matricula, dia, estado), cantidad in conteos.items():
+            self._sumar_estado(matricula, dia, estado, cantidad)
 
-        self.__historias_clinicas__[dni_paciente].agregar_turno(turno)
+        self._agregar_vencimientos(vencimientos)
 
-        return turno
+        for matricula, nuevos in por_medico.items():
+            self._insertar_en_calendario(matricula, nuevos)
+
+        for dni, nuevos in por_paciente.items():
+            historia = self.__historias_clinicas__.consultar(dni)
+            if historia is not None:
+                historia.agregar_turnos(nuevos)
+                self.__historias_clinicas__.actualizar(dni)
+            if self.__filas_paciente__ is not None:
+                self.__filas_paciente__[dni].extend(
+                    turno.obtener_id() for turno in nuevos
+                )
+
+        if self.__eventos__.tiene_suscriptores():
+            for turno in turnos:
+                self.__eventos__.publicar(TipoEvento.TURNO_AGENDADO, turno)
+
+    def _restaurar_turnos(
+        self, registros: Iterable[tuple[str, str, datetime, str, EstadoTurno]]
+    ) -> list[Turno]:
+
+        turnos = [
+            Turno.reconstruir(
+                self.buscar_paciente(dni),
+                self.buscar_medico(matricula),
+                fecha_hora,
+                especialidad,
+                estado,
+            )
+            for dni, matricula, fecha_hora, especialidad, estado in registros
+        ]
+        self._registrar_turnos(turnos)
+        return turnos
+
+    def _agregar_vencimientos(self, claves: list[int]):
+
+        vencimientos = self.__vencimientos__
+        if len(claves) > len(vencimientos):
+            vencimientos.extend(claves)
+            heapify(vencimientos)
+            return
+        for clave in claves:
+            heappush(vencimientos, clave)
+
+    def _insertar_en_calendario(self, matricula: str, nuevos: list[tuple[int, int]]):
+
+        minutos, filas = self.__calendarios__[matricula]
+
+        if len(nuevos) == 1:
+            minuto, fila = nuevos[0]
+            posicion = bisect_right(minutos, minuto)
+            minutos.insert(posicion, minuto)
+            filas.insert(posicion, fila)
+            return
+
+        pares = list(zip(minutos, filas))
+        pares.extend(nuevos)
+        pares.sort(key=itemgetter(0))
+        self.__calendarios__[matricula] = (
+            array("q", [minuto for minuto, _ in pares]),
+            array("I", [fila for _, fila in pares]),
+        )
+
+    def _clave_horario(self, turno: Turno) -> int:
+        minuto = (turno.obtener_fecha_hora() - EPOCA) // UN_MINUTO
+        return minuto << BITS_FILA | self.__ids_medicos__[
+            turno.obtener_medico().obtener_matricula()
+        ]
+
+    def _al_cambiar_estado_turno(self, turno: Turno, estado_anterior: EstadoTurno):
+        self.__repositorio__.actualizar_estado_turno(turno, estado_anterior)
+        self._contar_estado(turno, estado_anterior, -1)
+        self._contar_estado(turno, turno.obtener_estado_turno(), 1)
+
+        if turno.obtener_estado_turno() is EstadoTurno.CANCELADO:
+            clave = self._clave_horario(turno)
+            if self.__agenda__.get(clave) == turno.obtener_id():
+                del self.__agenda__[clave]
+            self.__eventos__.publicar(TipoEvento.TURNO_CANCELADO, turno)
+        elif turno.obtener_estado_turno() is EstadoTurno.COMPLETADO:
+            self.__eventos__.publicar(TipoEvento.TURNO_COMPLETADO, turno)
+        elif turno.obtener_estado_turno() is EstadoTurno.AUSENTE:
+            self.__eventos__.publicar(TipoEvento.TURNO_AUSENTE, turno)
+
+    def _contar_estado(self, turno: Turno, estado: EstadoTurno, delta: int):
+        self._sumar_estado(
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_fecha_hora().date(),
+            estado,
+            delta,
+        )
+
+    def _sumar_estado(self, matricula: str, dia: date, estado: EstadoTurno, delta: int):
+        self.__conteo_estados__[estado] += delta
+        self.__conteo_medicos__[matricula][estado] += delta
+
+        conteo_dia = self.__conteo_dias__.get(dia)
+        if conteo_dia is None:
+            conteo_dia = self.__conteo_dias__[dia] = Counter()
+        conteo_dia[estado] += delta
+
+    @staticmethod
+    def _sumar_conteo(conteo: Counter, estado: EstadoTurno | str | None) -> int:
+        if estado is None:
+            return sum(conteo.values())
+        try:
+            return conteo[EstadoTurno(estado)]
+        except ValueError:
+            raise DatosInvalidosException(f"Estado de turno inválido: {estado}")
+
+    def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        return self._sumar_conteo(self.__conteo_estados__, estado)
+
+    def contar_turnos_medico(
+        self, matricula: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        if matricula not in self.__conteo_medicos__:
+            raise MedicoNoEncontradoException(
+                f"No existe un médico con matrícula {matricula}"
+            )
+        return self._sumar_conteo(self.__conteo_medicos__[matricula], estado)
+
+    def contar_turnos_dia(
+        self, fecha: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        conteo = self.__conteo_dias__.get(parsear_fecha(fecha), Counter())
+        return self._sumar_conteo(conteo, estado)
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> Iterator[Turno]:
+
+        if matricula not in self.__medicos__:
+            raise MedicoNoEncontradoException(
+                f"No existe un médico con matrícula {matricula}"
+            )
+
+        inicio = datetime.combine(parsear_fecha(desde), time.min)
+        fin = datetime.combine(parsear_fecha(hasta) + timedelta(days=1), time.min)
+
+        minutos, filas = self.__calendarios__[matricula]
+        primero = bisect_left(minutos, (inicio - EPOCA) // UN_MINUTO)
+        ultimo = bisect_left(minutos, (fin - EPOCA) // UN_MINUTO)
+        return map(self.__turnos__.obtener, filas[primero:ultimo])
+
+    def buscar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: str,
+        hasta: str,
+        duracion: int,
+        cantidad: int | None = None,
+        hora_inicio: str = "08:00",
+        hora_fin: str = "18:00",
+    ) -> Iterator[tuple[str, str, str]]:
+
+        if not especialidad or not isinstance(especialidad, str):
+            raise DatosInvalidosException(
+                "La especialidad es requerida y debe ser texto"
+            )
+        if not isinstance(duracion, int) or duracion <= 0:
+            raise DatosInvalidosException(
+                "La duración debe ser una cantidad positiva de minutos"
+            )
+        if cantidad is not None and (not isinstance(cantidad, int) or cantidad <= 0):
+            raise DatosInvalidosException("La cantidad debe ser un entero positivo")
+
+        primer_dia = parsear_fecha(desde)
+        ultimo_dia = parsear_fecha(hasta)
+        apertura = parsear_hora(hora_inicio)
+        cierre = parsear_hora(hora_fin)
+
+        medicos_por_dia = [
+            list(self.__medicos_por_especialidad_dia__.get((especialidad, indice), {}))
+            for indice in range(len(DIAS_SEMANA))
+        ]
+
+        return self._generar_turnos_disponibles(
+            medicos_por_dia,
+            primer_dia,
+            ultimo_dia,
+            apertura,
+            cierre,
+            timedelta(minutes=duracion),
+            cantidad,
+        )
+
+    def _generar_turnos_disponibles(
+        self,
+        medicos_por_dia: list[list[str]],
+        primer_dia: date,
+        ultimo_dia: date,
+        apertura: time,
+        cierre: time,
+        duracion: timedelta,
+        cantidad: int | None,
+    ) -> Iterator[tuple[str, str, str]]:
+
+        encontrados = 0
+        dia = primer_dia
+        while dia <= ultimo_dia:
+            matriculas = medicos_por_dia[dia.weekday()]
+            inicio = datetime.combine(dia, apertura)
+            fin_jornada = datetime.combine(dia, cierre)
+
+            while matriculas and inicio + duracion <= fin_jornada:
+                for matricula in matriculas:
+                    if self._horario_libre(matricula, inicio, inicio + duracion):
+                        yield (
+                            matricula,
+                            formatear_fecha(dia),
+                            formatear_hora(inicio.time()),
+                        )
+                        encontrados += 1
+                        if encontrados == cantidad:
+                            return
+                inicio += duracion
+
+            dia += timedelta(days=1)
+
+    def _horario_libre(self, matricula: str, inicio: datetime, fin: datetime) -> bool:
+
+        minutos, filas = self.__calendarios__[matricula]
+        fin = (fin - EPOCA) // UN_MINUTO
+        posicion = bisect_left(minutos, (inicio - EPOCA) // UN_MINUTO)
+        while posicion < len(minutos) and minutos[posicion] < fin:
+            estado = self.__turnos__.obtener_estado(filas[posicion])
+            if estado is not EstadoTurno.CANCELADO:
+                return False
+            posicion += 1
+        return True
 
     def emitir_receta(
         self,
@@ -111,6 +570,23 @@ class Clinica:
         fecha: str,
         medicamentos: list[str],
         indicaciones: str,
+        version_historia: int | None = None,
+    ) -> Receta:
+
+        receta = self._crear_receta(
+            dni_paciente, matricula_medico, fecha, medicamentos, indicaciones
+        )
+        self._registrar_receta(receta, version_historia)
+
+        return receta
+
+    def _crear_receta(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        medicamentos: list[str],
+        indicaciones: str,
     ) -> Receta:
 
         if dni_paciente not in self.__pacientes__:
@@ -122,7 +598,7 @@ class Clinica:
                 f"No existe un médico con matrícula {matricula_medico}"
             )
 
-        receta = Receta(
+        return Receta(
             self.__pacientes__[dni_paciente],
             self.__medicos__[matricula_medico],
             fecha,
@@ -130,18 +606,88 @@ class Clinica:
             indicaciones,
         )
 
-        self.__historias_clinicas__[dni_paciente].agregar_receta(receta)
-
-        return receta
+    def _registrar_receta(self, receta: Receta, version_historia: int | None):
+
+        dni_paciente = receta.obtener_paciente().obtener_dni()
+        if version_historia is None:
+            historia = self.__historias_clinicas__.consultar(dni_paciente)
+        else:
+            historia = self._obtener_historia(dni_paciente)
+        if historia is not None:
+            historia.verificar_version(version_historia)
+        self.__repositorio__.guardar_receta(receta)
+        if historia is not None:
+            historia.agregar_receta(receta, version_historia)
+            self.__historias_clinicas__.actualizar(dni_paciente)
+        self.__eventos__.publicar(TipoEvento.RECETA_EMITIDA, receta)
 
     def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
 
-        if dni_paciente not in self.__historias_clinicas__:
+        if dni_paciente not in self.__pacientes__:
             raise PacienteNoEncontradoException(
                 f"No existe historia clínica para el DNI {dni_paciente}"
             )
+        return self._obtener_historia(dni_paciente)
 
-        return self.__historias_clinicas__[dni_paciente]
+    def _obtener_historia(self, dni_paciente: str) -> HistoriaClinica:
+
+        historia = self.__historias_clinicas__.obtener(dni_paciente)
+        if historia is None:
+            historia = self._cargar_historia(dni_paciente)
+            self.__historias_clinicas__.agregar(dni_paciente, historia)
+        return historia
+
+    def iter_historias_clinicas(
+        self, dnis: Iterable[str] | None = None
+    ) -> Iterator[HistoriaClinica]:
+
+        if dnis is None:
+            dnis = self.__pacientes__
+        return (self._consultar_historia(dni) for dni in dnis)
+
+    def _consultar_historia(self, dni_paciente: str) -> HistoriaClinica:
+
+        if dni_paciente not in self.__pacientes__:
+            raise PacienteNoEncontradoException(
+                f"No existe historia clínica para el DNI {dni_paciente}"
+            )
+
+        historia = self.__historias_clinicas__.consultar(dni_paciente)
+        if historia is None:
+            historia = self._cargar_historia(dni_paciente)
+        return historia
+
+    def _cargar_historia(self, dni_paciente: str) -> HistoriaClinica:
+
+        paciente = self.__pacientes__[dni_paciente]
+        turnos = [
+            self.__turnos__.obtener(fila)
+            for fila in self.__filas_paciente__[dni_paciente]
+        ]
+        recetas = [
+            Receta.reconstruir(
+                paciente,
+                self.buscar_medico(matricula),
+                fecha,
+                medicamentos,
+                indicaciones,
+            )
+            for matricula, fecha, medicamentos, indicaciones in (
+                self.__repositorio__.cargar_recetas(dni_paciente)
+            )
+        ]
+        return HistoriaClinica.reconstruir(paciente, turnos, recetas)
+
+    @staticmethod
+    def _peso_historia(historia: HistoriaClinica) -> int:
+        return (
+            PESO_HISTORIA
+            + PESO_TURNO * historia.contar_turnos()
+            + PESO_RECETA * historia.contar_recetas()
+        )
+
+    def obtener_estadisticas_historias(self) -> dict[str, int]:
+        return self.__historias_clinicas__.obtener_estadisticas()
 
     def listar_pacientes(self) -> list[Paciente]:
         return list(self.__pacientes__.values())
@@ -159,4 +705,142 @@ class Clinica:
             raise MedicoNoEncontradoException(
                 f"No existe un médico con matrícula {matricula}"
             )
-        return self.__medicos__[matricula]
\ No newline at end of file
+        return self.__medicos__[matricula]
+
+    def buscar_turno(self, identificador: int) -> Turno:
+        if (
+            not isinstance(identificador, int)
+            or not 0 <= identificador < len(self.__turnos__)
+        ):
+            raise TurnoNoEncontradoException(
+                f"No existe un turno con identificador {identificador}"
+            )
+        return self.__turnos__.obtener(identificador)
+
+    def completar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        turno = self.buscar_turno(identificador)
+        turno.marcar_completado(version)
+        return turno
+
+    def cancelar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        turno = self.buscar_turno(identificador)
+        turno.marcar_cancelado(version)
+        return turno
+
+    def registrar_ausencia(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        turno = self.buscar_turno(identificador)
+        turno.marcar_ausente(version)
+        return turno
+
+    def barrer_turnos_vencidos(
+        self,
+        ahora: datetime | None = None,
+        estado: EstadoTurno | str = EstadoTurno.COMPLETADO,
+        limite: int | None = None,
+    ) -> list[Turno]:
+
+        try:
+            estado = EstadoTurno(estado)
+        except ValueError:
+            raise DatosInvalidosException(f"Estado de turno inválido: {estado}")
+        if estado not in ESTADOS_VENCIDOS:
+            raise DatosInvalidosException(
+                f"Los turnos vencidos no pueden pasar a {estado.value}"
+            )
+        self._validar_limite(limite)
+        if ahora is None:
+            ahora = datetime.now()
+
+        cambiar = (
+            self.completar_turno
+            if estado is EstadoTurno.COMPLETADO
+            else self.registrar_ausencia
+        )
+        barridos = []
+        for fila in self._extraer_vencidos(ahora, limite):
+            try:
+                barridos.append(cambiar(fila))
+            except EstadoTurnoInvalidoException:
+                continue
+        return barridos
+
+    def _extraer_vencidos(self, ahora: datetime, limite: int | None) -> list[int]:
+
+        minutos, resto = divmod(ahora - EPOCA, UN_MINUTO)
+        tope = (minutos + bool(resto)) << BITS_FILA
+        vencimientos = self.__vencimientos__
+        obtener_estado = self.__turnos__.obtener_estado
+        filas = []
+        while vencimientos and vencimientos[0] < tope and len(filas) != limite:
+            fila = heappop(vencimientos) & MASCARA_FILA
+            if obtener_estado(fila) is EstadoTurno.PROGRAMADO:
+                filas.append(fila)
+        return filas
+
+    def contar_pacientes(self) -> int:
+        return len(self.__pacientes__)
+
+    def contar_medicos(self) -> int:
+        return len(self.__medicos__)
+
+    def iter_pacientes(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Paciente]:
+
+        self._validar_limite(limite)
+        dnis = self.__indice_pacientes__.iter_claves(despues_de, descendente)
+        return (self.__pacientes__[dni] for dni in islice(dnis, limite))
+
+    def iter_medicos(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Medico]:
+
+        self._validar_limite(limite)
+        matriculas = self.__indice_medicos__.iter_claves(despues_de, descendente)
+        return (self.__medicos__[matricula] for matricula in islice(matriculas, limite))
+
+    def iter_turnos(
+        self,
+        despues_de: int | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Turno]:
+
+        self._validar_limite(limite)
+        if despues_de is None and limite is None and not descendente:
+            return iter(self.__turnos__)
+        if despues_de is not None and not isinstance(despues_de, int):
+            raise DatosInvalidosException("El cursor de turnos debe ser un entero")
+
+        total = len(self.__turnos__)
+        if descendente:
+            inicio = total if despues_de is None else min(despues_de, total)
+            filas = range(inicio - 1, -1, -1)
+        else:
+            filas = takewhile(
+                lambda fila: fila < len(self.__turnos__),
+                count(0 if despues_de is None else max(despues_de + 1, 0)),
+            )
+        return (self.__turnos__.obtener(fila) for fila in islice(filas, limite))
+
+    @staticmethod
+    def _validar_limite(limite: int | None):
+        if limite is not None and (not isinstance(limite, int) or limite <= 0):
+            raise DatosInvalidosException("El límite debe ser un entero positivo")
+
+    def obtener_eventos(self) -> BusEventos:
+        return self.__eventos__
+
+    def confirmar(self):
+        self.__repositorio__.confirmar()
+
+    def cerrar(self):
+        self.__repositorio__.cerrar()
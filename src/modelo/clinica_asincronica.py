@@ -0,0 +1,322 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from datetime import datetime
+
+from ..excepciones import LoteInvalidoException, RepositorioNoDisponibleException
+from .clinica import Clinica
+from .confirmador import ConfirmadorEscrituras
+from .paciente import Paciente
+from .medico import Medico
+from .especialidad import Especialidad
+from .turno import Turno, EstadoTurno
+from .receta import Receta
+from .historia_clinica import HistoriaClinica
+
+
+class ClinicaAsincronica:
+
+    def __init__(
+        self,
+        clinica: Clinica | None = None,
+        ejecutor: Executor | None = None,
+        tamanio_lote: int = 1024,
+        tamanio_cola: int = 4096,
+    ):
+        self.__clinica__ = clinica if clinica is not None else Clinica()
+        self.__confirmador__ = ConfirmadorEscrituras(self.__clinica__)
+        self.__ejecutor__ = ejecutor
+        self.__tamanio_lote__ = tamanio_lote
+        self.__cola__ = asyncio.Queue(tamanio_cola)
+        self.__aplicador__ = None
+
+    def obtener_clinica(self) -> Clinica:
+        return self.__clinica__
+
+    async def detener(self):
+        if self.__aplicador__ is None:
+            return
+        await self.__cola__.put(None)
+        await self.__aplicador__
+        self.__aplicador__ = None
+
+    async def _escribir(self, operacion: Callable | None, *argumentos):
+        if self.__aplicador__ is None:
+            self.__aplicador__ = asyncio.create_task(self._aplicar_escrituras())
+        futuro = asyncio.get_running_loop().create_future()
+        await self.__cola__.put((operacion, argumentos, futuro))
+        return await futuro
+
+    async def _en_ejecutor(self, funcion: Callable, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__ejecutor__, funcion, *argumentos
+        )
+
+    async def _aplicar_escrituras(self):
+        while True:
+            lote = [await self.__cola__.get()]
+            while len(lote) < self.__tamanio_lote__ and not self.__cola__.empty():
+                lote.append(self.__cola__.get_nowait())
+
+            resueltos = await self._aplicar_lote(lote)
+            for futuro, resultado, error in resueltos:
+                if futuro.done():
+                    continue
+                if error is None:
+                    futuro.set_result(resultado)
+                else:
+                    futuro.set_exception(error)
+
+            if None in lote:
+                return
+
+    async def _aplicar_lote(self, lote: list) -> list[tuple]:
+        try:
+            self.__confirmador__.verificar_disponible()
+        except RepositorioNoDisponibleException as e:
+            return [(pendiente[2], None, e) for pendiente in lote if pendiente]
+
+        resueltos = []
+        individuales = []
+        for pendiente in lote:
+            if pendiente is None:
+                continue
+            operacion, argumentos, futuro = pendiente
+            if operacion is None:
+                individuales.append((argumentos, futuro))
+                continue
+            resueltos.extend(await self._agendar_individuales(individuales))
+            individuales = []
+            resueltos.append((futuro, *await self._aplicar(operacion, argumentos)))
+        resueltos.extend(await self._agendar_individuales(individuales))
+        self.__confirmador__.confirmar()
+        return resueltos
+
+    async def _aplicar(self, operacion: Callable, argumentos: tuple) -> tuple:
+        try:
+            resultado = operacion(*argumentos)
+            if asyncio.iscoroutine(resultado):
+                resultado = await resultado
+        except Exception as e:
+            return None, e
+        return resultado, None
+
+    async def _agendar_individuales(
+        self, pendientes: list[tuple[tuple, asyncio.Future]]
+    ) -> list[tuple]:
+
+        if not pendientes:
+            return []
+
+        try:
+            turnos, errores = await self._en_ejecutor(
+                self._validar_individuales, [solicitud for solicitud, _ in pendientes]
+            )
+            self.__clinica__._registrar_turnos(turnos)
+        except Exception as e:
+            return [(futuro, None, e) for _, futuro in pendientes]
+
+        validos = iter(turnos)
+        return [
+            (futuro, None, errores[indice])
+            if indice in errores
+            else (futuro, next(validos), None)
+            for indice, (_, futuro) in enumerate(pendientes)
+        ]
+
+    def _validar_individuales(
+        self, solicitudes: list[tuple[str, str, str, str, str]]
+    ) -> tuple[list[Turno], dict[int, Exception]]:
+
+        try:
+            return self.__clinica__.validar_turnos_lote(solicitudes), {}
+        except LoteInvalidoException as e:
+            errores = dict(e.errores)
+        validas = [
+            solicitud
+            for indice, solicitud in enumerate(solicitudes)
+            if indice not in errores
+        ]
+        return self.__clinica__.validar_turnos_lote(validas), errores
+
+    async def _agendar_lote(
+        self, solicitudes: list[tuple[str, str, str, str, str]]
+    ) -> list[Turno]:
+        turnos = await self._en_ejecutor(
+            self.__clinica__.validar_turnos_lote, solicitudes
+        )
+        self.__clinica__._registrar_turnos(turnos)
+        return turnos
+
+    async def registrar_paciente(
+        self, nombre: str, dni: str, fecha_nacimiento: str
+    ) -> Paciente:
+        return await self._escribir(
+            self.__clinica__.registrar_paciente, nombre, dni, fecha_nacimiento
+        )
+
+    async def registrar_medico(self, nombre: str, matricula: str) -> Medico:
+        return await self._escribir(
+            self.__clinica__.registrar_medico, nombre, matricula
+        )
+
+    async def agregar_especialidad_a_medico(
+        self, matricula: str, tipo_especialidad: str, dias: list[str]
+    ) -> Especialidad:
+        return await self._escribir(
+            self.__clinica__.agregar_especialidad_a_medico,
+            matricula,
+            tipo_especialidad,
+            dias,
+        )
+
+    async def agendar_turno(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        hora: str,
+        especialidad: str,
+    ) -> Turno:
+        return await self._escribir(
+            None, dni_paciente, matricula_medico, fecha, hora, especialidad
+        )
+
+    async def agendar_turnos_lote(
+        self, solicitudes: Iterable[tuple[str, str, str, str, str]]
+    ) -> list[Turno]:
+        return await self._escribir(self._agendar_lote, list(solicitudes))
+
+    async def completar_turno(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return await self._escribir(
+            self.__clinica__.completar_turno, identificador, version
+        )
+
+    async def cancelar_turno(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return await self._escribir(
+            self.__clinica__.cancelar_turno, identificador, version
+        )
+
+    async def registrar_ausencia(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return await self._escribir(
+            self.__clinica__.registrar_ausencia, identificador, version
+        )
+
+    async def barrer_turnos_vencidos(
+        self,
+        ahora: datetime | None = None,
+        estado: EstadoTurno | str = EstadoTurno.COMPLETADO,
+        limite: int | None = None,
+    ) -> list[Turno]:
+        return await self._escribir(
+            self.__clinica__.barrer_turnos_vencidos, ahora, estado, limite
+        )
+
+    async def emitir_receta(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        medicamentos: list[str],
+        indicaciones: str,
+        version_historia: int | None = None,
+    ) -> Receta:
+        return await self._escribir(
+            self.__clinica__.emitir_receta,
+            dni_paciente,
+            matricula_medico,
+            fecha,
+            medicamentos,
+            indicaciones,
+            version_historia,
+        )
+
+    async def buscar_paciente(self, dni: str) -> Paciente:
+        return self.__clinica__.buscar_paciente(dni)
+
+    async def buscar_medico(self, matricula: str) -> Medico:
+        return self.__clinica__.buscar_medico(matricula)
+
+    async def buscar_turno(self, identificador: int) -> Turno:
+        return self.__clinica__.buscar_turno(identificador)
+
+    async def buscar_medicos_por_especialidad(self, especialidad: str) -> list[Medico]:
+        return self.__clinica__.buscar_medicos_por_especialidad(especialidad)
+
+    async def buscar_medicos_por_especialidad_y_dia(
+        self, especialidad: str, dia: str
+    ) -> list[Medico]:
+        return self.__clinica__.buscar_medicos_por_especialidad_y_dia(especialidad, dia)
+
+    async def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> list[Turno]:
+        return list(self.__clinica__.obtener_turnos_medico(matricula, desde, hasta))
+
+    async def buscar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: str,
+        hasta: str,
+        duracion: int,
+        cantidad: int | None = None,
+        hora_inicio: str = "08:00",
+        hora_fin: str = "18:00",
+    ) -> list[tuple[str, str, str]]:
+        return list(
+            self.__clinica__.buscar_turnos_disponibles(
+                especialidad, desde, hasta, duracion, cantidad, hora_inicio, hora_fin
+            )
+        )
+
+    async def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        return self.__clinica__.obtener_historia_clinica(dni_paciente)
+
+    async def contar_pacientes(self) -> int:
+        return self.__clinica__.contar_pacientes()
+
+    async def contar_medicos(self) -> int:
+        return self.__clinica__.contar_medicos()
+
+    async def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        return self.__clinica__.contar_turnos(estado)
+
+    async def contar_turnos_medico(
+        self, matricula: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self.__clinica__.contar_turnos_medico(matricula, estado)
+
+    async def contar_turnos_dia(
+        self, fecha: str, estado: EstadoTurno | str | None = None
+    ) -> int:
+        return self.__clinica__.contar_turnos_dia(fecha, estado)
+
+    async def iter_pacientes(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Paciente]:
+        return list(self.__clinica__.iter_pacientes(despues_de, limite, descendente))
+
+    async def iter_medicos(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Medico]:
+        return list(self.__clinica__.iter_medicos(despues_de, limite, descendente))
+
+    async def iter_turnos(
+        self,
+        despues_de: int | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> list[Turno]:
+        return list(self.__clinica__.iter_turnos(despues_de, limite, descendente))
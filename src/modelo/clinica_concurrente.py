@@ -0,0 +1,203 @@
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from .clinica import Clinica
+from .cerrojos import CerrojosRayados
+from .paciente import Paciente
+from .medico import Medico
+from .especialidad import Especialidad
+from .turno import Turno, EstadoTurno
+from .receta import Receta
+from .historia_clinica import HistoriaClinica
+
+
+class ClinicaConcurrente(Clinica):
+
+    def __init__(self, *argumentos, franjas: int = 64, **opciones):
+        self.__cerrojos__ = CerrojosRayados(franjas)
+        self.__registro__ = threading.Lock()
+        super().__init__(*argumentos, **opciones)
+
+    def _bloquear(self, matriculas: Iterable[str] = (), dnis: Iterable[str] = ()):
+        return self.__cerrojos__.bloquear(
+            [("medico", matricula) for matricula in matriculas]
+            + [("paciente", dni) for dni in dnis]
+        )
+
+    def registrar_paciente(
+        self, nombre: str, dni: str, fecha_nacimiento: str
+    ) -> Paciente:
+        with self._bloquear(dnis=[dni]), self.__registro__:
+            return super().registrar_paciente(nombre, dni, fecha_nacimiento)
+
+    def registrar_medico(self, nombre: str, matricula: str) -> Medico:
+        with self._bloquear([matricula]), self.__registro__:
+            return super().registrar_medico(nombre, matricula)
+
+    def agregar_especialidad_a_medico(
+        self, matricula: str, tipo_especialidad: str, dias: list[str]
+    ) -> Especialidad:
+        with self._bloquear([matricula]), self.__registro__:
+            return super().agregar_especialidad_a_medico(
+                matricula, tipo_especialidad, dias
+            )
+
+    def agendar_turno(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        hora: str,
+        especialidad: str,
+    ) -> Turno:
+        with self._bloquear([matricula_medico], [dni_paciente]):
+            return super().agendar_turno(
+                dni_paciente, matricula_medico, fecha, hora, especialidad
+            )
+
+    def agendar_turnos_lote(
+        self, solicitudes: Iterable[tuple[str, str, str, str, str]]
+    ) -> list[Turno]:
+
+        solicitudes = list(solicitudes)
+        completas = [
+            solicitud
+            for solicitud in solicitudes
+            if isinstance(solicitud, (tuple, list))
+            and len(solicitud) == 5
+            and isinstance(solicitud[0], str)
+            and isinstance(solicitud[1], str)
+        ]
+        with self._bloquear(
+            [solicitud[1] for solicitud in completas],
+            [solicitud[0] for solicitud in completas],
+        ):
+            return super().agendar_turnos_lote(solicitudes)
+
+    def _registrar_turnos(self, turnos: list[Turno]):
+        with self.__registro__:
+            super()._registrar_turnos(turnos)
+
+    def completar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._cambiar_estado_turno(
+            identificador, version, super().completar_turno
+        )
+
+    def cancelar_turno(self, identificador: int, version: int | None = None) -> Turno:
+        return self._cambiar_estado_turno(
+            identificador, version, super().cancelar_turno
+        )
+
+    def registrar_ausencia(
+        self, identificador: int, version: int | None = None
+    ) -> Turno:
+        return self._cambiar_estado_turno(
+            identificador, version, super().registrar_ausencia
+        )
+
+    def _extraer_vencidos(self, ahora: datetime, limite: int | None) -> list[int]:
+        with self.__registro__:
+            return super()._extraer_vencidos(ahora, limite)
+
+    def _cambiar_estado_turno(
+        self, identificador: int, version: int | None, cambiar
+    ) -> Turno:
+        turno = self.buscar_turno(identificador)
+        with self._bloquear(
+            [turno.obtener_medico().obtener_matricula()],
+            [turno.obtener_paciente().obtener_dni()],
+        ):
+            return cambiar(identificador, version)
+
+    def _al_cambiar_estado_turno(self, turno: Turno, estado_anterior: EstadoTurno):
+        with self.__registro__:
+            super()._al_cambiar_estado_turno(turno, estado_anterior)
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> Iterator[Turno]:
+        with self._bloquear([matricula]):
+            return iter(list(super().obtener_turnos_medico(matricula, desde, hasta)))
+
+    def buscar_turnos_disponibles(
+        self,
+        especialidad: str,
+        desde: str,
+        hasta: str,
+        duracion: int,
+        cantidad: int | None = None,
+        hora_inicio: str = "08:00",
+        hora_fin: str = "18:00",
+    ) -> Iterator[tuple[str, str, str]]:
+
+        matriculas = [
+            medico.obtener_matricula()
+            for medico in self.buscar_medicos_por_especialidad(especialidad)
+        ]
+        with self._bloquear(matriculas):
+            return iter(
+                list(
+                    super().buscar_turnos_disponibles(
+                        especialidad,
+                        desde,
+                        hasta,
+                        duracion,
+                        cantidad,
+                        hora_inicio,
+                        hora_fin,
+                    )
+                )
+            )
+
+    def emitir_receta(
+        self,
+        dni_paciente: str,
+        matricula_medico: str,
+        fecha: str,
+        medicamentos: list[str],
+        indicaciones: str,
+        version_historia: int | None = None,
+    ) -> Receta:
+        with self._bloquear([matricula_medico], [dni_paciente]):
+            receta = self._crear_receta(
+                dni_paciente, matricula_medico, fecha, medicamentos, indicaciones
+            )
+            with self.__registro__:
+                self._registrar_receta(receta, version_historia)
+        return receta
+
+    def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        with self._bloquear(dnis=[dni_paciente]), self.__registro__:
+            return super().obtener_historia_clinica(dni_paciente)
+
+    def iter_turnos(
+        self,
+        despues_de: int | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Turno]:
+        with self.__registro__:
+            return iter(list(super().iter_turnos(despues_de, limite, descendente)))
+
+    def iter_pacientes(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Paciente]:
+        with self.__registro__:
+            return iter(list(super().iter_pacientes(despues_de, limite, descendente)))
+
+    def iter_medicos(
+        self,
+        despues_de: str | None = None,
+        limite: int | None = None,
+        descendente: bool = False,
+    ) -> Iterator[Medico]:
+        with self.__registro__:
+            return iter(list(super().iter_medicos(despues_de, limite, descendente)))
+
+    def confirmar(self):
+        with self.__registro__:
+            super().confirmar()
@@ -0,0 +1,35 @@
+import sys
+
+from ..excepciones import RepositorioNoDisponibleException
+from .clinica import Clinica
+
+
+class ConfirmadorEscrituras:
+
+    def __init__(self, clinica: Clinica):
+        self.__clinica__ = clinica
+        self.__error__ = None
+
+    def obtener_error(self) -> Exception | None:
+        return self.__error__
+
+    def verificar_disponible(self):
+        if self.__error__ is None:
+            return
+        try:
+            self.__clinica__.confirmar()
+        except Exception as e:
+            self.__error__ = e
+            raise RepositorioNoDisponibleException(
+                f"El repositorio no está disponible: {e}"
+            ) from e
+        self.__error__ = None
+
+    def confirmar(self) -> bool:
+        try:
+            self.__clinica__.confirmar()
+        except Exception as e:
+            self.__error__ = e
+            print(f"No se pudo confirmar el lote: {e}", file=sys.stderr)
+            return False
+        return True
@@ -1,7 +1,10 @@
 from ..excepciones import DatosInvalidosException
+from .fechas import DIAS_SEMANA, INDICES_DIAS
 
 
 class Especialidad:
+    __slots__ = ("__tipo__", "__dias__")
+
     def __init__(self, tipo: str, dias: list[str]):
         if not tipo or not isinstance(tipo, str):
             raise DatosInvalidosException(
@@ -12,47 +15,44 @@ class Especialidad:
                 "Debe especificar al menos un día de atención"
             )
 
-        dias_validos = [
-            "lunes",
-            "martes",
-            "miercoles",
-            "miércoles",
-            "jueves",
-            "viernes",
-            "sabado",
-            "sábado",
-            "domingo",
-        ]
-        dias_normalizados = []
+        mascara = 0
         for dia in dias:
-            dia_lower = dia.lower()
-            if dia_lower not in dias_validos:
+            indice = INDICES_DIAS.get(dia.lower())
+            if indice is None:
                 raise DatosInvalidosException(f"Día inválido: {dia}")
-
-            if dia_lower == "miercoles":
-                dia_lower = "miércoles"
-            elif dia_lower == "sabado":
-                dia_lower = "sábado"
-            dias_normalizados.append(dia_lower)
+            mascara |= 1 << indice
 
         self.__tipo__ = tipo
-        self.__dias__ = dias_normalizados
+        self.__dias__ = mascara
+
+    @classmethod
+    def reconstruir(cls, tipo: str, mascara: int) -> "Especialidad":
+
+        especialidad = cls.__new__(cls)
+        especialidad.__tipo__ = tipo
+        especialidad.__dias__ = mascara
+        return especialidad
 
     def obtener_especialidad(self) -> str:
         return self.__tipo__
 
     def verificar_dia(self, dia: str) -> bool:
+        indice = INDICES_DIAS.get(dia.lower())
+        return indice is not None and self.verificar_dia_semana(indice)
+
+    def verificar_dia_semana(self, indice: int) -> bool:
+        return bool(self.__dias__ >> indice & 1)
 
-        dia_normalizado = dia.lower()
-        if dia_normalizado == "miercoles":
-            dia_normalizado = "miércoles"
-        elif dia_normalizado == "sabado":
-            dia_normalizado = "sábado"
-        return dia_normalizado in self.__dias__
+    def obtener_mascara_dias(self) -> int:
+        return self.__dias__
 
     def obtener_dias(self) -> list[str]:
-        return self.__dias__.copy()
+        return [
+            dia
+            for indice, dia in enumerate(DIAS_SEMANA)
+            if self.verificar_dia_semana(indice)
+        ]
 
     def __str__(self) -> str:
-        dias_str = ", ".join(self.__dias__)
+        dias_str = ", ".join(self.obtener_dias())
         return f"{self.__tipo__} (Días: {dias_str})"
\ No newline at end of file
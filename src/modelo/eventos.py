@@ -0,0 +1,126 @@
+import queue
+import threading
+from collections.abc import Iterable
+from enum import Enum
+from itertools import count
+
+from ..excepciones import DatosInvalidosException
+
+
+class TipoEvento(Enum):
+    PACIENTE_REGISTRADO = "paciente_registrado"
+    MEDICO_REGISTRADO = "medico_registrado"
+    TURNO_AGENDADO = "turno_agendado"
+    TURNO_CANCELADO = "turno_cancelado"
+    TURNO_COMPLETADO = "turno_completado"
+    TURNO_AUSENTE = "turno_ausente"
+    RECETA_EMITIDA = "receta_emitida"
+
+
+class Evento:
+    __slots__ = ("__tipo__", "__secuencia__", "__objeto__")
+
+    def __init__(self, tipo: TipoEvento, secuencia: int, objeto):
+        self.__tipo__ = tipo
+        self.__secuencia__ = secuencia
+        self.__objeto__ = objeto
+
+    def obtener_tipo(self) -> TipoEvento:
+        return self.__tipo__
+
+    def obtener_secuencia(self) -> int:
+        return self.__secuencia__
+
+    def obtener_objeto(self):
+        return self.__objeto__
+
+    def __repr__(self) -> str:
+        return f"Evento({self.__tipo__.value}, {self.__secuencia__})"
+
+
+class Suscripcion:
+    __slots__ = (
+        "__tipos__",
+        "__cola__",
+        "__cerrojo__",
+        "__entregados__",
+        "__descartados__",
+    )
+
+    def __init__(
+        self, tipos: Iterable[TipoEvento] | None = None, capacidad: int = 1024
+    ):
+        if not isinstance(capacidad, int) or capacidad <= 0:
+            raise DatosInvalidosException(
+                "La capacidad de la suscripción debe ser un entero positivo"
+            )
+        self.__tipos__ = frozenset(tipos) if tipos is not None else None
+        self.__cola__ = queue.Queue(capacidad)
+        self.__cerrojo__ = threading.Lock()
+        self.__entregados__ = 0
+        self.__descartados__ = 0
+
+    def _entregar(self, evento: Evento):
+        if self.__tipos__ is not None and evento.obtener_tipo() not in self.__tipos__:
+            return
+        try:
+            self.__cola__.put_nowait(evento)
+        except queue.Full:
+            with self.__cerrojo__:
+                self.__descartados__ += 1
+            return
+        with self.__cerrojo__:
+            self.__entregados__ += 1
+
+    def recibir(self, espera: float | None = None) -> Evento | None:
+        try:
+            return self.__cola__.get(timeout=espera)
+        except queue.Empty:
+            return None
+
+    def recibir_pendientes(self) -> list[Evento]:
+        eventos = []
+        while True:
+            try:
+                eventos.append(self.__cola__.get_nowait())
+            except queue.Empty:
+                return eventos
+
+    def contar_pendientes(self) -> int:
+        return self.__cola__.qsize()
+
+    def obtener_entregados(self) -> int:
+        return self.__entregados__
+
+    def obtener_descartados(self) -> int:
+        return self.__descartados__
+
+
+class BusEventos:
+
+    def __init__(self):
+        self.__suscripciones__ = ()
+        self.__secuencia__ = count(1)
+
+    def suscribir(
+        self, tipos: Iterable[TipoEvento] | None = None, capacidad: int = 1024
+    ) -> Suscripcion:
+        suscripcion = Suscripcion(tipos, capacidad)
+        self.__suscripciones__ += (suscripcion,)
+        return suscripcion
+
+    def desuscribir(self, suscripcion: Suscripcion):
+        self.__suscripciones__ = tuple(
+            propia for propia in self.__suscripciones__ if propia is not suscripcion
+        )
+
+    def tiene_suscriptores(self) -> bool:
+        return bool(self.__suscripciones__)
+
+    def publicar(self, tipo: TipoEvento, objeto):
+        suscripciones = self.__suscripciones__
+        if not suscripciones:
+            return
+        evento = Evento(tipo, next(self.__secuencia__), objeto)
+        for suscripcion in suscripciones:
+            suscripcion._entregar(evento)
@@ -0,0 +1,64 @@
+from datetime import date, datetime, time
+from functools import lru_cache
+from ..excepciones import DatosInvalidosException
+
+FORMATO_FECHA = "%d/%m/%Y"
+FORMATO_HORA = "%H:%M"
+
+DIAS_SEMANA = [
+    "lunes",
+    "martes",
+    "miércoles",
+    "jueves",
+    "viernes",
+    "sábado",
+    "domingo",
+]
+
+INDICES_DIAS = {
+    "lunes": 0,
+    "martes": 1,
+    "miercoles": 2,
+    "miércoles": 2,
+    "jueves": 3,
+    "viernes": 4,
+    "sabado": 5,
+    "sábado": 5,
+    "domingo": 6,
+}
+
+
+@lru_cache(maxsize=65536)
+def _parsear_fecha(texto: str) -> date:
+    return datetime.strptime(texto, FORMATO_FECHA).date()
+
+
+@lru_cache(maxsize=4096)
+def _parsear_hora(texto: str) -> time:
+    return datetime.strptime(texto, FORMATO_HORA).time()
+
+
+def parsear_fecha(texto: str) -> date:
+    try:
+        return _parsear_fecha(texto)
+    except (TypeError, ValueError):
+        raise DatosInvalidosException(
+            f"Formato de fecha inválido: {texto}. Use dd/mm/aaaa"
+        )
+
+
+def parsear_hora(texto: str) -> time:
+    try:
+        return _parsear_hora(texto)
+    except (TypeError, ValueError):
+        raise DatosInvalidosException(f"Formato de hora inválido: {texto}. Use HH:MM")
+
+
+@lru_cache(maxsize=65536)
+def formatear_fecha(fecha: date) -> str:
+    return fecha.strftime(FORMATO_FECHA)
+
+
+@lru_cache(maxsize=4096)
+def formatear_hora(hora: time) -> str:
+    return hora.strftime(FORMATO_HORA)
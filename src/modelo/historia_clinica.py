@@ -1,10 +1,13 @@
-from ..excepciones import DatosInvalidosException
+from collections.abc import Iterator
+from ..excepciones import DatosInvalidosException, VersionObsoletaException
 from .paciente import Paciente
 from .turno import Turno
 from .receta import Receta
 
 
 class HistoriaClinica:
+    __slots__ = ("__paciente__", "__turnos__", "__recetas__", "__version__")
+
     def __init__(self, paciente: Paciente):
 
         if not isinstance(paciente, Paciente):
@@ -13,6 +16,19 @@ class HistoriaClinica:
         self.__paciente__ = paciente
         self.__turnos__ = []
         self.__recetas__ = []
+        self.__version__ = 0
+
+    @classmethod
+    def reconstruir(
+        cls, paciente: Paciente, turnos: list[Turno], recetas: list[Receta]
+    ) -> "HistoriaClinica":
+
+        historia = cls.__new__(cls)
+        historia.__paciente__ = paciente
+        historia.__turnos__ = list(turnos)
+        historia.__recetas__ = list(recetas)
+        historia.__version__ = len(historia.__turnos__) + len(historia.__recetas__)
+        return historia
 
     def agregar_turno(self, turno: Turno):
 
@@ -23,8 +39,23 @@ class HistoriaClinica:
             raise DatosInvalidosException("El turno no corresponde a este paciente")
 
         self.__turnos__.append(turno)
+        self.__version__ += 1
+
+    def agregar_turnos(self, turnos: list[Turno]):
+
+        paciente = self.__paciente__
+        dni = paciente.obtener_dni()
+        for turno in turnos:
+            if not isinstance(turno, Turno):
+                raise DatosInvalidosException("Se requiere un objeto Turno válido")
+            titular = turno.obtener_paciente()
+            if titular is not paciente and titular.obtener_dni() != dni:
+                raise DatosInvalidosException("El turno no corresponde a este paciente")
+
+        self.__turnos__.extend(turnos)
+        self.__version__ += len(turnos)
 
-    def agregar_receta(self, receta: Receta):
+    def agregar_receta(self, receta: Receta, version: int | None = None):
 
         if not isinstance(receta, Receta):
             raise DatosInvalidosException("Se requiere un objeto Receta válido")
@@ -32,7 +63,19 @@ class HistoriaClinica:
         if receta.obtener_paciente().obtener_dni() != self.__paciente__.obtener_dni():
             raise DatosInvalidosException("La receta no corresponde a este paciente")
 
+        self.verificar_version(version)
         self.__recetas__.append(receta)
+        self.__version__ += 1
+
+    def obtener_version(self) -> int:
+        return self.__version__
+
+    def verificar_version(self, version: int | None):
+        if version is not None and version != self.__version__:
+            raise VersionObsoletaException(
+                f"La historia clínica está en la versión {self.__version__}, "
+                f"no en la {version}"
+            )
 
     def obtener_paciente(self) -> Paciente:
         return self.__paciente__
@@ -43,6 +86,18 @@ class HistoriaClinica:
     def obtener_recetas(self) -> list[Receta]:
         return self.__recetas__.copy()
 
+    def iter_turnos(self) -> Iterator[Turno]:
+        return iter(self.__turnos__)
+
+    def iter_recetas(self) -> Iterator[Receta]:
+        return iter(self.__recetas__)
+
+    def contar_turnos(self) -> int:
+        return len(self.__turnos__)
+
+    def contar_recetas(self) -> int:
+        return len(self.__recetas__)
+
     def __str__(self) -> str:
         return (
             f"Historia Clínica - Paciente: {self.__paciente__.obtener_nombre()} "
@@ -0,0 +1,44 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+
+class IndiceOrdenado:
+    __slots__ = ("__claves__", "__desordenado__")
+
+    def __init__(self):
+        self.__claves__ = []
+        self.__desordenado__ = False
+
+    def agregar(self, clave: str):
+        if self.__claves__ and clave < self.__claves__[-1]:
+            self.__desordenado__ = True
+        self.__claves__.append(clave)
+
+    def _ordenadas(self) -> list[str]:
+        if self.__desordenado__:
+            self.__claves__.sort()
+            self.__desordenado__ = False
+        return self.__claves__
+
+    def iter_claves(
+        self, despues_de: str | None = None, descendente: bool = False
+    ) -> Iterator[str]:
+
+        cursor = despues_de
+        while True:
+            claves = self._ordenadas()
+            if descendente:
+                posicion = (
+                    len(claves) if cursor is None else bisect_left(claves, cursor)
+                ) - 1
+                if posicion < 0:
+                    return
+            else:
+                posicion = 0 if cursor is None else bisect_right(claves, cursor)
+                if posicion >= len(claves):
+                    return
+            cursor = claves[posicion]
+            yield cursor
+
+    def __len__(self) -> int:
+        return len(self.__claves__)
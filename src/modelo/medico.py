@@ -1,8 +1,15 @@
 from ..excepciones import DatosInvalidosException
 from .especialidad import Especialidad
+from .fechas import DIAS_SEMANA, INDICES_DIAS
 
 
 class Medico:
+    __slots__ = (
+        "__nombre__",
+        "__matricula__",
+        "__especialidades__",
+        "__especialidad_por_dia__",
+    )
 
     def __init__(self, nombre: str, matricula: str):
 
@@ -14,9 +21,16 @@ class Medico:
         self.__nombre__ = nombre
         self.__matricula__ = matricula
         self.__especialidades__ = []
+        self.__especialidad_por_dia__ = [None] * len(DIAS_SEMANA)
 
     def agregar_especialidad(self, especialidad: Especialidad):
 
+        self.verificar_especialidad(especialidad)
+        self.__especialidades__.append(especialidad)
+        self._indexar_dias()
+
+    def verificar_especialidad(self, especialidad: Especialidad):
+
         if not isinstance(especialidad, Especialidad):
             raise DatosInvalidosException(
                 "Debe proporcionar un objeto de tipo Especialidad"
@@ -28,7 +42,29 @@ class Medico:
                     f"El médico ya tiene la especialidad {especialidad.obtener_especialidad()}"
                 )
 
-        self.__especialidades__.append(especialidad)
+    @classmethod
+    def reconstruir(
+        cls, nombre: str, matricula: str, especialidades: list[Especialidad]
+    ) -> "Medico":
+
+        medico = cls.__new__(cls)
+        medico.__nombre__ = nombre
+        medico.__matricula__ = matricula
+        medico.__especialidades__ = list(especialidades)
+        medico.__especialidad_por_dia__ = [None] * len(DIAS_SEMANA)
+        medico._indexar_dias()
+        return medico
+
+    def _indexar_dias(self):
+        for indice in range(len(DIAS_SEMANA)):
+            self.__especialidad_por_dia__[indice] = next(
+                (
+                    esp.obtener_especialidad()
+                    for esp in self.__especialidades__
+                    if esp.verificar_dia_semana(indice)
+                ),
+                None,
+            )
 
     def obtener_matricula(self) -> str:
         return self.__matricula__
@@ -37,10 +73,13 @@ class Medico:
         return self.__nombre__
 
     def obtener_especialidad_para_dia(self, dia: str) -> str | None:
-        for especialidad in self.__especialidades__:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-        return None
+        indice = INDICES_DIAS.get(dia.lower())
+        if indice is None:
+            return None
+        return self.__especialidad_por_dia__[indice]
+
+    def obtener_especialidad_para_dia_semana(self, indice: int) -> str | None:
+        return self.__especialidad_por_dia__[indice]
 
     def obtener_especialidades(self) -> list[Especialidad]:
         return self.__especialidades__.copy()
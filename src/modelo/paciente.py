@@ -1,8 +1,10 @@
-from datetime import datetime
+from datetime import date
 from ..excepciones import DatosInvalidosException
+from .fechas import parsear_fecha, formatear_fecha
 
 
 class Paciente:
+    __slots__ = ("__nombre__", "__dni__", "__fecha_nacimiento__")
 
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
 
@@ -15,16 +17,18 @@ class Paciente:
                 "La fecha de nacimiento es requerida y debe ser texto"
             )
 
-        try:
-            datetime.strptime(fecha_nacimiento, "%d/%m/%Y")
-        except ValueError:
-            raise DatosInvalidosException(
-                f"Formato de fecha inválido: {fecha_nacimiento}. Use dd/mm/aaaa"
-            )
-
         self.__nombre__ = nombre
         self.__dni__ = dni
-        self.__fecha_nacimiento__ = fecha_nacimiento
+        self.__fecha_nacimiento__ = parsear_fecha(fecha_nacimiento)
+
+    @classmethod
+    def reconstruir(cls, nombre: str, dni: str, fecha_nacimiento: date) -> "Paciente":
+
+        paciente = cls.__new__(cls)
+        paciente.__nombre__ = nombre
+        paciente.__dni__ = dni
+        paciente.__fecha_nacimiento__ = fecha_nacimiento
+        return paciente
 
     def obtener_dni(self) -> str:
         return self.__dni__
@@ -33,7 +37,7 @@ class Paciente:
         return self.__nombre__
 
     def obtener_fecha_nacimiento(self) -> str:
-        return self.__fecha_nacimiento__
+        return formatear_fecha(self.__fecha_nacimiento__)
 
     def __str__(self) -> str:
-        return f"Paciente: {self.__nombre__} (DNI: {self.__dni__}, Nacimiento: {self.__fecha_nacimiento__})"
\ No newline at end of file
+        return f"Paciente: {self.__nombre__} (DNI: {self.__dni__}, Nacimiento: {self.obtener_fecha_nacimiento()})"
\ No newline at end of file
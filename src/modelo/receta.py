@@ -1,10 +1,19 @@
-from datetime import datetime
+from datetime import date
 from ..excepciones import DatosInvalidosException
+from .fechas import parsear_fecha, formatear_fecha
 from .paciente import Paciente
 from .medico import Medico
 
 
 class Receta:
+    __slots__ = (
+        "__paciente__",
+        "__medico__",
+        "__fecha__",
+        "__medicamentos__",
+        "__indicaciones__",
+    )
+
     def __init__(
         self,
         paciente: Paciente,
@@ -27,12 +36,7 @@ class Receta:
                 "Las indicaciones son requeridas y deben ser texto"
             )
 
-        try:
-            datetime.strptime(fecha, "%d/%m/%Y")
-        except ValueError:
-            raise DatosInvalidosException(
-                f"Formato de fecha inválido: {fecha}. Use dd/mm/aaaa"
-            )
+        fecha_obj = parsear_fecha(fecha)
 
         for medicamento in medicamentos:
             if not medicamento or not isinstance(medicamento, str):
@@ -42,10 +46,28 @@ class Receta:
 
         self.__paciente__ = paciente
         self.__medico__ = medico
-        self.__fecha__ = fecha
-        self.__medicamentos__ = medicamentos.copy()
+        self.__fecha__ = fecha_obj
+        self.__medicamentos__ = tuple(medicamentos)
         self.__indicaciones__ = indicaciones
 
+    @classmethod
+    def reconstruir(
+        cls,
+        paciente: Paciente,
+        medico: Medico,
+        fecha: date,
+        medicamentos: tuple[str, ...],
+        indicaciones: str,
+    ) -> "Receta":
+
+        receta = cls.__new__(cls)
+        receta.__paciente__ = paciente
+        receta.__medico__ = medico
+        receta.__fecha__ = fecha
+        receta.__medicamentos__ = tuple(medicamentos)
+        receta.__indicaciones__ = indicaciones
+        return receta
+
     def obtener_paciente(self) -> Paciente:
         return self.__paciente__
 
@@ -53,10 +75,10 @@ class Receta:
         return self.__medico__
 
     def obtener_fecha(self) -> str:
-        return self.__fecha__
+        return formatear_fecha(self.__fecha__)
 
     def obtener_medicamentos(self) -> list[str]:
-        return self.__medicamentos__.copy()
+        return list(self.__medicamentos__)
 
     def obtener_indicaciones(self) -> str:
         return self.__indicaciones__
@@ -64,7 +86,7 @@ class Receta:
     def __str__(self) -> str:
         medicamentos_str = ", ".join(self.__medicamentos__)
         return (
-            f"Receta: {self.__fecha__} - "
+            f"Receta: {self.obtener_fecha()} - "
             f"Paciente: {self.__paciente__.obtener_nombre()} (DNI: {self.__paciente__.obtener_dni()}) - "
             f"Médico: {self.__medico__.obtener_nombre()} - "
             f"Medicamentos: {medicamentos_str}"
@@ -1,14 +1,43 @@
 from datetime import datetime
+from enum import Enum
 from ..excepciones import (
     DatosInvalidosException,
     MedicoNoDisponibleException,
     EspecialidadInvalidaException,
+    EstadoTurnoInvalidoException,
+    VersionObsoletaException,
 )
 from .paciente import Paciente
 from .medico import Medico
+from .fechas import (
+    DIAS_SEMANA,
+    parsear_fecha,
+    parsear_hora,
+    formatear_fecha,
+    formatear_hora,
+)
+
+
+class EstadoTurno(Enum):
+    PROGRAMADO = "Programado"
+    COMPLETADO = "Completado"
+    CANCELADO = "Cancelado"
+    AUSENTE = "Ausente"
 
 
 class Turno:
+    __slots__ = (
+        "__paciente__",
+        "__medico__",
+        "__fecha_hora__",
+        "__especialidad__",
+        "__estado__",
+        "__observadores__",
+        "__id__",
+        "__version__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         paciente: Paciente,
@@ -31,45 +60,71 @@ class Turno:
                 "La especialidad es requerida y debe ser texto"
             )
 
-        try:
-            fecha_obj = datetime.strptime(fecha, "%d/%m/%Y")
-            dia_semana = [
-                "lunes",
-                "martes",
-                "miércoles",
-                "jueves",
-                "viernes",
-                "sábado",
-                "domingo",
-            ][fecha_obj.weekday()]
-
-            esp_disponible = medico.obtener_especialidad_para_dia(dia_semana)
-            if not esp_disponible:
-                raise MedicoNoDisponibleException(
-                    f"El médico no atiende los {dia_semana}"
-                )
-            if esp_disponible != especialidad:
-                raise EspecialidadInvalidaException(
-                    f"El médico atiende {esp_disponible} los {dia_semana}, no {especialidad}"
-                )
-        except ValueError:
-            raise DatosInvalidosException(
-                f"Formato de fecha inválido: {fecha}. Use dd/mm/aaaa"
-            )
+        fecha_obj = parsear_fecha(fecha)
+        dia_semana = fecha_obj.weekday()
 
-        try:
-            datetime.strptime(hora, "%H:%M")
-        except ValueError:
-            raise DatosInvalidosException(
-                f"Formato de hora inválido: {hora}. Use HH:MM"
+        esp_disponible = medico.obtener_especialidad_para_dia_semana(dia_semana)
+        if not esp_disponible:
+            raise MedicoNoDisponibleException(
+                f"El médico no atiende los {DIAS_SEMANA[dia_semana]}"
+            )
+        if esp_disponible != especialidad:
+            raise EspecialidadInvalidaException(
+                f"El médico atiende {esp_disponible} los {DIAS_SEMANA[dia_semana]}, "
+                f"no {especialidad}"
             )
 
+        hora_obj = parsear_hora(hora)
+
         self.__paciente__ = paciente
         self.__medico__ = medico
-        self.__fecha__ = fecha
-        self.__hora__ = hora
+        self.__fecha_hora__ = datetime.combine(fecha_obj, hora_obj)
         self.__especialidad__ = especialidad
-        self.__estado__ = "Programado"
+        self.__estado__ = EstadoTurno.PROGRAMADO
+        self.__observadores__ = ()
+        self.__id__ = None
+        self.__version__ = 0
+
+    @classmethod
+    def reconstruir(
+        cls,
+        paciente: Paciente,
+        medico: Medico,
+        fecha_hora: datetime,
+        especialidad: str,
+        estado: EstadoTurno,
+        identificador: int | None = None,
+        version: int | None = None,
+    ) -> "Turno":
+
+        turno = cls.__new__(cls)
+        turno.__paciente__ = paciente
+        turno.__medico__ = medico
+        turno.__fecha_hora__ = fecha_hora
+        turno.__especialidad__ = especialidad
+        turno.__estado__ = estado
+        turno.__observadores__ = ()
+        turno.__id__ = identificador
+        turno.__version__ = (
+            version
+            if version is not None
+            else int(estado is not EstadoTurno.PROGRAMADO)
+        )
+        return turno
+
+    def __reduce__(self):
+        return (
+            Turno.reconstruir,
+            (
+                self.__paciente__,
+                self.__medico__,
+                self.__fecha_hora__,
+                self.__especialidad__,
+                self.__estado__,
+                self.__id__,
+                self.__version__,
+            ),
+        )
 
     def obtener_paciente(self) -> Paciente:
         return self.__paciente__
@@ -78,27 +133,70 @@ class Turno:
         return self.__medico__
 
     def obtener_fecha(self) -> str:
-        return self.__fecha__
+        return formatear_fecha(self.__fecha_hora__.date())
 
     def obtener_hora(self) -> str:
-        return self.__hora__
+        return formatear_hora(self.__fecha_hora__.time())
 
     def obtener_especialidad(self) -> str:
         return self.__especialidad__
 
     def obtener_estado(self) -> str:
+        return self.__estado__.value
+
+    def obtener_estado_turno(self) -> EstadoTurno:
         return self.__estado__
 
-    def marcar_completado(self):
-        self.__estado__ = "Completado"
+    def obtener_fecha_hora(self) -> datetime:
+        return self.__fecha_hora__
+
+    def obtener_id(self) -> int | None:
+        return self.__id__
+
+    def obtener_version(self) -> int:
+        return self.__version__
+
+    def asignar_id(self, identificador: int):
+        if self.__id__ is not None:
+            raise DatosInvalidosException("El turno ya tiene un identificador asignado")
+        self.__id__ = identificador
+
+    def agregar_observador(self, observador):
+        self.__observadores__ += (observador,)
 
-    def marcar_cancelado(self):
-        self.__estado__ = "Cancelado"
+    def marcar_completado(self, version: int | None = None):
+        self._cambiar_estado(EstadoTurno.COMPLETADO, version)
+
+    def marcar_cancelado(self, version: int | None = None):
+        self._cambiar_estado(EstadoTurno.CANCELADO, version)
+
+    def marcar_ausente(self, version: int | None = None):
+        self._cambiar_estado(EstadoTurno.AUSENTE, version)
+
+    def _cambiar_estado(self, estado: EstadoTurno, version: int | None = None):
+        anterior = self.__estado__
+        if version is not None and version != self.__version__:
+            raise VersionObsoletaException(
+                f"El turno está en la versión {self.__version__}, no en la {version}"
+            )
+        if anterior is not EstadoTurno.PROGRAMADO:
+            raise EstadoTurnoInvalidoException(
+                f"No se puede pasar un turno {anterior.value} a {estado.value}"
+            )
+        self.__estado__ = estado
+        self.__version__ += 1
+        try:
+            for observador in self.__observadores__:
+                observador(self, anterior)
+        except Exception:
+            self.__estado__ = anterior
+            self.__version__ -= 1
+            raise
 
     def __str__(self) -> str:
         return (
-            f"Turno: {self.__fecha__} a las {self.__hora__} - "
+            f"Turno: {self.obtener_fecha()} a las {self.obtener_hora()} - "
             f"Paciente: {self.__paciente__.obtener_nombre()} (DNI: {self.__paciente__.obtener_dni()}) - "
             f"Médico: {self.__medico__.obtener_nombre()} - "
-            f"Especialidad: {self.__especialidad__} - Estado: {self.__estado__}"
+            f"Especialidad: {self.__especialidad__} - Estado: {self.__estado__.value}"
         )
\ No newline at end of file
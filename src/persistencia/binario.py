@@ -0,0 +1,441 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta
+
+from ..excepciones import (
+    DatosInvalidosException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    TurnoNoEncontradoException,
+)
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from ..modelo.historia_clinica import HistoriaClinica
+from ..modelo.almacen_turnos import ESTADOS, CODIGOS_ESTADO, EPOCA, UN_MINUTO
+from ..modelo.fechas import parsear_fecha
+
+FIRMA = b"CLNB"
+VERSION = 1
+
+SECCIONES = (
+    "cadenas",
+    "texto",
+    "especialidades",
+    "medicos",
+    "pacientes",
+    "turnos",
+    "recetas",
+    "medicamentos",
+    "turnos_medico",
+    "turnos_paciente",
+    "conteo_estados",
+)
+
+CABECERA = struct.Struct("<4sHH" + "QI" * len(SECCIONES))
+INDICE = struct.Struct("<I")
+ESPECIALIDAD = struct.Struct("<II")
+MEDICO = struct.Struct("<IIIIII")
+PACIENTE = struct.Struct("<IIIIIII")
+TURNO = struct.Struct("<IIqIB")
+RECETA = struct.Struct("<IIIIII")
+
+ALINEACION = 8
+
+
+def _internar(cadenas: dict, texto: str) -> int:
+    return cadenas.setdefault(texto, len(cadenas))
+
+
+def _empaquetar_indices(indices: list[int]) -> bytes:
+    return struct.pack(f"<{len(indices)}I", *indices)
+
+
+def volcar_instantanea_binaria(clinica) -> bytes:
+
+    cadenas = {}
+    medicos = sorted(clinica.listar_medicos(), key=Medico.obtener_matricula)
+    pacientes = sorted(clinica.listar_pacientes(), key=Paciente.obtener_dni)
+    indices_medicos = {
+        medico.obtener_matricula(): indice for indice, medico in enumerate(medicos)
+    }
+    indices_pacientes = {
+        paciente.obtener_dni(): indice for indice, paciente in enumerate(pacientes)
+    }
+
+    turnos = bytearray()
+    minutos = []
+    por_medico = [[] for _ in medicos]
+    conteo_estados = [0] * len(ESTADOS)
+    for identificador, turno in enumerate(clinica.iter_turnos()):
+        if turno.obtener_id() != identificador:
+            raise DatosInvalidosException(
+                f"El turno {turno.obtener_id()} no tiene un identificador consecutivo"
+            )
+        medico = indices_medicos[turno.obtener_medico().obtener_matricula()]
+        codigo = CODIGOS_ESTADO[turno.obtener_estado_turno()]
+        minuto = (turno.obtener_fecha_hora() - EPOCA) // UN_MINUTO
+        turnos += TURNO.pack(
+            indices_pacientes[turno.obtener_paciente().obtener_dni()],
+            medico,
+            minuto,
+            _internar(cadenas, turno.obtener_especialidad()),
+            codigo,
+        )
+        minutos.append(minuto)
+        por_medico[medico].append(identificador)
+        conteo_estados[codigo] += 1
+
+    especialidades = bytearray()
+    registros_medicos = bytearray()
+    turnos_medico = []
+    cantidad_especialidades = 0
+    for medico, identificadores in zip(medicos, por_medico):
+        propias = medico.obtener_especialidades()
+        for especialidad in propias:
+            especialidades += ESPECIALIDAD.pack(
+                _internar(cadenas, especialidad.obtener_especialidad()),
+                especialidad.obtener_mascara_dias(),
+            )
+        identificadores.sort(key=minutos.__getitem__)
+        registros_medicos += MEDICO.pack(
+            _internar(cadenas, medico.obtener_matricula()),
+            _internar(cadenas, medico.obtener_nombre()),
+            cantidad_especialidades,
+            len(propias),
+            len(turnos_medico),
+            len(identificadores),
+        )
+        cantidad_especialidades += len(propias)
+        turnos_medico.extend(identificadores)
+
+    registros_pacientes = bytearray()
+    recetas = bytearray()
+    medicamentos = []
+    turnos_paciente = []
+    cantidad_recetas = 0
+    for paciente in pacientes:
+        historia = clinica.obtener_historia_clinica(paciente.obtener_dni())
+        propios = [turno.obtener_id() for turno in historia.iter_turnos()]
+        propias = list(historia.iter_recetas())
+        for receta in propias:
+            lista = receta.obtener_medicamentos()
+            recetas += RECETA.pack(
+                indices_pacientes[paciente.obtener_dni()],
+                indices_medicos[receta.obtener_medico().obtener_matricula()],
+                parsear_fecha(receta.obtener_fecha()).toordinal(),
+                len(medicamentos),
+                len(lista),
+                _internar(cadenas, receta.obtener_indicaciones()),
+            )
+            medicamentos.extend(_internar(cadenas, texto) for texto in lista)
+        registros_pacientes += PACIENTE.pack(
+            _internar(cadenas, paciente.obtener_dni()),
+            _internar(cadenas, paciente.obtener_nombre()),
+            parsear_fecha(paciente.obtener_fecha_nacimiento()).toordinal(),
+            len(turnos_paciente),
+            len(propios),
+            cantidad_recetas,
+            len(propias),
+        )
+        cantidad_recetas += len(propias)
+        turnos_paciente.extend(propios)
+
+    texto = bytearray()
+    desplazamientos = [0]
+    for cadena in cadenas:
+        texto += cadena.encode()
+        desplazamientos.append(len(texto))
+
+    contenidos = {
+        "cadenas": (_empaquetar_indices(desplazamientos), len(desplazamientos)),
+        "texto": (texto, len(texto)),
+        "especialidades": (especialidades, cantidad_especialidades),
+        "medicos": (registros_medicos, len(medicos)),
+        "pacientes": (registros_pacientes, len(pacientes)),
+        "turnos": (turnos, len(minutos)),
+        "recetas": (recetas, cantidad_recetas),
+        "medicamentos": (_empaquetar_indices(medicamentos), len(medicamentos)),
+        "turnos_medico": (_empaquetar_indices(turnos_medico), len(turnos_medico)),
+        "turnos_paciente": (
+            _empaquetar_indices(turnos_paciente),
+            len(turnos_paciente),
+        ),
+        "conteo_estados": (_empaquetar_indices(conteo_estados), len(ESTADOS)),
+    }
+
+    cuerpo = bytearray()
+    ubicaciones = []
+    for nombre in SECCIONES:
+        datos, cantidad = contenidos[nombre]
+        cuerpo += bytes(-(CABECERA.size + len(cuerpo)) % ALINEACION)
+        ubicaciones += (CABECERA.size + len(cuerpo), cantidad)
+        cuerpo += datos
+
+    return CABECERA.pack(FIRMA, VERSION, len(SECCIONES), *ubicaciones) + cuerpo
+
+
+def escribir_instantanea_binaria(clinica, ruta: str):
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(volcar_instantanea_binaria(clinica))
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+class InstantaneaBinaria:
+
+    def __init__(self, datos):
+
+        vista = memoryview(datos).cast("B")
+        if len(vista) < CABECERA.size:
+            vista.release()
+            raise DatosInvalidosException("La instantánea binaria está incompleta")
+
+        firma, version, cantidad, *ubicaciones = CABECERA.unpack_from(vista)
+        if firma != FIRMA or version != VERSION or cantidad != len(SECCIONES):
+            vista.release()
+            raise DatosInvalidosException(
+                "El archivo no es una instantánea binaria compatible"
+            )
+
+        self.__datos__ = vista
+        self.__secciones__ = {
+            nombre: (ubicaciones[2 * i], ubicaciones[2 * i + 1])
+            for i, nombre in enumerate(SECCIONES)
+        }
+        self.__mapa__ = None
+        self.__archivo__ = None
+
+        self.__pacientes__ = {}
+        self.__medicos__ = {}
+        self.__turnos__ = {}
+        self.__busquedas__ = {}
+
+    @classmethod
+    def abrir(cls, ruta: str) -> "InstantaneaBinaria":
+
+        archivo = open(ruta, "rb")
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            archivo.close()
+            raise DatosInvalidosException(f"La instantánea {ruta} está vacía")
+
+        try:
+            instantanea = cls(mapa)
+        except DatosInvalidosException:
+            mapa.close()
+            archivo.close()
+            raise
+        instantanea.__mapa__ = mapa
+        instantanea.__archivo__ = archivo
+        return instantanea
+
+    def cerrar(self):
+        self.__datos__.release()
+        if self.__mapa__ is not None:
+            self.__mapa__.close()
+            self.__archivo__.close()
+
+    def _registro(self, seccion: str, estructura: struct.Struct, indice: int) -> tuple:
+        inicio, _ = self.__secciones__[seccion]
+        return estructura.unpack_from(self.__datos__, inicio + indice * estructura.size)
+
+    def _indices(self, seccion: str, primero: int, cantidad: int) -> tuple:
+        inicio, _ = self.__secciones__[seccion]
+        return struct.unpack_from(
+            f"<{cantidad}I", self.__datos__, inicio + primero * INDICE.size
+        )
+
+    def _cantidad(self, seccion: str) -> int:
+        return self.__secciones__[seccion][1]
+
+    def _cadena(self, indice: int) -> str:
+        desde, hasta = self._indices("cadenas", indice, 2)
+        inicio, _ = self.__secciones__["texto"]
+        return str(self.__datos__[inicio + desde : inicio + hasta], "utf-8")
+
+    def _buscar(
+        self, seccion: str, estructura: struct.Struct, clave: str
+    ) -> int | None:
+        indice = self.__busquedas__.get((seccion, clave))
+        if indice is None:
+            indice = self._bisecar(seccion, estructura, clave)
+            if indice is not None:
+                self.__busquedas__[(seccion, clave)] = indice
+        return indice
+
+    def _bisecar(
+        self, seccion: str, estructura: struct.Struct, clave: str
+    ) -> int | None:
+        cantidad = self._cantidad(seccion)
+        indice = bisect_left(
+            range(cantidad),
+            clave,
+            key=lambda i: self._cadena(self._registro(seccion, estructura, i)[0]),
+        )
+        if (
+            indice < cantidad
+            and self._cadena(self._registro(seccion, estructura, indice)[0]) == clave
+        ):
+            return indice
+        return None
+
+    def _paciente(self, indice: int) -> Paciente:
+        paciente = self.__pacientes__.get(indice)
+        if paciente is None:
+            dni, nombre, nacimiento, *_ = self._registro("pacientes", PACIENTE, indice)
+            paciente = self.__pacientes__[indice] = Paciente.reconstruir(
+                self._cadena(nombre), self._cadena(dni), date.fromordinal(nacimiento)
+            )
+        return paciente
+
+    def _medico(self, indice: int) -> Medico:
+        medico = self.__medicos__.get(indice)
+        if medico is None:
+            matricula, nombre, primera, cantidad, _, _ = self._registro(
+                "medicos", MEDICO, indice
+            )
+            especialidades = []
+            for posicion in range(primera, primera + cantidad):
+                tipo, mascara = self._registro("especialidades", ESPECIALIDAD, posicion)
+                especialidades.append(
+                    Especialidad.reconstruir(self._cadena(tipo), mascara)
+                )
+            medico = self.__medicos__[indice] = Medico.reconstruir(
+                self._cadena(nombre), self._cadena(matricula), especialidades
+            )
+        return medico
+
+    def _turno(self, identificador: int) -> Turno:
+        turno = self.__turnos__.get(identificador)
+        if turno is None:
+            paciente, medico, minuto, especialidad, codigo = self._registro(
+                "turnos", TURNO, identificador
+            )
+            turno = self.__turnos__[identificador] = Turno.reconstruir(
+                self._paciente(paciente),
+                self._medico(medico),
+                EPOCA + minuto * UN_MINUTO,
+                self._cadena(especialidad),
+                ESTADOS[codigo],
+                identificador,
+            )
+        return turno
+
+    def _receta(self, indice: int) -> Receta:
+        paciente, medico, fecha, primero, cantidad, indicaciones = self._registro(
+            "recetas", RECETA, indice
+        )
+        return Receta.reconstruir(
+            self._paciente(paciente),
+            self._medico(medico),
+            date.fromordinal(fecha),
+            tuple(
+                self._cadena(medicamento)
+                for medicamento in self._indices("medicamentos", primero, cantidad)
+            ),
+            self._cadena(indicaciones),
+        )
+
+    def _indice_paciente(self, dni: str) -> int:
+        indice = self._buscar("pacientes", PACIENTE, dni)
+        if indice is None:
+            raise PacienteNoEncontradoException(f"No existe un paciente con DNI {dni}")
+        return indice
+
+    def _indice_medico(self, matricula: str) -> int:
+        indice = self._buscar("medicos", MEDICO, matricula)
+        if indice is None:
+            raise MedicoNoEncontradoException(
+                f"No existe un médico con matrícula {matricula}"
+            )
+        return indice
+
+    def buscar_paciente(self, dni: str) -> Paciente:
+        return self._paciente(self._indice_paciente(dni))
+
+    def buscar_medico(self, matricula: str) -> Medico:
+        return self._medico(self._indice_medico(matricula))
+
+    def buscar_turno(self, identificador: int) -> Turno:
+        if (
+            not isinstance(identificador, int)
+            or not 0 <= identificador < self._cantidad("turnos")
+        ):
+            raise TurnoNoEncontradoException(
+                f"No existe un turno con identificador {identificador}"
+            )
+        return self._turno(identificador)
+
+    def obtener_historia_clinica(self, dni_paciente: str) -> HistoriaClinica:
+        indice = self._indice_paciente(dni_paciente)
+        _, _, _, primero, cantidad, primera, recetas = self._registro(
+            "pacientes", PACIENTE, indice
+        )
+        return HistoriaClinica.reconstruir(
+            self._paciente(indice),
+            [
+                self._turno(identificador)
+                for identificador in self._indices("turnos_paciente", primero, cantidad)
+            ],
+            [self._receta(posicion) for posicion in range(primera, primera + recetas)],
+        )
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return [self._paciente(indice) for indice in range(self._cantidad("pacientes"))]
+
+    def listar_medicos(self) -> list[Medico]:
+        return [self._medico(indice) for indice in range(self._cantidad("medicos"))]
+
+    def iter_turnos(self) -> Iterator[Turno]:
+        return (
+            self._turno(identificador)
+            for identificador in range(self._cantidad("turnos"))
+        )
+
+    def obtener_turnos_medico(
+        self, matricula: str, desde: str, hasta: str
+    ) -> Iterator[Turno]:
+
+        *_, primero, cantidad = self._registro(
+            "medicos", MEDICO, self._indice_medico(matricula)
+        )
+        inicio = datetime.combine(parsear_fecha(desde), time.min)
+        fin = datetime.combine(parsear_fecha(hasta) + timedelta(days=1), time.min)
+
+        izquierda = bisect_left(
+            range(primero, primero + cantidad),
+            (inicio - EPOCA) // UN_MINUTO,
+            key=self._minuto_turno_medico,
+        )
+        derecha = bisect_left(
+            range(primero, primero + cantidad),
+            (fin - EPOCA) // UN_MINUTO,
+            key=self._minuto_turno_medico,
+        )
+        return (
+            self._turno(self._indices("turnos_medico", primero + i, 1)[0])
+            for i in range(izquierda, derecha)
+        )
+
+    def _minuto_turno_medico(self, posicion: int) -> int:
+        (identificador,) = self._indices("turnos_medico", posicion, 1)
+        return self._registro("turnos", TURNO, identificador)[2]
+
+    def contar_turnos(self, estado: EstadoTurno | str | None = None) -> int:
+        conteos = self._indices("conteo_estados", 0, self._cantidad("conteo_estados"))
+        if estado is None:
+            return sum(conteos)
+        try:
+            codigo = CODIGOS_ESTADO[EstadoTurno(estado)]
+        except ValueError:
+            raise DatosInvalidosException(f"Estado de turno inválido: {estado}")
+        return conteos[codigo] if codigo < len(conteos) else 0
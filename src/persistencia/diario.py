@@ -0,0 +1,208 @@
+import gc
+import json
+import os
+import zlib
+
+from ..excepciones import DatosInvalidosException
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from .repositorio import Repositorio
+from .serializacion import (
+    registro_paciente,
+    registro_medico,
+    registro_especialidad,
+    registro_turno,
+    registro_receta,
+    restaurar_paciente,
+    restaurar_medico,
+    restaurar_especialidad,
+    restaurar_turnos,
+    restaurar_receta,
+    aplicar_estado,
+    volcar_clinica,
+    cargar_clinica,
+)
+
+ARCHIVO_DIARIO = "diario.log"
+ARCHIVO_INSTANTANEA = "instantanea.json"
+
+
+class RepositorioDiario(Repositorio):
+
+    def __init__(
+        self,
+        directorio: str,
+        sincronizar_cada: int = 100,
+        instantanea_cada: int = 100000,
+    ):
+        if not isinstance(sincronizar_cada, int) or sincronizar_cada <= 0:
+            raise DatosInvalidosException(
+                "La frecuencia de sincronización debe ser positiva"
+            )
+        if not isinstance(instantanea_cada, int) or instantanea_cada <= 0:
+            raise DatosInvalidosException(
+                "La frecuencia de instantáneas debe ser positiva"
+            )
+
+        os.makedirs(directorio, exist_ok=True)
+        self.__ruta_diario__ = os.path.join(directorio, ARCHIVO_DIARIO)
+        self.__ruta_instantanea__ = os.path.join(directorio, ARCHIVO_INSTANTANEA)
+        self.__sincronizar_cada__ = sincronizar_cada
+        self.__instantanea_cada__ = instantanea_cada
+
+        self.__clinica__ = None
+        self.__archivo__ = None
+        self.__secuencia__ = 0
+        self.__sin_sincronizar__ = 0
+        self.__desde_instantanea__ = 0
+
+    def cargar(self, clinica):
+        self.__clinica__ = clinica
+
+        recolectar = gc.isenabled()
+        gc.disable()
+        try:
+            self.__secuencia__ = self._cargar_instantanea(clinica)
+            valido = self._reproducir_diario(clinica)
+        finally:
+            if recolectar:
+                gc.enable()
+
+        if (
+            os.path.exists(self.__ruta_diario__)
+            and os.path.getsize(self.__ruta_diario__) > valido
+        ):
+            os.truncate(self.__ruta_diario__, valido)
+        self.__archivo__ = open(self.__ruta_diario__, "ab")
+
+    def _cargar_instantanea(self, clinica) -> int:
+        if not os.path.exists(self.__ruta_instantanea__):
+            return 0
+
+        with open(self.__ruta_instantanea__, "rb") as archivo:
+            suma, _, cuerpo = archivo.read().partition(b"\n")
+        if zlib.crc32(cuerpo) != int(suma, 16):
+            raise DatosInvalidosException(
+                f"La instantánea {self.__ruta_instantanea__} está dañada"
+            )
+
+        instantanea = json.loads(cuerpo)
+        cargar_clinica(clinica, instantanea["datos"])
+        return instantanea["secuencia"]
+
+    def _reproducir_diario(self, clinica) -> int:
+        if not os.path.exists(self.__ruta_diario__):
+            return 0
+
+        valido = 0
+        with open(self.__ruta_diario__, "rb") as archivo:
+            for linea in archivo:
+                if not linea.endswith(b"\n"):
+                    break
+                suma, _, cuerpo = linea[:-1].partition(b" ")
+                try:
+                    if zlib.crc32(cuerpo) != int(suma, 16):
+                        break
+                except ValueError:
+                    break
+
+                registro = json.loads(cuerpo)
+                if registro["s"] > self.__secuencia__:
+                    self._aplicar(clinica, registro["o"], registro["d"])
+                    self.__secuencia__ = registro["s"]
+                    self.__desde_instantanea__ += 1
+                valido += len(linea)
+        return valido
+
+    @staticmethod
+    def _aplicar(clinica, operacion: str, datos: list):
+        if operacion == "paciente":
+            restaurar_paciente(clinica, datos)
+        elif operacion == "medico":
+            restaurar_medico(clinica, datos)
+        elif operacion == "especialidad":
+            restaurar_especialidad(clinica, datos)
+        elif operacion == "turnos":
+            restaurar_turnos(clinica, datos)
+        elif operacion == "estado":
+            identificador, estado = datos
+            turno = clinica.buscar_turno(identificador)
+            estado = EstadoTurno(estado)
+            if turno.obtener_estado_turno() is not estado:
+                aplicar_estado(turno, estado)
+        elif operacion == "receta":
+            restaurar_receta(clinica, datos)
+        else:
+            raise DatosInvalidosException(
+                f"Operación desconocida en el diario: {operacion}"
+            )
+
+    def guardar_paciente(self, paciente: Paciente):
+        self._escribir("paciente", registro_paciente(paciente))
+
+    def guardar_medico(self, medico: Medico):
+        self._escribir("medico", registro_medico(medico))
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad):
+        self._escribir("especialidad", registro_especialidad(matricula, especialidad))
+
+    def guardar_turnos(self, turnos: list[Turno]):
+        self._escribir("turnos", [registro_turno(turno) for turno in turnos])
+
+    def actualizar_estado_turno(self, turno: Turno, estado_anterior: EstadoTurno):
+        self._escribir("estado", [turno.obtener_id(), turno.obtener_estado()])
+
+    def guardar_receta(self, receta: Receta):
+        self._escribir("receta", registro_receta(receta))
+
+    def _escribir(self, operacion: str, datos: list):
+        if self.__desde_instantanea__ >= self.__instantanea_cada__:
+            self.tomar_instantanea()
+
+        self.__secuencia__ += 1
+        cuerpo = json.dumps(
+            {"s": self.__secuencia__, "o": operacion, "d": datos},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+        self.__archivo__.write(b"%08x %s\n" % (zlib.crc32(cuerpo), cuerpo))
+
+        self.__sin_sincronizar__ += 1
+        if self.__sin_sincronizar__ >= self.__sincronizar_cada__:
+            self.confirmar()
+
+        self.__desde_instantanea__ += 1
+
+    def tomar_instantanea(self):
+        cuerpo = json.dumps(
+            {"secuencia": self.__secuencia__, "datos": volcar_clinica(self.__clinica__)},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+        temporal = self.__ruta_instantanea__ + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(b"%08x\n" % zlib.crc32(cuerpo))
+            archivo.write(cuerpo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self.__ruta_instantanea__)
+
+        self.__archivo__.close()
+        self.__archivo__ = open(self.__ruta_diario__, "wb")
+        self.__sin_sincronizar__ = 0
+        self.__desde_instantanea__ = 0
+
+    def confirmar(self):
+        self.__archivo__.flush()
+        os.fsync(self.__archivo__.fileno())
+        self.__sin_sincronizar__ = 0
+
+    def cerrar(self):
+        if self.__desde_instantanea__ >= self.__instantanea_cada__:
+            self.tomar_instantanea()
+        self.confirmar()
+        self.__archivo__.close()
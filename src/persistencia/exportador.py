@@ -0,0 +1,189 @@
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator
+
+from ..excepciones import DatosInvalidosException
+from ..modelo.clinica import Clinica
+from ..modelo.historia_clinica import HistoriaClinica
+from ..modelo.turno import Turno
+from ..modelo.receta import Receta
+from .importador import SEPARADOR_LISTAS
+
+TAMANIO_BUFFER = 1 << 20
+
+COLUMNAS_CSV = (
+    "dni",
+    "paciente",
+    "fecha_nacimiento",
+    "tipo",
+    "id",
+    "fecha",
+    "hora",
+    "matricula",
+    "medico",
+    "especialidad",
+    "estado",
+    "medicamentos",
+    "indicaciones",
+)
+
+
+def abrir_salida(ruta: str):
+    if ruta.endswith(".gz"):
+        return io.TextIOWrapper(
+            io.BufferedWriter(gzip.open(ruta, "wb"), TAMANIO_BUFFER),
+            encoding="utf-8",
+            newline="",
+        )
+    return open(ruta, "w", encoding="utf-8", newline="", buffering=TAMANIO_BUFFER)
+
+
+def documento_turno(turno: Turno) -> dict:
+    medico = turno.obtener_medico()
+    return {
+        "id": turno.obtener_id(),
+        "fecha": turno.obtener_fecha(),
+        "hora": turno.obtener_hora(),
+        "matricula": medico.obtener_matricula(),
+        "medico": medico.obtener_nombre(),
+        "especialidad": turno.obtener_especialidad(),
+        "estado": turno.obtener_estado(),
+    }
+
+
+def documento_receta(receta: Receta) -> dict:
+    medico = receta.obtener_medico()
+    return {
+        "fecha": receta.obtener_fecha(),
+        "matricula": medico.obtener_matricula(),
+        "medico": medico.obtener_nombre(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "indicaciones": receta.obtener_indicaciones(),
+    }
+
+
+def documento_historia(historia: HistoriaClinica) -> dict:
+    paciente = historia.obtener_paciente()
+    return {
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+        "turnos": [documento_turno(turno) for turno in historia.iter_turnos()],
+        "recetas": [documento_receta(receta) for receta in historia.iter_recetas()],
+    }
+
+
+def filas_historia(historia: HistoriaClinica) -> Iterator[tuple]:
+    paciente = historia.obtener_paciente()
+    datos = (
+        paciente.obtener_dni(),
+        paciente.obtener_nombre(),
+        paciente.obtener_fecha_nacimiento(),
+    )
+
+    yield datos + ("paciente",) + ("",) * (len(COLUMNAS_CSV) - 4)
+    for turno in historia.iter_turnos():
+        registro = documento_turno(turno)
+        yield datos + (
+            "turno",
+            registro["id"],
+            registro["fecha"],
+            registro["hora"],
+            registro["matricula"],
+            registro["medico"],
+            registro["especialidad"],
+            registro["estado"],
+            "",
+            "",
+        )
+    for receta in historia.iter_recetas():
+        registro = documento_receta(receta)
+        yield datos + (
+            "receta",
+            "",
+            registro["fecha"],
+            "",
+            registro["matricula"],
+            registro["medico"],
+            "",
+            "",
+            SEPARADOR_LISTAS.join(registro["medicamentos"]),
+            registro["indicaciones"],
+        )
+
+
+def exportar_historias(
+    clinica: Clinica,
+    ruta: str,
+    dnis: Iterable[str] | None = None,
+    filtro: Callable[[HistoriaClinica], bool] | None = None,
+) -> int:
+
+    nombre = ruta[:-3] if ruta.endswith(".gz") else ruta
+    if not nombre.endswith((".jsonl", ".ndjson", ".csv")):
+        raise DatosInvalidosException(
+            f"Formato no soportado: {ruta}. Use .csv o .jsonl"
+        )
+
+    historias = clinica.iter_historias_clinicas(dnis)
+    if filtro is not None:
+        historias = filter(filtro, historias)
+
+    exportadas = 0
+    with abrir_salida(ruta) as archivo:
+        if nombre.endswith(".csv"):
+            escritor = csv.writer(archivo)
+            escritor.writerow(COLUMNAS_CSV)
+            for historia in historias:
+                escritor.writerows(filas_historia(historia))
+                exportadas += 1
+        else:
+            for historia in historias:
+                archivo.write(
+                    json.dumps(
+                        documento_historia(historia),
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                )
+                archivo.write("\n")
+                exportadas += 1
+    return exportadas
+
+
+def main(argumentos: Iterable[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Exporta historias clínicas a JSONL o CSV (opcionalmente .gz)"
+    )
+    parser.add_argument("salida", metavar="RUTA")
+    parser.add_argument("--dni", action="append", dest="dnis")
+    origen = parser.add_mutually_exclusive_group(required=True)
+    origen.add_argument("--diario", metavar="DIRECTORIO")
+    origen.add_argument("--sqlite", metavar="RUTA")
+    args = parser.parse_args(argumentos)
+
+    if args.diario is not None:
+        from .diario import RepositorioDiario
+
+        repositorio = RepositorioDiario(args.diario)
+    else:
+        from .sqlite import RepositorioSQLite
+
+        repositorio = RepositorioSQLite(args.sqlite)
+
+    clinica = Clinica(repositorio=repositorio)
+    try:
+        exportadas = exportar_historias(clinica, args.salida, args.dnis)
+    finally:
+        clinica.cerrar()
+    print(
+        f"{exportadas} historias clínicas exportadas a {args.salida}", file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
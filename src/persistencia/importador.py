@@ -0,0 +1,396 @@
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+
+from ..excepciones import (
+    ClinicaException,
+    DatosInvalidosException,
+    LoteInvalidoException,
+)
+from ..modelo.clinica import Clinica
+from ..modelo.fechas import parsear_fecha, parsear_hora
+from ..modelo.turno import EstadoTurno
+from .serializacion import ESTADOS_POR_VALOR, aplicar_estado
+
+CAMPOS = {
+    "pacientes": ("nombre", "dni", "fecha_nacimiento"),
+    "medicos": ("nombre", "matricula"),
+    "especialidades": ("matricula", "especialidad", "dias"),
+    "turnos": ("dni", "matricula", "fecha", "hora", "especialidad"),
+    "recetas": ("dni", "matricula", "fecha", "medicamentos", "indicaciones"),
+}
+
+SEPARADOR_LISTAS = ";"
+
+
+class ResumenImportacion:
+    __slots__ = ("__importadas__", "__rechazadas__", "__inicio__", "__fin__")
+
+    def __init__(self):
+        self.__importadas__ = 0
+        self.__rechazadas__ = 0
+        self.__inicio__ = time.perf_counter()
+        self.__fin__ = None
+
+    def sumar(self, importadas: int, rechazadas: int):
+        self.__importadas__ += importadas
+        self.__rechazadas__ += rechazadas
+
+    def finalizar(self):
+        self.__fin__ = time.perf_counter()
+
+    def obtener_importadas(self) -> int:
+        return self.__importadas__
+
+    def obtener_rechazadas(self) -> int:
+        return self.__rechazadas__
+
+    def obtener_procesadas(self) -> int:
+        return self.__importadas__ + self.__rechazadas__
+
+    def obtener_segundos(self) -> float:
+        fin = self.__fin__ if self.__fin__ is not None else time.perf_counter()
+        return fin - self.__inicio__
+
+    def obtener_filas_por_segundo(self) -> float:
+        segundos = self.obtener_segundos()
+        return self.obtener_procesadas() / segundos if segundos > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.obtener_procesadas()} filas ({self.__importadas__} importadas, "
+            f"{self.__rechazadas__} rechazadas) en {self.obtener_segundos():.1f} s - "
+            f"{self.obtener_filas_por_segundo():.0f} filas/s"
+        )
+
+
+def abrir_texto(ruta: str):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, "rt", encoding="utf-8", newline="")
+    return open(ruta, encoding="utf-8", newline="")
+
+
+def leer_filas(ruta: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    nombre = ruta[:-3] if ruta.endswith(".gz") else ruta
+
+    with abrir_texto(ruta) as archivo:
+        if nombre.endswith(".csv"):
+            lector = csv.DictReader(archivo)
+            for fila in lector:
+                yield lector.line_num, fila, None
+            return
+
+        if not nombre.endswith((".jsonl", ".ndjson")):
+            raise DatosInvalidosException(
+                f"Formato no soportado: {ruta}. Use .csv o .jsonl"
+            )
+
+        for linea, texto in enumerate(archivo, start=1):
+            if not texto.strip():
+                continue
+            try:
+                fila = json.loads(texto)
+            except json.JSONDecodeError as e:
+                yield linea, None, f"JSON inválido: {e.msg}"
+                continue
+            if not isinstance(fila, dict):
+                yield linea, None, "Cada línea debe ser un objeto JSON"
+                continue
+            yield linea, fila, None
+
+
+def _lista(valor) -> list[str]:
+    if isinstance(valor, list):
+        if not all(isinstance(elemento, str) for elemento in valor):
+            raise DatosInvalidosException("Todos los elementos deben ser texto")
+        return valor
+    if isinstance(valor, str):
+        return [
+            parte.strip()
+            for parte in valor.split(SEPARADOR_LISTAS)
+            if parte.strip()
+        ]
+    raise DatosInvalidosException("Se esperaba una lista o texto separado por ';'")
+
+
+def _valores(tipo: str, fila: dict) -> list:
+    valores = []
+    for campo in CAMPOS[tipo]:
+        valor = fila.get(campo)
+        if valor is None or valor == "":
+            raise DatosInvalidosException(f"Falta el campo {campo}")
+        valores.append(valor)
+    return valores
+
+
+def _estado(fila: dict) -> EstadoTurno:
+    valor = fila.get("estado") or EstadoTurno.PROGRAMADO.value
+    estado = ESTADOS_POR_VALOR.get(valor) if isinstance(valor, str) else None
+    if estado is None:
+        raise DatosInvalidosException(f"Estado de turno inválido: {valor}")
+    return estado
+
+
+class Importador:
+
+    def __init__(
+        self,
+        clinica: Clinica,
+        ruta_rechazos: str | None = None,
+        tamanio_lote: int = 1000,
+        informar: Callable[[ResumenImportacion], None] | None = None,
+        intervalo_informe: float = 1.0,
+    ):
+        if not isinstance(tamanio_lote, int) or tamanio_lote <= 0:
+            raise DatosInvalidosException("El tamaño de lote debe ser positivo")
+
+        self.__clinica__ = clinica
+        self.__ruta_rechazos__ = ruta_rechazos
+        self.__tamanio_lote__ = tamanio_lote
+        self.__informar__ = informar
+        self.__intervalo_informe__ = intervalo_informe
+
+    def importar_pacientes(self, ruta: str) -> ResumenImportacion:
+        return self._importar(ruta, "pacientes", self._importar_pacientes)
+
+    def importar_medicos(self, ruta: str) -> ResumenImportacion:
+        return self._importar(ruta, "medicos", self._importar_medicos)
+
+    def importar_especialidades(self, ruta: str) -> ResumenImportacion:
+        return self._importar(ruta, "especialidades", self._importar_especialidades)
+
+    def importar_turnos(self, ruta: str) -> ResumenImportacion:
+        return self._importar(ruta, "turnos", self._importar_turnos)
+
+    def importar_recetas(self, ruta: str) -> ResumenImportacion:
+        return self._importar(ruta, "recetas", self._importar_recetas)
+
+    def _importar(
+        self,
+        ruta: str,
+        tipo: str,
+        procesar: Callable[[list[tuple[int, dict]]], list[tuple[int, dict, str]]],
+    ) -> ResumenImportacion:
+
+        resumen = ResumenImportacion()
+        rechazos = None
+        escritor = None
+        if self.__ruta_rechazos__ is not None:
+            rechazos = open(self.__ruta_rechazos__, "a", encoding="utf-8", newline="")
+            escritor = csv.writer(rechazos)
+            if rechazos.tell() == 0:
+                escritor.writerow(("archivo", "tipo", "linea", "motivo", "fila"))
+
+        proximo_informe = time.perf_counter() + self.__intervalo_informe__
+        try:
+            filas = leer_filas(ruta)
+            while True:
+                bloque = list(islice(filas, self.__tamanio_lote__))
+                if not bloque:
+                    break
+
+                lote = []
+                rechazadas = []
+                for linea, fila, error in bloque:
+                    if error is None:
+                        lote.append((linea, fila))
+                    else:
+                        rechazadas.append((linea, fila, error))
+                if lote:
+                    rechazadas.extend(procesar(lote))
+
+                if escritor is not None:
+                    escritor.writerows(
+                        (
+                            ruta,
+                            tipo,
+                            linea,
+                            motivo,
+                            json.dumps(fila, ensure_ascii=False) if fila else "",
+                        )
+                        for linea, fila, motivo in sorted(
+                            rechazadas, key=lambda rechazo: rechazo[0]
+                        )
+                    )
+                resumen.sumar(len(bloque) - len(rechazadas), len(rechazadas))
+
+                if (
+                    self.__informar__ is not None
+                    and time.perf_counter() >= proximo_informe
+                ):
+                    self.__informar__(resumen)
+                    proximo_informe = time.perf_counter() + self.__intervalo_informe__
+        finally:
+            if rechazos is not None:
+                rechazos.close()
+
+        resumen.finalizar()
+        if self.__informar__ is not None:
+            self.__informar__(resumen)
+        return resumen
+
+    def _por_fila(
+        self,
+        lote: list[tuple[int, dict]],
+        tipo: str,
+        aplicar: Callable[[list], object],
+    ) -> list[tuple[int, dict, str]]:
+
+        rechazadas = []
+        for linea, fila in lote:
+            try:
+                aplicar(_valores(tipo, fila))
+            except ClinicaException as e:
+                rechazadas.append((linea, fila, str(e)))
+        return rechazadas
+
+    def _importar_pacientes(self, lote: list[tuple[int, dict]]):
+        return self._por_fila(
+            lote,
+            "pacientes",
+            lambda valores: self.__clinica__.registrar_paciente(*valores),
+        )
+
+    def _importar_medicos(self, lote: list[tuple[int, dict]]):
+        return self._por_fila(
+            lote,
+            "medicos",
+            lambda valores: self.__clinica__.registrar_medico(*valores),
+        )
+
+    def _importar_especialidades(self, lote: list[tuple[int, dict]]):
+        return self._por_fila(
+            lote,
+            "especialidades",
+            lambda valores: self.__clinica__.agregar_especialidad_a_medico(
+                valores[0], valores[1], _lista(valores[2])
+            ),
+        )
+
+    def _importar_recetas(self, lote: list[tuple[int, dict]]):
+        return self._por_fila(
+            lote,
+            "recetas",
+            lambda valores: self.__clinica__.emitir_receta(
+                valores[0],
+                valores[1],
+                valores[2],
+                _lista(valores[3]),
+                valores[4],
+            ),
+        )
+
+    def _importar_turnos(self, lote: list[tuple[int, dict]]):
+
+        rechazadas = []
+        tramo = []
+        cancelados = set()
+        for linea, fila in lote:
+            try:
+                valores = _valores("turnos", fila)
+                estado = _estado(fila)
+                horario = (
+                    str(valores[1]),
+                    parsear_fecha(valores[2]),
+                    parsear_hora(valores[3]),
+                )
+            except ClinicaException as e:
+                rechazadas.append((linea, fila, str(e)))
+                continue
+
+            if horario in cancelados:
+                rechazadas.extend(self._agendar_turnos(tramo))
+                tramo = []
+                cancelados.clear()
+            if estado is EstadoTurno.CANCELADO:
+                cancelados.add(horario)
+            tramo.append((linea, fila, valores, estado))
+
+        rechazadas.extend(self._agendar_turnos(tramo))
+        return rechazadas
+
+    def _agendar_turnos(
+        self, pendientes: list[tuple[int, dict, list, EstadoTurno]]
+    ) -> list[tuple[int, dict, str]]:
+
+        rechazadas = []
+        while pendientes:
+            try:
+                turnos = self.__clinica__.agendar_turnos_lote(
+                    [tuple(valores) for _, _, valores, _ in pendientes]
+                )
+            except LoteInvalidoException as e:
+                invalidas = {indice: str(error) for indice, error in e.errores}
+                rechazadas.extend(
+                    (linea, fila, invalidas[indice])
+                    for indice, (linea, fila, _, _) in enumerate(pendientes)
+                    if indice in invalidas
+                )
+                pendientes = [
+                    pendiente
+                    for indice, pendiente in enumerate(pendientes)
+                    if indice not in invalidas
+                ]
+                continue
+
+            for turno, (_, _, _, estado) in zip(turnos, pendientes):
+                aplicar_estado(turno, estado)
+            break
+
+        return rechazadas
+
+
+def _mostrar_progreso(resumen: ResumenImportacion):
+    print(
+        f"\r{resumen.obtener_procesadas()} filas "
+        f"({resumen.obtener_rechazadas()} rechazadas) - "
+        f"{resumen.obtener_filas_por_segundo():.0f} filas/s",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argumentos: Iterable[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Importa pacientes, médicos, especialidades, turnos y recetas "
+        "desde archivos CSV o JSONL"
+    )
+    for tipo in CAMPOS:
+        parser.add_argument(f"--{tipo}", metavar="RUTA")
+    parser.add_argument("--rechazos", metavar="RUTA")
+    parser.add_argument("--lote", type=int, default=1000)
+    destino = parser.add_mutually_exclusive_group(required=True)
+    destino.add_argument("--diario", metavar="DIRECTORIO")
+    destino.add_argument("--sqlite", metavar="RUTA")
+    args = parser.parse_args(argumentos)
+
+    if args.diario is not None:
+        from .diario import RepositorioDiario
+
+        repositorio = RepositorioDiario(args.diario)
+    else:
+        from .sqlite import RepositorioSQLite
+
+        repositorio = RepositorioSQLite(args.sqlite)
+
+    clinica = Clinica(repositorio=repositorio)
+    importador = Importador(clinica, args.rechazos, args.lote, _mostrar_progreso)
+    try:
+        for tipo in CAMPOS:
+            ruta = getattr(args, tipo)
+            if ruta is None:
+                continue
+            resumen = getattr(importador, f"importar_{tipo}")(ruta)
+            print(f"\r{tipo.capitalize()}: {resumen}", file=sys.stderr)
+    finally:
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from datetime import date
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+
+
+class Repositorio:
+
+    def cargar(self, clinica):
+        pass
+
+    def permite_carga_perezosa(self) -> bool:
+        return False
+
+    def cargar_recetas(self, dni: str) -> list[tuple[str, date, list[str], str]]:
+        return []
+
+    def guardar_paciente(self, paciente: Paciente):
+        pass
+
+    def guardar_medico(self, medico: Medico):
+        pass
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad):
+        pass
+
+    def guardar_turnos(self, turnos: list[Turno]):
+        pass
+
+    def actualizar_estado_turno(self, turno: Turno, estado_anterior: EstadoTurno):
+        pass
+
+    def guardar_receta(self, receta: Receta):
+        pass
+
+    def confirmar(self):
+        pass
+
+    def cerrar(self):
+        pass
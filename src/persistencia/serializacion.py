@@ -0,0 +1,138 @@
+from datetime import datetime
+from itertools import islice
+
+from ..excepciones import DatosInvalidosException
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from ..modelo.fechas import DIAS_SEMANA
+
+ESTADOS_POR_VALOR = {estado.value: estado for estado in EstadoTurno}
+
+
+def registro_paciente(paciente: Paciente) -> list:
+    return [
+        paciente.obtener_nombre(),
+        paciente.obtener_dni(),
+        paciente.obtener_fecha_nacimiento(),
+    ]
+
+
+def registro_medico(medico: Medico) -> list:
+    return [medico.obtener_nombre(), medico.obtener_matricula()]
+
+
+def registro_especialidad(matricula: str, especialidad: Especialidad) -> list:
+    return [
+        matricula,
+        especialidad.obtener_especialidad(),
+        especialidad.obtener_mascara_dias(),
+    ]
+
+
+def registro_turno(turno: Turno) -> list:
+    return [
+        turno.obtener_id(),
+        turno.obtener_paciente().obtener_dni(),
+        turno.obtener_medico().obtener_matricula(),
+        turno.obtener_fecha_hora().isoformat(timespec="minutes"),
+        turno.obtener_especialidad(),
+        turno.obtener_estado(),
+    ]
+
+
+def registro_receta(receta: Receta) -> list:
+    return [
+        receta.obtener_paciente().obtener_dni(),
+        receta.obtener_medico().obtener_matricula(),
+        receta.obtener_fecha(),
+        receta.obtener_medicamentos(),
+        receta.obtener_indicaciones(),
+    ]
+
+
+def dias_de_mascara(mascara: int) -> list[str]:
+    return [dia for indice, dia in enumerate(DIAS_SEMANA) if mascara >> indice & 1]
+
+
+def aplicar_estado(turno: Turno, estado: EstadoTurno):
+    if estado is EstadoTurno.COMPLETADO:
+        turno.marcar_completado()
+    elif estado is EstadoTurno.CANCELADO:
+        turno.marcar_cancelado()
+    elif estado is EstadoTurno.AUSENTE:
+        turno.marcar_ausente()
+
+
+def volcar_clinica(clinica) -> dict:
+    pacientes = clinica.listar_pacientes()
+    medicos = clinica.listar_medicos()
+    return {
+        "pacientes": [registro_paciente(paciente) for paciente in pacientes],
+        "medicos": [registro_medico(medico) for medico in medicos],
+        "especialidades": [
+            registro_especialidad(medico.obtener_matricula(), especialidad)
+            for medico in medicos
+            for especialidad in medico.obtener_especialidades()
+        ],
+        "turnos": [
+            registro_turno(turno)
+            for turno in islice(clinica.iter_turnos(), clinica.contar_turnos())
+        ],
+        "recetas": [
+            registro_receta(receta)
+            for historia in clinica.iter_historias_clinicas()
+            for receta in historia.iter_recetas()
+        ],
+    }
+
+
+def restaurar_paciente(clinica, registro: list):
+    clinica.registrar_paciente(*registro)
+
+
+def restaurar_medico(clinica, registro: list):
+    clinica.registrar_medico(*registro)
+
+
+def restaurar_especialidad(clinica, registro: list):
+    matricula, tipo, mascara = registro
+    clinica.agregar_especialidad_a_medico(matricula, tipo, dias_de_mascara(mascara))
+
+
+def restaurar_turnos(clinica, registros: list[list]) -> list[Turno]:
+    turnos = clinica._restaurar_turnos(
+        (
+            dni,
+            matricula,
+            datetime.fromisoformat(fecha_hora),
+            especialidad,
+            ESTADOS_POR_VALOR[estado],
+        )
+        for _, dni, matricula, fecha_hora, especialidad, estado in registros
+    )
+    for turno, registro in zip(turnos, registros):
+        if turno.obtener_id() != registro[0]:
+            raise DatosInvalidosException(
+                f"El turno {registro[0]} no coincide con la clínica"
+            )
+    return turnos
+
+
+def restaurar_receta(clinica, registro: list):
+    clinica.emitir_receta(*registro)
+
+
+def cargar_clinica(clinica, datos: dict):
+    for registro in datos["pacientes"]:
+        restaurar_paciente(clinica, registro)
+    for registro in datos["medicos"]:
+        restaurar_medico(clinica, registro)
+    for registro in datos["especialidades"]:
+        restaurar_especialidad(clinica, registro)
+    restaurar_turnos(clinica, datos["turnos"])
+    for registro in datos["recetas"]:
+        restaurar_receta(clinica, registro)
+
@@ -0,0 +1,238 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+
+from ..excepciones import DatosInvalidosException
+from ..modelo.paciente import Paciente
+from ..modelo.medico import Medico
+from ..modelo.especialidad import Especialidad
+from ..modelo.turno import Turno, EstadoTurno
+from ..modelo.receta import Receta
+from ..modelo.fechas import DIAS_SEMANA, parsear_fecha, formatear_fecha
+from .repositorio import Repositorio
+from .serializacion import restaurar_turnos
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    tipo TEXT NOT NULL,
+    dias INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha_hora TEXT NOT NULL,
+    especialidad TEXT NOT NULL,
+    estado TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha TEXT NOT NULL,
+    medicamentos TEXT NOT NULL,
+    indicaciones TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS turnos_medico_fecha ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS turnos_paciente ON turnos (dni, fecha_hora);
+CREATE INDEX IF NOT EXISTS recetas_paciente ON recetas (dni);
+"""
+
+INSERTAR_PACIENTE = (
+    "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+)
+INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+INSERTAR_ESPECIALIDAD = (
+    "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)"
+)
+INSERTAR_TURNO = (
+    "INSERT INTO turnos (id, dni, matricula, fecha_hora, especialidad, estado) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+ACTUALIZAR_ESTADO_TURNO = "UPDATE turnos SET estado = ? WHERE id = ?"
+INSERTAR_RECETA = (
+    "INSERT INTO recetas (dni, matricula, fecha, medicamentos, indicaciones) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+class RepositorioSQLite(Repositorio):
+
+    def __init__(self, ruta: str = ":memory:", tamanio_lote: int = 500):
+        if not isinstance(tamanio_lote, int) or tamanio_lote <= 0:
+            raise DatosInvalidosException("El tamaño de lote debe ser positivo")
+
+        self.__conexion__ = sqlite3.connect(
+            ruta, cached_statements=32, check_same_thread=False
+        )
+        self.__conexion__.execute("PRAGMA journal_mode=WAL")
+        self.__conexion__.execute("PRAGMA synchronous=NORMAL")
+        self.__conexion__.execute("PRAGMA foreign_keys=ON")
+        self.__conexion__.executescript(ESQUEMA)
+        self.__tamanio_lote__ = tamanio_lote
+        self.__pendientes__ = 0
+
+    def cargar(self, clinica):
+        conexion = self.__conexion__
+
+        for dni, nombre, fecha_nacimiento in conexion.execute(
+            "SELECT dni, nombre, fecha_nacimiento FROM pacientes ORDER BY rowid"
+        ):
+            clinica.registrar_paciente(
+                nombre, dni, formatear_fecha(date.fromisoformat(fecha_nacimiento))
+            )
+
+        for matricula, nombre in conexion.execute(
+            "SELECT matricula, nombre FROM medicos ORDER BY rowid"
+        ):
+            clinica.registrar_medico(nombre, matricula)
+
+        for matricula, tipo, dias in conexion.execute(
+            "SELECT matricula, tipo, dias FROM especialidades ORDER BY id"
+        ):
+            clinica.agregar_especialidad_a_medico(
+                matricula,
+                tipo,
+                [dia for indice, dia in enumerate(DIAS_SEMANA) if dias >> indice & 1],
+            )
+
+        restaurar_turnos(
+            clinica,
+            conexion.execute(
+                "SELECT id, dni, matricula, fecha_hora, especialidad, estado "
+                "FROM turnos ORDER BY id"
+            ).fetchall(),
+        )
+
+        for dni, matricula, fecha, medicamentos, indicaciones in conexion.execute(
+            "SELECT dni, matricula, fecha, medicamentos, indicaciones "
+            "FROM recetas ORDER BY id"
+        ):
+            clinica.emitir_receta(
+                dni,
+                matricula,
+                formatear_fecha(date.fromisoformat(fecha)),
+                json.loads(medicamentos),
+                indicaciones,
+            )
+
+    def permite_carga_perezosa(self) -> bool:
+        return True
+
+    def cargar_recetas(self, dni: str) -> list[tuple[str, date, list[str], str]]:
+        filas = self.__conexion__.execute(
+            "SELECT matricula, fecha, medicamentos, indicaciones "
+            "FROM recetas WHERE dni = ? ORDER BY id",
+            (dni,),
+        )
+        return [
+            (
+                matricula,
+                date.fromisoformat(fecha),
+                json.loads(medicamentos),
+                indicaciones,
+            )
+            for matricula, fecha, medicamentos, indicaciones in filas
+        ]
+
+    def guardar_paciente(self, paciente: Paciente):
+        self._ejecutar(
+            INSERTAR_PACIENTE,
+            (
+                paciente.obtener_dni(),
+                paciente.obtener_nombre(),
+                parsear_fecha(paciente.obtener_fecha_nacimiento()).isoformat(),
+            ),
+        )
+
+    def guardar_medico(self, medico: Medico):
+        self._ejecutar(
+            INSERTAR_MEDICO, (medico.obtener_matricula(), medico.obtener_nombre())
+        )
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad):
+        self._ejecutar(
+            INSERTAR_ESPECIALIDAD,
+            (
+                matricula,
+                especialidad.obtener_especialidad(),
+                especialidad.obtener_mascara_dias(),
+            ),
+        )
+
+    def guardar_turnos(self, turnos: list[Turno]):
+        with self._escritura(len(turnos)) as conexion:
+            conexion.executemany(
+                INSERTAR_TURNO,
+                [
+                    (
+                        turno.obtener_id(),
+                        turno.obtener_paciente().obtener_dni(),
+                        turno.obtener_medico().obtener_matricula(),
+                        turno.obtener_fecha_hora().isoformat(timespec="minutes"),
+                        turno.obtener_especialidad(),
+                        turno.obtener_estado(),
+                    )
+                    for turno in turnos
+                ],
+            )
+
+    def actualizar_estado_turno(self, turno: Turno, estado_anterior: EstadoTurno):
+        self._ejecutar(
+            ACTUALIZAR_ESTADO_TURNO, (turno.obtener_estado(), turno.obtener_id())
+        )
+
+    def guardar_receta(self, receta: Receta):
+        self._ejecutar(
+            INSERTAR_RECETA,
+            (
+                receta.obtener_paciente().obtener_dni(),
+                receta.obtener_medico().obtener_matricula(),
+                parsear_fecha(receta.obtener_fecha()).isoformat(),
+                json.dumps(receta.obtener_medicamentos(), ensure_ascii=False),
+                receta.obtener_indicaciones(),
+            ),
+        )
+
+    def confirmar(self):
+        self.__conexion__.commit()
+        self.__pendientes__ = 0
+
+    def cerrar(self):
+        self.confirmar()
+        self.__conexion__.close()
+
+    def _ejecutar(self, sentencia: str, parametros: tuple):
+        with self._escritura(1) as conexion:
+            conexion.execute(sentencia, parametros)
+
+    @contextmanager
+    def _escritura(self, cantidad: int):
+        conexion = self.__conexion__
+        if not conexion.in_transaction:
+            conexion.execute("BEGIN")
+        conexion.execute("SAVEPOINT escritura")
+        try:
+            yield conexion
+            self.__pendientes__ += cantidad
+            if self.__pendientes__ >= self.__tamanio_lote__:
+                self.confirmar()
+            else:
+                conexion.execute("RELEASE escritura")
+        except BaseException:
+            if conexion.in_transaction:
+                conexion.execute("ROLLBACK TO escritura")
+                conexion.execute("RELEASE escritura")
+            raise
@@ -0,0 +1,103 @@
+import gc
+import unittest
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno, EstadoTurno
+from src.modelo.clinica import Clinica
+from src.modelo.almacen_turnos import AlmacenTurnos, AlmacenTurnosColumnar
+from src.excepciones import DatosInvalidosException, TurnoOcupadoException
+
+
+class TestAlmacenTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.medico = Medico("Dr. Juan García", "M12345")
+        self.medico.agregar_especialidad(
+            Especialidad("Pediatría", ["lunes", "miércoles", "viernes"])
+        )
+
+    def crear_turno(self, fecha: str, hora: str) -> Turno:
+        return Turno(self.paciente, self.medico, fecha, hora, "Pediatría")
+
+    def verificar_almacen(self, almacen: AlmacenTurnos):
+        cambios = []
+        almacen.agregar_observador(lambda t, anterior: cambios.append(t.obtener_id()))
+
+        self.assertEqual(almacen.agregar(self.crear_turno("16/07/2025", "10:30")), 0)
+        self.assertEqual(almacen.agregar(self.crear_turno("18/07/2025", "11:00")), 1)
+        self.assertEqual(almacen.agregar(self.crear_turno("21/07/2025", "09:00")), 2)
+        self.assertEqual(len(almacen), 3)
+
+        almacen.obtener(1).marcar_cancelado()
+        self.assertEqual(cambios, [1])
+        self.assertEqual(almacen.obtener_estado(1), EstadoTurno.CANCELADO)
+        self.assertEqual(almacen.obtener_estado(2), EstadoTurno.PROGRAMADO)
+
+        almacen.descartar_desde(2)
+        self.assertEqual(len(almacen), 2)
+        self.assertEqual(
+            [t.obtener_fecha() for t in almacen],
+            ["16/07/2025", "18/07/2025"],
+        )
+
+    def test_almacen_en_lista(self):
+        self.verificar_almacen(AlmacenTurnos())
+
+    def test_almacen_columnar(self):
+        self.verificar_almacen(AlmacenTurnosColumnar())
+
+    def test_columnar_materializa_bajo_demanda(self):
+        almacen = AlmacenTurnosColumnar()
+        turno = self.crear_turno("16/07/2025", "10:30")
+        fila = almacen.agregar(turno)
+
+        self.assertIs(almacen.obtener(fila), turno)
+
+        del turno
+        gc.collect()
+
+        reconstruido = almacen.obtener(fila)
+        self.assertEqual(reconstruido.obtener_fecha(), "16/07/2025")
+        self.assertEqual(reconstruido.obtener_hora(), "10:30")
+        self.assertEqual(reconstruido.obtener_paciente().obtener_dni(), "12345678")
+        self.assertEqual(reconstruido.obtener_id(), fila)
+        self.assertIs(almacen.obtener(fila), reconstruido)
+
+        reconstruido.marcar_completado()
+        self.assertEqual(almacen.obtener_estado(fila), EstadoTurno.COMPLETADO)
+
+        del reconstruido
+        gc.collect()
+        self.assertEqual(almacen.obtener(fila).obtener_version(), 1)
+
+    def test_turno_no_se_agrega_dos_veces(self):
+        turno = self.crear_turno("16/07/2025", "10:30")
+        AlmacenTurnos().agregar(turno)
+
+        with self.assertRaises(DatosInvalidosException):
+            AlmacenTurnosColumnar().agregar(turno)
+
+    def test_clinica_con_almacen_columnar(self):
+        clinica = Clinica(almacen_turnos=AlmacenTurnosColumnar())
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.registrar_medico("Dr. Juan García", "M12345")
+        clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["miércoles"])
+
+        clinica.agendar_turno("12345678", "M12345", "16/07/2025", "10:30", "Pediatría")
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno(
+                "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+            )
+
+        turnos = list(
+            clinica.obtener_turnos_medico("M12345", "16/07/2025", "16/07/2025")
+        )
+        turnos[0].marcar_cancelado()
+
+        clinica.agendar_turno("12345678", "M12345", "16/07/2025", "10:30", "Pediatría")
+
+
+if __name__ == "__main__":
+    unittest.main()
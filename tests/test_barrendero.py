@@ -0,0 +1,238 @@
+import asyncio
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.modelo.clinica import Clinica
+from src.modelo.clinica_concurrente import ClinicaConcurrente
+from src.modelo.barrendero import BarrenderoTurnos
+from src.modelo.eventos import TipoEvento
+from src.modelo.turno import EstadoTurno
+from src.persistencia.repositorio import Repositorio
+from src.persistencia.sqlite import RepositorioSQLite
+from src.excepciones import DatosInvalidosException, EstadoTurnoInvalidoException
+
+HORAS = [f"{hora:02d}:{minuto:02d}" for hora in range(8, 18) for minuto in (0, 30)]
+
+
+class RepositorioContador(Repositorio):
+
+    def __init__(self):
+        self.actualizados = 0
+        self.confirmaciones = 0
+
+    def actualizar_estado_turno(self, turno, estado_anterior):
+        self.actualizados += 1
+
+    def confirmar(self):
+        self.confirmaciones += 1
+
+
+def poblar(clinica: Clinica, fechas: list[str]):
+    clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+    clinica.registrar_medico("Dr. Juan García", "M12345")
+    clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+    return clinica.agendar_turnos_lote(
+        [
+            ("12345678", "M12345", fecha, hora, "Pediatría")
+            for fecha in fechas
+            for hora in HORAS
+        ]
+    )
+
+
+class TestBarrenderoTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.repositorio = RepositorioContador()
+        self.clinica = Clinica(repositorio=self.repositorio)
+        self.turnos = poblar(self.clinica, ["21/07/2025", "14/07/2025"])
+
+    def test_barrer_por_lotes_confirma_cada_lote(self):
+        barrendero = BarrenderoTurnos(self.clinica, tamanio_lote=8)
+        confirmaciones = self.repositorio.confirmaciones
+
+        barridos = barrendero.barrer(datetime(2025, 7, 14, 23, 59))
+
+        self.assertEqual(barridos, len(HORAS))
+        self.assertEqual(self.repositorio.actualizados, len(HORAS))
+        self.assertEqual(self.repositorio.confirmaciones, confirmaciones + 3)
+        self.assertEqual(self.clinica.contar_turnos_dia("14/07/2025", "Completado"), 20)
+        self.assertEqual(self.clinica.contar_turnos_dia("21/07/2025", "Programado"), 20)
+        self.assertEqual(barrendero.barrer(datetime(2025, 7, 14, 23, 59)), 0)
+        self.assertEqual(barrendero.obtener_barridos(), len(HORAS))
+
+    def test_lote_respeta_orden_y_tolerancia(self):
+        barrendero = BarrenderoTurnos(
+            self.clinica,
+            EstadoTurno.AUSENTE,
+            tamanio_lote=3,
+            tolerancia=timedelta(minutes=30),
+        )
+
+        lote = barrendero.barrer_lote(datetime(2025, 7, 14, 10, 0))
+        self.assertEqual([turno.obtener_hora() for turno in lote], HORAS[:3])
+        self.assertEqual(barrendero.barrer_lote(datetime(2025, 7, 14, 10, 0)), [])
+        lote = barrendero.barrer_lote(datetime(2025, 7, 14, 10, 0, 1))
+        self.assertEqual([turno.obtener_hora() for turno in lote], ["09:30"])
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.AUSENTE), 4)
+
+    def test_no_barre_turnos_en_su_minuto_de_inicio(self):
+        barrendero = BarrenderoTurnos(self.clinica, "Ausente")
+
+        self.assertEqual(barrendero.barrer(datetime(2025, 7, 14, 8, 0)), 0)
+        self.assertEqual(self.turnos[20].obtener_estado(), "Programado")
+        self.clinica.completar_turno(self.turnos[20].obtener_id())
+        self.assertEqual(barrendero.barrer(datetime(2025, 7, 14, 8, 30)), 0)
+        self.assertEqual(barrendero.barrer(datetime(2025, 7, 14, 8, 30, 0, 1)), 1)
+        self.assertEqual(self.turnos[21].obtener_estado(), "Ausente")
+
+    def test_omite_turnos_que_ya_cambiaron_de_estado(self):
+        suscripcion = self.clinica.obtener_eventos().suscribir()
+        self.clinica.cancelar_turno(self.turnos[20].obtener_id())
+        self.clinica.completar_turno(self.turnos[21].obtener_id())
+        suscripcion.recibir_pendientes()
+
+        barrendero = BarrenderoTurnos(self.clinica, "Ausente")
+        self.assertEqual(barrendero.barrer(datetime(2025, 7, 14, 9, 30)), 1)
+
+        self.assertEqual(self.turnos[22].obtener_estado(), "Ausente")
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 1)
+        eventos = suscripcion.recibir_pendientes()
+        self.assertEqual(
+            [evento.obtener_tipo() for evento in eventos], [TipoEvento.TURNO_AUSENTE]
+        )
+        self.assertIs(eventos[0].obtener_objeto(), self.turnos[22])
+
+    def test_barrer_periodicamente(self):
+        instantes = iter(
+            [datetime(2025, 7, 14, 8, 30), datetime(2025, 7, 21, 8, 0)]
+            + [datetime(2025, 7, 21, 8, 0)] * 10
+        )
+        barrendero = BarrenderoTurnos(
+            self.clinica, tamanio_lote=4, reloj=lambda: next(instantes)
+        )
+
+        async def ejecutar():
+            tarea = asyncio.create_task(barrendero.barrer_periodicamente(0))
+            while barrendero.obtener_barridos() < len(HORAS):
+                await asyncio.sleep(0)
+            tarea.cancel()
+
+        asyncio.run(ejecutar())
+        self.assertEqual(barrendero.obtener_barridos(), len(HORAS))
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 20)
+
+    def test_barrer_periodicamente_continua_tras_un_error(self):
+        fallos = iter([OSError("disco lleno")])
+
+        def confirmar():
+            error = next(fallos, None)
+            if error is not None:
+                raise error
+            self.repositorio.confirmaciones += 1
+
+        self.repositorio.confirmar = confirmar
+        barrendero = BarrenderoTurnos(
+            self.clinica, tamanio_lote=4, reloj=lambda: datetime(2025, 7, 14, 23, 59)
+        )
+
+        async def ejecutar():
+            tarea = asyncio.create_task(barrendero.barrer_periodicamente(0))
+            while barrendero.obtener_barridos() < len(HORAS):
+                await asyncio.sleep(0)
+            tarea.cancel()
+
+        errores = io.StringIO()
+        with contextlib.redirect_stderr(errores):
+            asyncio.run(ejecutar())
+        self.assertIn("disco lleno", errores.getvalue())
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 20)
+
+    def test_barrer_periodicamente_a_traves_de_un_aplicador(self):
+        aplicadas = []
+
+        async def aplicar(operacion):
+            aplicadas.append(operacion)
+            return operacion()
+
+        barrendero = BarrenderoTurnos(
+            self.clinica, tamanio_lote=8, reloj=lambda: datetime(2025, 7, 14, 23, 59)
+        )
+        confirmaciones = self.repositorio.confirmaciones
+
+        async def ejecutar():
+            tarea = asyncio.create_task(barrendero.barrer_periodicamente(0, aplicar))
+            while barrendero.obtener_barridos() < len(HORAS):
+                await asyncio.sleep(0)
+            tarea.cancel()
+
+        asyncio.run(ejecutar())
+        self.assertGreaterEqual(len(aplicadas), 3)
+        self.assertEqual(self.repositorio.confirmaciones, confirmaciones)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 20)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            BarrenderoTurnos(self.clinica, EstadoTurno.CANCELADO)
+        with self.assertRaises(DatosInvalidosException):
+            BarrenderoTurnos(self.clinica, "Vencido")
+        with self.assertRaises(DatosInvalidosException):
+            BarrenderoTurnos(self.clinica, tamanio_lote=0)
+        with self.assertRaises(DatosInvalidosException):
+            BarrenderoTurnos(self.clinica, tolerancia=timedelta(minutes=-1))
+
+
+class TestBarrenderoPersistencia(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_recargar_conserva_estados_barridos(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        poblar(clinica, ["14/07/2025", "21/07/2025"])
+        BarrenderoTurnos(clinica, EstadoTurno.AUSENTE).barrer(datetime(2025, 7, 15))
+        clinica.cerrar()
+
+        recargada = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.assertEqual(recargada.contar_turnos(EstadoTurno.AUSENTE), len(HORAS))
+        barridos = recargada.barrer_turnos_vencidos(datetime(2025, 7, 31))
+        self.assertEqual(len(barridos), len(HORAS))
+        self.assertEqual({turno.obtener_fecha() for turno in barridos}, {"21/07/2025"})
+        recargada.cerrar()
+
+    def test_barrido_concurrente_con_cancelaciones(self):
+        clinica = ClinicaConcurrente()
+        turnos = poblar(clinica, ["14/07/2025"])
+        barrendero = BarrenderoTurnos(clinica, tamanio_lote=2)
+
+        def cancelar():
+            for turno in turnos[::2]:
+                try:
+                    clinica.cancelar_turno(turno.obtener_id())
+                except EstadoTurnoInvalidoException:
+                    continue
+
+        hilo = threading.Thread(target=cancelar)
+        hilo.start()
+        barridos = barrendero.barrer(datetime(2025, 7, 15))
+        hilo.join()
+
+        self.assertEqual(
+            clinica.contar_turnos(EstadoTurno.CANCELADO)
+            + clinica.contar_turnos(EstadoTurno.COMPLETADO),
+            len(HORAS),
+        )
+        self.assertEqual(clinica.contar_turnos(EstadoTurno.COMPLETADO), barridos)
+
+
+if __name__ == "__main__":
+    unittest.main()
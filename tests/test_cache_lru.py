@@ -0,0 +1,66 @@
+import unittest
+from src.modelo.cache_lru import CacheLRU
+from src.excepciones import DatosInvalidosException
+
+
+class TestCacheLRU(unittest.TestCase):
+
+    def test_desaloja_el_menos_usado(self):
+        cache = CacheLRU(capacidad=2)
+        cache.agregar("a", 1)
+        cache.agregar("b", 2)
+        self.assertEqual(cache.obtener("a"), 1)
+        cache.agregar("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.obtener("b"))
+        self.assertEqual(
+            cache.obtener_estadisticas(),
+            {"aciertos": 1, "fallos": 1, "desalojos": 1, "entradas": 2, "peso": 0},
+        )
+
+    def test_consultar_no_cuenta_ni_reordena(self):
+        cache = CacheLRU(capacidad=2)
+        cache.agregar("a", 1)
+        cache.agregar("b", 2)
+        self.assertEqual(cache.consultar("a"), 1)
+        cache.agregar("c", 3)
+
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.obtener_estadisticas()["aciertos"], 0)
+
+    def test_limite_de_peso(self):
+        cache = CacheLRU(limite_peso=10, peso=len)
+        cache.agregar("a", [0] * 4)
+        cache.agregar("b", [0] * 4)
+        lista = [0] * 4
+        cache.agregar("c", lista)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.obtener_estadisticas()["peso"], 8)
+
+        lista.extend([0] * 4)
+        cache.actualizar("c")
+        self.assertEqual(list(cache.valores()), [lista])
+
+    def test_conserva_al_menos_una_entrada(self):
+        cache = CacheLRU(limite_peso=1, peso=len)
+        cache.agregar("a", [0] * 5)
+        self.assertIn("a", cache)
+
+    def test_sin_limite(self):
+        cache = CacheLRU()
+        self.assertFalse(cache.es_limitada())
+        for i in range(100):
+            cache.agregar(i, i)
+        self.assertEqual(len(cache), 100)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            CacheLRU(capacidad=0)
+        with self.assertRaises(DatosInvalidosException):
+            CacheLRU(limite_peso=100)
+
+
+if __name__ == "__main__":
+    unittest.main()
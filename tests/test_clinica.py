@@ -1,10 +1,15 @@
 import unittest
+from datetime import datetime
 from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
 from src.excepciones import (
     DatosInvalidosException,
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     TurnoOcupadoException,
+    MedicoNoDisponibleException,
+    LoteInvalidoException,
+    VersionObsoletaException,
 )
 
 
@@ -59,6 +64,38 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(MedicoNoEncontradoException):
             self.clinica.agregar_especialidad_a_medico("M99999", "Pediatría", ["lunes"])
 
+    def test_buscar_medicos_por_especialidad_y_dia(self):
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.registrar_medico("Dr. Lucas Gauna", "M67890")
+        self.clinica.registrar_medico("Dra. Ana Ruiz", "M11111")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Cardiología", ["lunes", "jueves"]
+        )
+        self.clinica.agregar_especialidad_a_medico("M67890", "Pediatría", ["jueves"])
+        self.clinica.agregar_especialidad_a_medico(
+            "M67890", "Cardiología", ["jueves", "viernes"]
+        )
+        self.clinica.agregar_especialidad_a_medico("M11111", "Cardiología", ["martes"])
+
+        cardiologos = self.clinica.buscar_medicos_por_especialidad("Cardiología")
+        self.assertEqual(
+            [m.obtener_matricula() for m in cardiologos], ["M12345", "M67890", "M11111"]
+        )
+
+        jueves = self.clinica.buscar_medicos_por_especialidad_y_dia(
+            "Cardiología", "Jueves"
+        )
+        self.assertEqual([m.obtener_matricula() for m in jueves], ["M12345"])
+
+        viernes = self.clinica.buscar_medicos_por_especialidad_y_dia(
+            "Cardiología", "viernes"
+        )
+        self.assertEqual([m.obtener_matricula() for m in viernes], ["M67890"])
+
+        self.assertEqual(self.clinica.buscar_medicos_por_especialidad("Dermatología"), [])
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.buscar_medicos_por_especialidad_y_dia("Cardiología", "feriado")
+
     def test_agendar_turno_valido(self):
 
         self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
@@ -111,6 +148,270 @@ class TestClinica(unittest.TestCase):
                 "87654321", "M12345", "16/07/2025", "10:30", "Pediatría"
             )
 
+    def test_agendar_turno_ocupado_formato_equivalente(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        )
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno(
+                "87654321", "M12345", "16/7/2025", "10:30", "Pediatría"
+            )
+
+    def test_agendar_turno_en_horario_cancelado(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+
+        turno = self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        )
+        turno.marcar_cancelado()
+
+        nuevo = self.clinica.agendar_turno(
+            "87654321", "M12345", "16/07/2025", "10:30", "Pediatría"
+        )
+        self.assertEqual(nuevo.obtener_paciente().obtener_dni(), "87654321")
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno(
+                "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+            )
+
+    def test_obtener_turnos_medico_por_rango(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+
+        for fecha, hora in [
+            ("18/07/2025", "09:00"),
+            ("16/07/2025", "15:00"),
+            ("14/07/2025", "10:00"),
+            ("16/07/2025", "08:30"),
+            ("21/07/2025", "10:00"),
+        ]:
+            self.clinica.agendar_turno("12345678", "M12345", fecha, hora, "Pediatría")
+
+        turnos = self.clinica.obtener_turnos_medico("M12345", "16/07/2025", "18/07/2025")
+        self.assertNotIsInstance(turnos, list)
+
+        horarios = [(t.obtener_fecha(), t.obtener_hora()) for t in turnos]
+        self.assertEqual(
+            horarios,
+            [("16/07/2025", "08:30"), ("16/07/2025", "15:00"), ("18/07/2025", "09:00")],
+        )
+
+    def test_obtener_turnos_medico_no_ve_turnos_posteriores(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        for hora in ("09:00", "10:00", "11:00"):
+            self.clinica.agendar_turno(
+                "12345678", "M12345", "14/07/2025", hora, "Pediatría"
+            )
+
+        turnos = self.clinica.obtener_turnos_medico(
+            "M12345", "14/07/2025", "14/07/2025"
+        )
+        primero = next(turnos)
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "08:00", "Pediatría"
+        )
+        self.clinica.agendar_turnos_lote(
+            [("12345678", "M12345", "14/07/2025", "09:30", "Pediatría")]
+        )
+
+        horas = [primero.obtener_hora()] + [t.obtener_hora() for t in turnos]
+        self.assertEqual(horas, ["09:00", "10:00", "11:00"])
+
+    def test_obtener_turnos_medico_invalido(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_turnos_medico("M99999", "16/07/2025", "18/07/2025")
+
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.obtener_turnos_medico("M12345", "2025-07-16", "18/07/2025")
+
+    def test_agendar_turnos_lote_valido(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+
+        turnos = self.clinica.agendar_turnos_lote(
+            [
+                ("12345678", "M12345", "18/07/2025", "10:00", "Pediatría"),
+                ("87654321", "M12345", "16/07/2025", "10:00", "Pediatría"),
+                ("12345678", "M12345", "16/07/2025", "11:00", "Pediatría"),
+            ]
+        )
+
+        self.assertEqual(len(turnos), 3)
+        self.assertEqual(turnos[1].obtener_paciente().obtener_dni(), "87654321")
+        self.assertEqual(
+            len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 2
+        )
+
+        horarios = [
+            (t.obtener_fecha(), t.obtener_hora())
+            for t in self.clinica.obtener_turnos_medico(
+                "M12345", "01/07/2025", "31/07/2025"
+            )
+        ]
+        self.assertEqual(
+            horarios,
+            [
+                ("16/07/2025", "10:00"),
+                ("16/07/2025", "11:00"),
+                ("18/07/2025", "10:00"),
+            ],
+        )
+
+    def test_agendar_turnos_lote_todo_o_nada(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+
+        with self.assertRaises(LoteInvalidoException) as contexto:
+            self.clinica.agendar_turnos_lote(
+                [
+                    ("12345678", "M12345", "16/07/2025", "10:00", "Pediatría"),
+                    ("12345678", "M12345", "16/07/2025", "10:00", "Pediatría"),
+                    ("12345678", "M12345", "17/07/2025", "10:00", "Pediatría"),
+                    ("12345678", "M12345", "14/07/2025", "09:00", "Pediatría"),
+                    ("12345678", "M12345", "16/07/2025"),
+                ]
+            )
+
+        errores = contexto.exception.errores
+        self.assertEqual([indice for indice, _ in errores], [1, 2, 3, 4])
+        self.assertIsInstance(errores[0][1], TurnoOcupadoException)
+        self.assertIsInstance(errores[1][1], MedicoNoDisponibleException)
+        self.assertIsInstance(errores[2][1], TurnoOcupadoException)
+        self.assertIsInstance(errores[3][1], DatosInvalidosException)
+
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:00", "Pediatría"
+        )
+
+    def test_buscar_turnos_disponibles(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.registrar_medico("Dr. Lucas Gauna", "M67890")
+        self.clinica.registrar_medico("Dra. Ana Ruiz", "M11111")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles"]
+        )
+        self.clinica.agregar_especialidad_a_medico("M67890", "Pediatría", ["martes"])
+        self.clinica.agregar_especialidad_a_medico("M11111", "Cardiología", ["lunes"])
+
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "08:00", "Pediatría"
+        )
+        cancelado = self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "08:30", "Pediatría"
+        )
+        cancelado.marcar_cancelado()
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:15", "Pediatría"
+        )
+
+        disponibles = self.clinica.buscar_turnos_disponibles(
+            "Pediatría", "13/07/2025", "20/07/2025", 30, cantidad=3
+        )
+        self.assertNotIsInstance(disponibles, list)
+        self.assertEqual(
+            list(disponibles),
+            [
+                ("M12345", "14/07/2025", "08:30"),
+                ("M12345", "14/07/2025", "09:30"),
+                ("M12345", "14/07/2025", "10:00"),
+            ],
+        )
+
+        primeros_martes = self.clinica.buscar_turnos_disponibles(
+            "Pediatría", "15/07/2025", "15/07/2025", 60, hora_fin="10:00"
+        )
+        self.assertEqual(
+            list(primeros_martes),
+            [("M67890", "15/07/2025", "08:00"), ("M67890", "15/07/2025", "09:00")],
+        )
+
+    def test_buscar_turnos_disponibles_datos_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.buscar_turnos_disponibles("", "13/07/2025", "20/07/2025", 30)
+
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.buscar_turnos_disponibles(
+                "Pediatría", "13/07/2025", "20/07/2025", 0
+            )
+
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.buscar_turnos_disponibles(
+                "Pediatría", "2025-07-13", "20/07/2025", 30
+            )
+
+    def test_contadores_de_estado(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "02/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.registrar_medico("Dr. Lucas Gauna", "M67890")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        self.clinica.agregar_especialidad_a_medico("M67890", "Cardiología", ["lunes"])
+
+        t1 = self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+        t2 = self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "09:00", "Pediatría"
+        )
+        self.clinica.agendar_turno(
+            "12345678", "M67890", "14/07/2025", "09:00", "Cardiología"
+        )
+
+        t1.marcar_completado()
+        t2.marcar_cancelado()
+
+        self.assertEqual(self.clinica.contar_turnos(), 3)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 1)
+        self.assertEqual(self.clinica.contar_turnos("Cancelado"), 1)
+        self.assertEqual(
+            self.clinica.contar_turnos_medico("M12345", EstadoTurno.PROGRAMADO), 0
+        )
+        self.assertEqual(self.clinica.contar_turnos_medico("M12345"), 2)
+        self.assertEqual(self.clinica.contar_turnos_dia("14/07/2025"), 2)
+        self.assertEqual(
+            self.clinica.contar_turnos_dia("14/07/2025", EstadoTurno.COMPLETADO), 1
+        )
+        self.assertEqual(self.clinica.contar_turnos_dia("15/07/2025"), 0)
+
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.contar_turnos("Perdido")
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.contar_turnos_medico("M99999")
+
     def test_emitir_receta_valida(self):
         self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
         self.clinica.registrar_medico("Dr. Juan García", "M12345")
@@ -204,5 +505,184 @@ class TestClinica(unittest.TestCase):
             self.clinica.buscar_medico("M99999")
 
 
+    def test_iter_pacientes_con_cursor_y_limite(self):
+        for dni in ["30000000", "10000000", "20000000", "40000000"]:
+            self.clinica.registrar_paciente(f"Paciente {dni}", dni, "01/01/1990")
+
+        primera = list(self.clinica.iter_pacientes(limite=2))
+        self.assertEqual(
+            [p.obtener_dni() for p in primera], ["10000000", "20000000"]
+        )
+
+        self.clinica.registrar_paciente("Paciente nuevo", "15000000", "01/01/1990")
+        segunda = self.clinica.iter_pacientes(
+            despues_de=primera[-1].obtener_dni(), limite=2
+        )
+        self.assertEqual(
+            [p.obtener_dni() for p in segunda], ["30000000", "40000000"]
+        )
+
+        descendente = self.clinica.iter_pacientes(
+            despues_de="30000000", descendente=True
+        )
+        self.assertEqual(
+            [p.obtener_dni() for p in descendente],
+            ["20000000", "15000000", "10000000"],
+        )
+        self.assertEqual(self.clinica.contar_pacientes(), 5)
+
+    def test_iter_medicos_ordenados_por_matricula(self):
+        self.clinica.registrar_medico("Dra. Ana López", "M2")
+        self.clinica.registrar_medico("Dr. Juan García", "M1")
+
+        self.assertEqual(
+            [m.obtener_matricula() for m in self.clinica.iter_medicos()], ["M1", "M2"]
+        )
+        self.assertEqual(
+            [m.obtener_matricula() for m in self.clinica.iter_medicos("M1")],
+            ["M2"],
+        )
+        self.assertEqual(self.clinica.contar_medicos(), 2)
+
+    def test_iter_turnos_con_cursor(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        for hora in ["09:00", "09:30", "10:00"]:
+            self.clinica.agendar_turno(
+                "12345678", "M12345", "14/07/2025", hora, "Pediatría"
+            )
+
+        self.assertEqual(
+            [t.obtener_id() for t in self.clinica.iter_turnos(despues_de=0)], [1, 2]
+        )
+        self.assertEqual(
+            [t.obtener_id() for t in self.clinica.iter_turnos(limite=2)], [0, 1]
+        )
+        self.assertEqual(
+            [
+                t.obtener_id()
+                for t in self.clinica.iter_turnos(despues_de=2, descendente=True)
+            ],
+            [1, 0],
+        )
+        self.assertEqual(list(self.clinica.iter_turnos(despues_de=2)), [])
+
+    def test_iter_limite_invalido(self):
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.iter_pacientes(limite=0)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.iter_turnos(despues_de="0")
+
+    def test_cancelar_y_completar_turno_por_identificador(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        primero = self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+        segundo = self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "10:00", "Pediatría"
+        )
+
+        self.assertIs(self.clinica.cancelar_turno(primero.obtener_id()), primero)
+        self.clinica.completar_turno(segundo.obtener_id())
+
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 1)
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+
+    def test_cambios_de_estado_y_recetas_con_version(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        turno = self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+        version = turno.obtener_version()
+
+        self.clinica.cancelar_turno(turno.obtener_id(), version)
+        with self.assertRaises(VersionObsoletaException):
+            self.clinica.completar_turno(turno.obtener_id(), version)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        version = historia.obtener_version()
+        self.clinica.emitir_receta(
+            "12345678", "M12345", "14/07/2025", ["Ibuprofeno"], "Cada 8 hs", version
+        )
+        with self.assertRaises(VersionObsoletaException):
+            self.clinica.emitir_receta(
+                "12345678", "M12345", "14/07/2025", ["Amoxicilina"], "Cada 12", version
+            )
+        self.assertEqual(historia.contar_recetas(), 1)
+
+    def test_barrer_turnos_vencidos(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        turnos = self.clinica.agendar_turnos_lote(
+            [
+                ("12345678", "M12345", fecha, hora, "Pediatría")
+                for fecha, hora in [
+                    ("21/07/2025", "09:00"),
+                    ("14/07/2025", "11:00"),
+                    ("14/07/2025", "09:00"),
+                    ("14/07/2025", "10:00"),
+                    ("14/07/2025", "09:30"),
+                ]
+            ]
+        )
+        self.clinica.cancelar_turno(turnos[3].obtener_id())
+        self.clinica.completar_turno(turnos[4].obtener_id())
+
+        barridos = self.clinica.barrer_turnos_vencidos(datetime(2025, 7, 14, 10, 0))
+        self.assertEqual(barridos, [turnos[2]])
+        self.assertEqual(turnos[2].obtener_estado_turno(), EstadoTurno.COMPLETADO)
+        self.assertEqual(
+            self.clinica.barrer_turnos_vencidos(datetime(2025, 7, 14, 10, 59)), []
+        )
+
+        barridos = self.clinica.barrer_turnos_vencidos(
+            datetime(2025, 7, 31), EstadoTurno.AUSENTE, limite=1
+        )
+        self.assertEqual(barridos, [turnos[1]])
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.AUSENTE), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 1)
+        self.assertEqual(
+            self.clinica.barrer_turnos_vencidos(datetime(2025, 7, 31), "Ausente"),
+            [turnos[0]],
+        )
+        self.assertEqual(self.clinica.contar_turnos_dia("21/07/2025", "Ausente"), 1)
+
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.barrer_turnos_vencidos(estado=EstadoTurno.CANCELADO)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.barrer_turnos_vencidos(estado="Vencido")
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.barrer_turnos_vencidos(limite=0)
+
+    def test_validar_turnos_lote_no_registra_y_respeta_ocupados(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        solicitudes = [
+            ("12345678", "M12345", "14/07/2025", "09:00", "Pediatría"),
+            ("12345678", "M12345", "14/07/2025", "10:00", "Pediatría"),
+        ]
+
+        turnos = self.clinica.validar_turnos_lote(solicitudes)
+        self.assertEqual(len(turnos), 2)
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+
+        with self.assertRaises(LoteInvalidoException) as contexto:
+            self.clinica.validar_turnos_lote(
+                solicitudes, {("M12345", turnos[1].obtener_fecha_hora())}
+            )
+        self.assertEqual([indice for indice, _ in contexto.exception.errores], [1])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import io
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from src.modelo.clinica import Clinica
+from src.modelo.clinica_asincronica import ClinicaAsincronica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.repositorio import Repositorio
+from src.excepciones import (
+    DatosInvalidosException,
+    LoteInvalidoException,
+    MedicoNoDisponibleException,
+    PacienteNoEncontradoException,
+    RepositorioNoDisponibleException,
+    TurnoOcupadoException,
+)
+
+HORAS = [f"{hora:02d}:{minuto:02d}" for hora in range(8, 18) for minuto in (0, 30)]
+
+
+class RepositorioContador(Repositorio):
+
+    def __init__(self):
+        self.lotes_turnos = []
+        self.confirmaciones = 0
+        self.fallar = False
+
+    def guardar_turnos(self, turnos):
+        self.lotes_turnos.append(len(turnos))
+
+    def confirmar(self):
+        if self.fallar:
+            raise OSError("disco lleno")
+        self.confirmaciones += 1
+
+
+class EjecutorContador(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.hilos = set()
+
+    def submit(self, funcion, *argumentos, **opciones):
+        def registrar():
+            self.hilos.add(threading.get_ident())
+            return funcion(*argumentos, **opciones)
+
+        return super().submit(registrar)
+
+
+class TestClinicaAsincronica(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.repositorio = RepositorioContador()
+        self.ejecutor = EjecutorContador()
+        self.asincronica = ClinicaAsincronica(
+            Clinica(repositorio=self.repositorio), self.ejecutor
+        )
+        await self.asincronica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        await self.asincronica.registrar_medico("Dr. Juan García", "M12345")
+        await self.asincronica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes"]
+        )
+
+    async def asyncTearDown(self):
+        await self.asincronica.detener()
+        self.ejecutor.shutdown()
+
+    def solicitud(self, hora: str, dni: str = "12345678", fecha: str = "14/07/2025"):
+        return (dni, "M12345", fecha, hora, "Pediatría")
+
+    async def test_turnos_simultaneos_se_agrupan_en_un_lote(self):
+        confirmaciones = self.repositorio.confirmaciones
+        turnos = await asyncio.gather(
+            *(self.asincronica.agendar_turno(*self.solicitud(hora)) for hora in HORAS)
+        )
+
+        self.assertEqual([turno.obtener_hora() for turno in turnos], HORAS)
+        self.assertEqual(self.repositorio.lotes_turnos, [len(HORAS)])
+        self.assertEqual(self.repositorio.confirmaciones, confirmaciones + 1)
+        self.assertEqual(await self.asincronica.contar_turnos(), len(HORAS))
+        self.assertNotIn(threading.get_ident(), self.ejecutor.hilos)
+        self.assertEqual(len(self.ejecutor.hilos), 1)
+
+    async def test_errores_afectan_solo_a_su_solicitud(self):
+        solicitudes = [
+            self.solicitud("09:00"),
+            self.solicitud("09:00"),
+            self.solicitud("10:00", dni="99999999"),
+            self.solicitud("10:00", fecha="15/07/2025"),
+            self.solicitud("10:00", fecha="32/07/2025"),
+            self.solicitud("10:00"),
+        ]
+        resultados = await asyncio.gather(
+            *(self.asincronica.agendar_turno(*solicitud) for solicitud in solicitudes),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(resultados[0].obtener_hora(), "09:00")
+        self.assertIsInstance(resultados[1], TurnoOcupadoException)
+        self.assertIsInstance(resultados[2], PacienteNoEncontradoException)
+        self.assertIsInstance(resultados[3], MedicoNoDisponibleException)
+        self.assertIsInstance(resultados[4], DatosInvalidosException)
+        self.assertEqual(resultados[5].obtener_hora(), "10:00")
+        self.assertEqual(self.repositorio.lotes_turnos, [2])
+        self.assertEqual(await self.asincronica.contar_turnos(), 2)
+
+    async def test_escrituras_se_aplican_en_orden_de_llegada(self):
+        paciente, turno = await asyncio.gather(
+            self.asincronica.registrar_paciente("Ana Díaz", "87654321", "01/01/1990"),
+            self.asincronica.agendar_turno(*self.solicitud("09:00", dni="87654321")),
+        )
+
+        self.assertIs(turno.obtener_paciente(), paciente)
+        cancelado = await self.asincronica.cancelar_turno(turno.obtener_id())
+        self.assertEqual(cancelado.obtener_estado_turno(), EstadoTurno.CANCELADO)
+        otro = await self.asincronica.agendar_turno(
+            *self.solicitud("09:00", dni="87654321")
+        )
+        historia = await self.asincronica.obtener_historia_clinica("87654321")
+        self.assertEqual(historia.obtener_turnos(), [turno, otro])
+
+    async def test_lote_es_atomico(self):
+        with self.assertRaises(LoteInvalidoException):
+            await self.asincronica.agendar_turnos_lote(
+                [self.solicitud("09:00"), self.solicitud("09:00")]
+            )
+        self.assertEqual(await self.asincronica.contar_turnos(), 0)
+
+        turnos, individual = await asyncio.gather(
+            self.asincronica.agendar_turnos_lote(
+                [self.solicitud("09:00"), self.solicitud("09:30")]
+            ),
+            self.asincronica.agendar_turno(*self.solicitud("09:30")),
+            return_exceptions=True,
+        )
+        self.assertEqual(len(turnos), 2)
+        self.assertIsInstance(individual, TurnoOcupadoException)
+        disponibles = await self.asincronica.buscar_turnos_disponibles(
+            "Pediatría", "14/07/2025", "14/07/2025", 30, 1
+        )
+        self.assertEqual(disponibles, [("M12345", "14/07/2025", "08:00")])
+
+    async def test_repositorio_caido_rechaza_escrituras_nuevas(self):
+        self.repositorio.fallar = True
+        with contextlib.redirect_stderr(io.StringIO()):
+            turno = await self.asincronica.agendar_turno(*self.solicitud("09:00"))
+        self.assertEqual(turno.obtener_hora(), "09:00")
+        self.assertEqual(await self.asincronica.contar_turnos(), 1)
+
+        with self.assertRaises(RepositorioNoDisponibleException):
+            await self.asincronica.agendar_turno(*self.solicitud("09:30"))
+        with self.assertRaises(RepositorioNoDisponibleException):
+            await self.asincronica.registrar_medico("Dra. Ana López", "M54321")
+        self.assertEqual(await self.asincronica.contar_turnos(), 1)
+
+        self.repositorio.fallar = False
+        with self.assertRaises(TurnoOcupadoException):
+            await self.asincronica.agendar_turno(*self.solicitud("09:00"))
+        await self.asincronica.agendar_turno(*self.solicitud("09:30"))
+        self.assertEqual(await self.asincronica.contar_turnos(), 2)
+
+    async def test_detener_aplica_las_escrituras_pendientes(self):
+        pendiente = asyncio.ensure_future(
+            self.asincronica.agendar_turno(*self.solicitud("09:00"))
+        )
+        await asyncio.sleep(0)
+        await self.asincronica.detener()
+
+        self.assertTrue(pendiente.done())
+        self.assertEqual(pendiente.result().obtener_hora(), "09:00")
+        self.assertEqual(len(self.asincronica.obtener_clinica().listar_pacientes()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
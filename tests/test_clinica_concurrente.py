@@ -0,0 +1,239 @@
+import gc
+import random
+import sys
+import threading
+import unittest
+from src.modelo.almacen_turnos import AlmacenTurnosColumnar
+from src.modelo.clinica_concurrente import ClinicaConcurrente
+from src.modelo.cerrojos import CerrojosRayados
+from src.modelo.turno import EstadoTurno
+from src.persistencia.sqlite import RepositorioSQLite
+from src.excepciones import (
+    ClinicaException,
+    DatosInvalidosException,
+    LoteInvalidoException,
+    TurnoOcupadoException,
+    EstadoTurnoInvalidoException,
+)
+
+HILOS = 8
+MEDICOS = 3
+HORAS = [f"{hora:02d}:{minuto:02d}" for hora in range(8, 18) for minuto in (0, 30)]
+
+
+def ejecutar_en_hilos(tarea, cantidad: int = HILOS):
+    barrera = threading.Barrier(cantidad)
+    errores = []
+
+    def envolver(indice):
+        barrera.wait()
+        try:
+            tarea(indice)
+        except Exception as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=envolver, args=(i,)) for i in range(cantidad)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    if errores:
+        raise errores[0]
+
+
+class TestClinicaConcurrente(unittest.TestCase):
+
+    def setUp(self):
+        self.intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.clinica = ClinicaConcurrente(franjas=4)
+        for i in range(HILOS):
+            self.clinica.registrar_paciente("Paciente", f"1000000{i}", "01/01/1980")
+        for i in range(MEDICOS):
+            self.clinica.registrar_medico(f"Dr. Médico {i}", f"M{i}")
+            self.clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", ["lunes"])
+
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo)
+
+    def horarios_sin_duplicados(self, matricula: str) -> bool:
+        turnos = [
+            turno
+            for turno in self.clinica.obtener_turnos_medico(
+                matricula, "14/07/2025", "14/07/2025"
+            )
+            if turno.obtener_estado_turno() is not EstadoTurno.CANCELADO
+        ]
+        horas = [turno.obtener_hora() for turno in turnos]
+        return len(horas) == len(set(horas))
+
+    def test_sin_turnos_duplicados_bajo_contencion(self):
+        agendados = []
+
+        def agendar(indice):
+            horarios = [(f"M{m}", hora) for m in range(MEDICOS) for hora in HORAS]
+            random.Random(indice).shuffle(horarios)
+            for matricula, hora in horarios:
+                try:
+                    self.clinica.agendar_turno(
+                        f"1000000{indice}", matricula, "14/07/2025", hora, "Clínica"
+                    )
+                    agendados.append((matricula, hora))
+                except TurnoOcupadoException:
+                    pass
+
+        ejecutar_en_hilos(agendar)
+
+        self.assertEqual(len(agendados), MEDICOS * len(HORAS))
+        self.assertEqual(len(set(agendados)), len(agendados))
+        self.assertEqual(self.clinica.contar_turnos(), len(agendados))
+        for m in range(MEDICOS):
+            self.assertTrue(self.horarios_sin_duplicados(f"M{m}"))
+
+    def test_lotes_y_cancelaciones_concurrentes(self):
+        def trabajar(indice):
+            azar = random.Random(indice)
+            for _ in range(30):
+                matricula = f"M{azar.randrange(MEDICOS)}"
+                horas = azar.sample(HORAS, 2)
+                try:
+                    turnos = self.clinica.agendar_turnos_lote(
+                        [
+                            (f"1000000{indice}", matricula, "14/07/2025", h, "Clínica")
+                            for h in horas
+                        ]
+                    )
+                except ClinicaException:
+                    continue
+                try:
+                    self.clinica.cancelar_turno(turnos[0].obtener_id())
+                except EstadoTurnoInvalidoException:
+                    pass
+
+        ejecutar_en_hilos(trabajar)
+
+        programados = self.clinica.contar_turnos(EstadoTurno.PROGRAMADO)
+        cancelados = self.clinica.contar_turnos(EstadoTurno.CANCELADO)
+        self.assertEqual(programados + cancelados, self.clinica.contar_turnos())
+        self.assertEqual(programados, cancelados)
+        for m in range(MEDICOS):
+            self.assertTrue(self.horarios_sin_duplicados(f"M{m}"))
+
+    def test_registro_concurrente_sin_duplicados(self):
+        registrados = []
+
+        def registrar(indice):
+            for i in range(50):
+                try:
+                    self.clinica.registrar_paciente(
+                        "Nuevo", str(20000000 + i), "01/01/1990"
+                    )
+                    registrados.append(i)
+                except DatosInvalidosException:
+                    pass
+
+        ejecutar_en_hilos(registrar)
+
+        self.assertEqual(sorted(registrados), list(range(50)))
+        self.assertEqual(self.clinica.contar_pacientes(), HILOS + 50)
+        self.assertEqual(len(list(self.clinica.iter_pacientes())), HILOS + 50)
+
+    def test_lote_con_campos_no_hasheables(self):
+        with self.assertRaises(LoteInvalidoException):
+            self.clinica.agendar_turnos_lote(
+                [(["10000000"], "M0", "14/07/2025", "08:00", "Clínica")]
+            )
+        with self.assertRaises(LoteInvalidoException):
+            self.clinica.agendar_turnos_lote(
+                [("10000000", {"M0"}, "14/07/2025", "08:00", "Clínica")]
+            )
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+
+    def test_busquedas_concurrentes_con_lotes(self):
+        def trabajar(indice):
+            if indice % 2:
+                for hora in HORAS[indice::HILOS]:
+                    self.clinica.agendar_turnos_lote(
+                        [
+                            (f"1000000{indice}", f"M{m}", "14/07/2025", hora, "Clínica")
+                            for m in range(MEDICOS)
+                        ]
+                    )
+                return
+            for _ in range(20):
+                agendados = len(list(self.clinica.iter_turnos()))
+                libres = list(
+                    self.clinica.buscar_turnos_disponibles(
+                        "Clínica", "14/07/2025", "14/07/2025", 30
+                    )
+                )
+                self.assertEqual(len(libres), len(set(libres)))
+                self.assertLessEqual(agendados + len(libres), MEDICOS * len(HORAS))
+
+        ejecutar_en_hilos(trabajar)
+
+        libres = list(
+            self.clinica.buscar_turnos_disponibles(
+                "Clínica", "14/07/2025", "14/07/2025", 30
+            )
+        )
+        self.assertEqual(
+            len(libres) + self.clinica.contar_turnos(), MEDICOS * len(HORAS)
+        )
+
+    def test_turnos_materializados_una_sola_vez(self):
+        clinica = ClinicaConcurrente(
+            AlmacenTurnosColumnar(),
+            RepositorioSQLite(),
+            limite_historias=1,
+            franjas=4,
+        )
+        clinica.registrar_paciente("Paciente", "10000000", "01/01/1980")
+        clinica.registrar_medico("Dr. Médico", "M0")
+        clinica.agregar_especialidad_a_medico("M0", "Clínica", ["lunes"])
+        clinica.agendar_turnos_lote(
+            [("10000000", "M0", "14/07/2025", hora, "Clínica") for hora in HORAS]
+        )
+        clinica.registrar_paciente("Otro", "10000001", "01/01/1980")
+        gc.collect()
+        vistos = [[] for _ in range(HILOS)]
+
+        def buscar(indice):
+            for identificador in range(len(HORAS)):
+                vistos[indice].append(clinica.buscar_turno(identificador))
+
+        ejecutar_en_hilos(buscar)
+
+        for turnos in zip(*vistos):
+            self.assertTrue(all(turno is turnos[0] for turno in turnos))
+        clinica.cerrar()
+
+    def test_receta_con_version_de_historia(self):
+        version = self.clinica.obtener_historia_clinica("10000000").obtener_version()
+        hilo = threading.Thread(
+            target=self.clinica.emitir_receta,
+            args=("10000000", "M0", "14/07/2025", ["Ibuprofeno"], "Cada 8 horas"),
+            kwargs={"version_historia": version},
+        )
+        hilo.start()
+        hilo.join(5)
+
+        self.assertFalse(hilo.is_alive())
+        recetas = self.clinica.obtener_historia_clinica("10000000").obtener_recetas()
+        self.assertEqual(len(recetas), 1)
+
+    def test_cerrojos_en_orden_fijo(self):
+        cerrojos = CerrojosRayados(8)
+
+        franjas = cerrojos.franjas([("medico", "M1"), ("paciente", "1"), "x", "x"])
+
+        self.assertEqual(franjas, sorted(set(franjas)))
+        with cerrojos.bloquear(["a", "b"]):
+            with self.assertRaises(DatosInvalidosException):
+                CerrojosRayados(0)
+        with cerrojos.bloquear(["a", "b"]):
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,316 @@
+import pickle
+import threading
+import unittest
+from src.modelo.clinica import Clinica
+from src.modelo.turno import Turno, EstadoTurno
+from src.distribucion import ClinicaParticionada, particion_de
+from src.distribucion.particion import Particion
+from src.excepciones import (
+    DatosInvalidosException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    LoteInvalidoException,
+)
+
+PARTICIONES = 3
+DIAS = ["lunes", "martes", "miércoles"]
+
+
+class ConexionInterrumpida:
+
+    def __init__(self, conexion, metodo: str):
+        self.conexion = conexion
+        self.metodo = metodo
+        self.enviado = None
+
+    def send(self, mensaje):
+        self.enviado = mensaje[0] if mensaje is not None else None
+        self.conexion.send(mensaje)
+
+    def recv(self):
+        respuesta = self.conexion.recv()
+        if self.enviado == self.metodo:
+            self.metodo = None
+            return False, RuntimeError("Conexión interrumpida")
+        return respuesta
+
+    def __getattr__(self, nombre):
+        return getattr(self.conexion, nombre)
+
+
+class TestClinicaParticionada(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = ClinicaParticionada(PARTICIONES)
+        self.referencia = Clinica()
+        for clinica in (self.clinica, self.referencia):
+            for i in range(6):
+                clinica.registrar_paciente(f"Paciente {i}", f"1000000{i}", "01/01/1980")
+                clinica.registrar_medico(f"Dr. Médico {i}", f"M{i}")
+                clinica.agregar_especialidad_a_medico(f"M{i}", "Clínica", DIAS)
+
+    def tearDown(self):
+        self.clinica.cerrar()
+
+    def test_particion_de_es_determinista(self):
+        self.assertEqual(particion_de("10000000", PARTICIONES), 1)
+        self.assertEqual(particion_de("M2", PARTICIONES), 2)
+        self.assertEqual(
+            {particion_de(f"1000000{i}", PARTICIONES) for i in range(6)}, {0, 1, 2}
+        )
+
+    def test_particiones_invalidas(self):
+        with self.assertRaises(DatosInvalidosException):
+            ClinicaParticionada(0)
+
+    def test_registro_y_busqueda_en_la_particion_duenia(self):
+        self.assertEqual(self.clinica.contar_pacientes(), 6)
+        self.assertEqual(self.clinica.contar_medicos(), 6)
+        self.assertEqual(
+            self.clinica.buscar_paciente("10000003").obtener_nombre(), "Paciente 3"
+        )
+        self.assertEqual(
+            sorted(m.obtener_matricula() for m in self.clinica.listar_medicos()),
+            [f"M{i}" for i in range(6)],
+        )
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.registrar_paciente("Otro", "10000003", "01/01/1990")
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.buscar_medico("M9")
+
+    def test_agendar_turno_entre_particiones(self):
+        self.assertNotEqual(
+            particion_de("10000000", PARTICIONES), particion_de("M2", PARTICIONES)
+        )
+
+        turno = self.clinica.agendar_turno(
+            "10000000", "M2", "14/07/2025", "09:00", "Clínica"
+        )
+
+        historia = self.clinica.obtener_historia_clinica("10000000")
+        self.assertEqual(
+            [t.obtener_id() for t in historia.obtener_turnos()], [turno.obtener_id()]
+        )
+        self.assertEqual(
+            self.clinica.buscar_turno(turno.obtener_id()).obtener_hora(), "09:00"
+        )
+        self.assertEqual(
+            [
+                t.obtener_id()
+                for t in self.clinica.obtener_turnos_medico(
+                    "M2", "14/07/2025", "14/07/2025"
+                )
+            ],
+            [turno.obtener_id()],
+        )
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno(
+                "10000003", "M2", "14/07/2025", "09:00", "Clínica"
+            )
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agendar_turno(
+                "99999999", "M2", "14/07/2025", "10:00", "Clínica"
+            )
+
+    def test_lote_invalido_no_agenda_en_ninguna_particion(self):
+        with self.assertRaises(LoteInvalidoException) as contexto:
+            self.clinica.agendar_turnos_lote(
+                [
+                    ("10000000", "M2", "14/07/2025", "09:00", "Clínica"),
+                    ("10000001", "M3", "14/07/2025", "09:00", "Clínica"),
+                    ("10000002", "M0", "17/07/2025", "09:00", "Clínica"),
+                    ("10000003", "M2", "14/07/2025", "09:00", "Clínica"),
+                    ("10000004",),
+                ]
+            )
+
+        self.assertEqual([i for i, _ in contexto.exception.errores], [2, 3, 4])
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+        turnos = self.clinica.agendar_turnos_lote(
+            [
+                ("10000000", "M2", "14/07/2025", "09:00", "Clínica"),
+                ("10000001", "M3", "14/07/2025", "09:00", "Clínica"),
+            ]
+        )
+        self.assertEqual(
+            [t.obtener_paciente().obtener_dni() for t in turnos],
+            ["10000000", "10000001"],
+        )
+
+    def test_fallo_al_preparar_aborta_todas_las_particiones(self):
+        medicos = {}
+        for i in range(6):
+            medicos.setdefault(particion_de(f"M{i}", PARTICIONES), f"M{i}")
+        destinos = sorted(medicos)[:2]
+        solicitudes = [
+            ("10000000", medicos[destino], "14/07/2025", "09:00", "Clínica")
+            for destino in destinos
+        ]
+        conexiones = self.clinica.__conexiones__
+        conexiones[destinos[1]] = ConexionInterrumpida(
+            conexiones[destinos[1]], "preparar_turnos"
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.clinica.agendar_turnos_lote(solicitudes)
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+
+        turnos = self.clinica.agendar_turnos_lote(solicitudes)
+        self.assertEqual(len(turnos), 2)
+        self.assertEqual(self.clinica.contar_turnos(), 2)
+
+    def test_cambios_de_estado_llegan_a_la_historia(self):
+        turno = self.clinica.agendar_turno(
+            "10000000", "M2", "14/07/2025", "09:00", "Clínica"
+        )
+
+        cancelado = self.clinica.cancelar_turno(turno.obtener_id())
+
+        self.assertEqual(cancelado.obtener_estado_turno(), EstadoTurno.CANCELADO)
+        historia = self.clinica.obtener_historia_clinica("10000000")
+        self.assertEqual(historia.obtener_turnos()[0].obtener_estado(), "Cancelado")
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+        self.clinica.agendar_turno("10000003", "M2", "14/07/2025", "09:00", "Clínica")
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.completar_turno(10**6)
+
+    def test_emitir_receta_entre_particiones(self):
+        self.clinica.emitir_receta(
+            "10000000", "M4", "14/07/2025", ["Paracetamol"], "Cada 8 horas"
+        )
+
+        receta = self.clinica.obtener_historia_clinica("10000000").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medico().obtener_matricula(), "M4")
+        self.assertNotIn(
+            "M4",
+            [m.obtener_matricula() for m in self.clinica.iter_medicos(limite=2)],
+        )
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.emitir_receta("10000000", "M9", "14/07/2025", ["A"], "B")
+
+    def test_resultados_coinciden_con_una_clinica(self):
+        solicitudes = [
+            (f"1000000{i}", f"M{j}", fecha, hora, "Clínica")
+            for i in range(6)
+            for j, (fecha, hora) in enumerate(
+                [("14/07/2025", f"{8 + i:02d}:00"), ("15/07/2025", f"{8 + i:02d}:30")]
+            )
+        ]
+        for clinica in (self.clinica, self.referencia):
+            clinica.agendar_turnos_lote(solicitudes)
+            clinica.emitir_receta("10000005", "M1", "14/07/2025", ["A"], "B")
+
+        self.assertEqual(self.clinica.contar_turnos(), self.referencia.contar_turnos())
+        self.assertEqual(
+            self.clinica.contar_turnos_dia("15/07/2025"),
+            self.referencia.contar_turnos_dia("15/07/2025"),
+        )
+        self.assertEqual(self.clinica.contar_turnos_medico("M1"), 6)
+        self.assertEqual(
+            [p.obtener_dni() for p in self.clinica.iter_pacientes("10000001", 3)],
+            [p.obtener_dni() for p in self.referencia.iter_pacientes("10000001", 3)],
+        )
+        argumentos = ("Clínica", "14/07/2025", "15/07/2025", 60)
+        self.assertEqual(
+            sorted(self.clinica.buscar_turnos_disponibles(*argumentos)),
+            sorted(self.referencia.buscar_turnos_disponibles(*argumentos)),
+        )
+        historias = {
+            h.obtener_paciente().obtener_dni(): h
+            for h in self.clinica.iter_historias_clinicas()
+        }
+        for historia in self.referencia.iter_historias_clinicas():
+            particionada = historias[historia.obtener_paciente().obtener_dni()]
+            self.assertEqual(
+                [str(t) for t in particionada.obtener_turnos()],
+                [str(t) for t in historia.obtener_turnos()],
+            )
+            self.assertEqual(
+                len(particionada.obtener_recetas()), len(historia.obtener_recetas())
+            )
+
+    def test_iter_historias_clinicas_con_lista_de_dnis(self):
+        dnis = ["10000004", "10000001", "10000004"]
+
+        historias = list(self.clinica.iter_historias_clinicas(dnis))
+
+        self.assertEqual(
+            [historia.obtener_paciente().obtener_dni() for historia in historias], dnis
+        )
+
+    def test_operaciones_de_una_particion_no_esperan_al_cerrojo_global(self):
+        dni = "10000000"
+        matricula = next(
+            f"M{i}"
+            for i in range(6)
+            if particion_de(f"M{i}", PARTICIONES) == particion_de(dni, PARTICIONES)
+        )
+        resultados = []
+
+        def operar():
+            resultados.append(self.clinica.buscar_paciente(dni).obtener_nombre())
+            turno = self.clinica.agendar_turno(
+                dni, matricula, "14/07/2025", "09:00", "Clínica"
+            )
+            resultados.append(self.clinica.cancelar_turno(turno.obtener_id()))
+
+        with self.clinica.__cerrojo__:
+            hilo = threading.Thread(target=operar)
+            hilo.start()
+            hilo.join(10)
+            self.assertFalse(hilo.is_alive())
+
+        self.assertEqual(resultados[0], "Paciente 0")
+        self.assertEqual(resultados[1].obtener_estado_turno(), EstadoTurno.CANCELADO)
+
+    def test_estado_de_copia_anterior_a_su_registro(self):
+        particion = Particion(0, 1)
+        paciente = particion.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        medico = particion.registrar_medico("Dr. Juan García", "M12345")
+        particion.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        turno = Turno(paciente, medico, "14/07/2025", "09:00", "Pediatría")
+        turno.asignar_id(7)
+
+        particion.actualizar_copia(7, EstadoTurno.CANCELADO)
+        particion.registrar_copias([turno])
+
+        (copia,) = particion.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual(copia.obtener_estado_turno(), EstadoTurno.CANCELADO)
+        self.assertEqual(copia.obtener_version(), 1)
+
+    def test_iter_turnos_recorre_todos_los_identificadores(self):
+        self.clinica.agendar_turnos_lote(
+            [
+                (f"1000000{i}", f"M{i}", "14/07/2025", "09:00", "Clínica")
+                for i in range(6)
+            ]
+        )
+
+        todos = [t.obtener_id() for t in self.clinica.iter_turnos()]
+        self.assertEqual(todos, sorted(todos))
+        self.assertEqual(len(set(todos)), 6)
+        pagina = [t.obtener_id() for t in self.clinica.iter_turnos(todos[1], limite=2)]
+        self.assertEqual(pagina, todos[2:4])
+        anteriores = [
+            t.obtener_id()
+            for t in self.clinica.iter_turnos(todos[3], descendente=True)
+        ]
+        self.assertEqual(anteriores, todos[2::-1])
+
+    def test_turno_serializable_sin_observadores(self):
+        turno = self.referencia.agendar_turnos_lote(
+            [("10000000", "M2", "14/07/2025", "09:00", "Clínica")]
+        )[0]
+
+        copia = pickle.loads(pickle.dumps(turno))
+
+        self.assertEqual(str(copia), str(turno))
+        copia.marcar_cancelado()
+        self.assertEqual(turno.obtener_estado_turno(), EstadoTurno.PROGRAMADO)
+        self.assertEqual(self.referencia.contar_turnos(EstadoTurno.CANCELADO), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,21 @@ class TestEspecialidad(unittest.TestCase):
         dias_obtenidos.append("domingo")
         self.assertNotIn("domingo", especialidad.obtener_dias())
 
+    def test_mascara_dias(self):
+        especialidad = Especialidad("Pediatría", ["lunes", "Miercoles", "domingo"])
+
+        self.assertEqual(especialidad.obtener_mascara_dias(), 0b1000101)
+        self.assertTrue(especialidad.verificar_dia_semana(0))
+        self.assertTrue(especialidad.verificar_dia_semana(2))
+        self.assertFalse(especialidad.verificar_dia_semana(1))
+        self.assertEqual(
+            especialidad.obtener_dias(), ["lunes", "miércoles", "domingo"]
+        )
+
+    def test_sin_dict_por_instancia(self):
+        especialidad = Especialidad("Pediatría", ["lunes"])
+        self.assertFalse(hasattr(especialidad, "__dict__"))
+
     def test_representacion_especialidad(self):
         especialidad = Especialidad("Pediatría", ["lunes", "miércoles"])
         representacion = str(especialidad)
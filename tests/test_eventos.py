@@ -0,0 +1,168 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from src.modelo.clinica import Clinica
+from src.modelo.eventos import BusEventos, Suscripcion, TipoEvento
+from src.persistencia.sqlite import RepositorioSQLite
+from src.excepciones import DatosInvalidosException
+
+
+class TestEventos(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.eventos = self.clinica.obtener_eventos()
+
+    def preparar(self):
+        paciente = self.clinica.registrar_paciente(
+            "Juan Cruz", "12345678", "03/02/1980"
+        )
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        return paciente
+
+    def agendar(self, hora: str):
+        return self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", hora, "Pediatría"
+        )
+
+    def test_mutaciones_publican_eventos_en_orden(self):
+        suscripcion = self.eventos.suscribir()
+        paciente = self.preparar()
+        primero = self.agendar("09:00")
+        segundo, tercero = self.clinica.agendar_turnos_lote(
+            [
+                ("12345678", "M12345", "14/07/2025", "10:00", "Pediatría"),
+                ("12345678", "M12345", "14/07/2025", "11:00", "Pediatría"),
+            ]
+        )
+        self.clinica.cancelar_turno(primero.obtener_id())
+        self.clinica.completar_turno(segundo.obtener_id())
+        receta = self.clinica.emitir_receta(
+            "12345678", "M12345", "14/07/2025", ["Ibuprofeno"], "Cada 8 horas"
+        )
+
+        eventos = suscripcion.recibir_pendientes()
+        self.assertEqual(
+            [evento.obtener_tipo() for evento in eventos],
+            [
+                TipoEvento.PACIENTE_REGISTRADO,
+                TipoEvento.MEDICO_REGISTRADO,
+                TipoEvento.TURNO_AGENDADO,
+                TipoEvento.TURNO_AGENDADO,
+                TipoEvento.TURNO_AGENDADO,
+                TipoEvento.TURNO_CANCELADO,
+                TipoEvento.TURNO_COMPLETADO,
+                TipoEvento.RECETA_EMITIDA,
+            ],
+        )
+        self.assertEqual(
+            [evento.obtener_objeto() for evento in eventos[2:]],
+            [primero, segundo, tercero, primero, segundo, receta],
+        )
+        self.assertIs(eventos[0].obtener_objeto(), paciente)
+        secuencias = [evento.obtener_secuencia() for evento in eventos]
+        self.assertEqual(secuencias, sorted(secuencias))
+        self.assertEqual(suscripcion.obtener_entregados(), 8)
+
+    def test_filtra_por_tipo(self):
+        self.preparar()
+        turnos = self.eventos.suscribir([TipoEvento.TURNO_CANCELADO])
+        turno = self.agendar("09:00")
+        self.clinica.cancelar_turno(turno.obtener_id())
+
+        (evento,) = turnos.recibir_pendientes()
+        self.assertIs(evento.obtener_objeto(), turno)
+        self.assertEqual(turnos.obtener_entregados(), 1)
+
+    def test_suscriptor_lento_descarta_sin_bloquear(self):
+        self.preparar()
+        lenta = self.eventos.suscribir([TipoEvento.TURNO_AGENDADO], capacidad=2)
+        rapida = self.eventos.suscribir([TipoEvento.TURNO_AGENDADO])
+
+        for hora in ("08:00", "08:30", "09:00", "09:30", "10:00"):
+            self.agendar(hora)
+
+        self.assertEqual(lenta.contar_pendientes(), 2)
+        self.assertEqual(lenta.obtener_entregados(), 2)
+        self.assertEqual(lenta.obtener_descartados(), 3)
+        self.assertEqual(
+            [e.obtener_objeto().obtener_hora() for e in lenta.recibir_pendientes()],
+            ["08:00", "08:30"],
+        )
+        self.assertEqual(len(rapida.recibir_pendientes()), 5)
+        self.assertEqual(rapida.obtener_descartados(), 0)
+
+    def test_desuscribir_y_consumidor_en_otro_hilo(self):
+        self.preparar()
+        suscripcion = self.eventos.suscribir([TipoEvento.TURNO_AGENDADO])
+        recibidos = []
+        consumidor = threading.Thread(
+            target=lambda: recibidos.append(suscripcion.recibir(espera=5))
+        )
+        consumidor.start()
+        turno = self.agendar("09:00")
+        consumidor.join()
+        self.assertIs(recibidos[0].obtener_objeto(), turno)
+
+        self.eventos.desuscribir(suscripcion)
+        self.assertFalse(self.eventos.tiene_suscriptores())
+        self.agendar("10:00")
+        self.assertIsNone(suscripcion.recibir(espera=0))
+
+    def test_contadores_con_publicadores_concurrentes(self):
+        bus = BusEventos()
+        suscripcion = bus.suscribir(capacidad=100)
+        barrera = threading.Barrier(8)
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def publicar():
+            barrera.wait()
+            for i in range(2000):
+                bus.publicar(TipoEvento.TURNO_AGENDADO, i)
+
+        try:
+            hilos = [threading.Thread(target=publicar) for _ in range(8)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        self.assertEqual(suscripcion.obtener_entregados(), 100)
+        self.assertEqual(suscripcion.obtener_descartados(), 8 * 2000 - 100)
+        self.assertEqual(len(suscripcion.recibir_pendientes()), 100)
+
+    def test_capacidad_invalida(self):
+        with self.assertRaises(DatosInvalidosException):
+            Suscripcion(capacidad=0)
+
+    def test_carga_desde_repositorio_no_publica(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.db")
+            original = Clinica(repositorio=RepositorioSQLite(ruta))
+            original.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+            original.registrar_medico("Dr. Juan García", "M12345")
+            original.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+            original.agendar_turno(
+                "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+            ).marcar_cancelado()
+            original.cerrar()
+
+            bus = BusEventos()
+            suscripcion = bus.suscribir()
+            cargada = Clinica(repositorio=RepositorioSQLite(ruta), eventos=bus)
+            self.assertIs(cargada.obtener_eventos(), bus)
+            self.assertEqual(suscripcion.recibir_pendientes(), [])
+
+            cargada.registrar_paciente("Ana Díaz", "87654321", "01/01/1990")
+            (evento,) = suscripcion.recibir_pendientes()
+            self.assertEqual(evento.obtener_tipo(), TipoEvento.PACIENTE_REGISTRADO)
+            cargada.cerrar()
+
+if __name__ == "__main__":
+    unittest.main()
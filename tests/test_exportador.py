@@ -0,0 +1,91 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from src.modelo.clinica import Clinica
+from src.persistencia.exportador import exportar_historias
+from src.excepciones import DatosInvalidosException, PacienteNoEncontradoException
+
+
+class TestExportador(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        ).marcar_completado()
+        self.clinica.emitir_receta(
+            "12345678",
+            "M12345",
+            "16/07/2025",
+            ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+            "Cada 8 horas",
+        )
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio.name, nombre)
+
+    def test_exportar_jsonl(self):
+        ruta = self.ruta("historias.jsonl")
+
+        self.assertEqual(exportar_historias(self.clinica, ruta), 2)
+
+        with open(ruta, encoding="utf-8") as archivo:
+            historias = [json.loads(linea) for linea in archivo]
+        self.assertEqual([h["dni"] for h in historias], ["12345678", "87654321"])
+        self.assertEqual(historias[0]["turnos"][0]["estado"], "Completado")
+        self.assertEqual(historias[0]["turnos"][0]["hora"], "10:30")
+        self.assertEqual(
+            historias[0]["recetas"][0]["medicamentos"],
+            ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+        )
+        self.assertEqual(historias[1]["turnos"], [])
+
+    def test_exportar_csv_comprimido_filtrado(self):
+        ruta = self.ruta("historias.csv.gz")
+
+        exportadas = exportar_historias(self.clinica, ruta, dnis=["12345678"])
+
+        self.assertEqual(exportadas, 1)
+        with gzip.open(ruta, "rt", encoding="utf-8", newline="") as archivo:
+            filas = list(csv.DictReader(archivo))
+        self.assertEqual([f["tipo"] for f in filas], ["paciente", "turno", "receta"])
+        self.assertEqual(filas[1]["especialidad"], "Pediatría")
+        self.assertEqual(
+            filas[2]["medicamentos"], "Paracetamol 500mg;Ibuprofeno 400mg"
+        )
+
+    def test_exportar_con_filtro(self):
+        ruta = self.ruta("historias.jsonl.gz")
+
+        exportadas = exportar_historias(
+            self.clinica, ruta, filtro=lambda historia: historia.contar_recetas() > 0
+        )
+
+        self.assertEqual(exportadas, 1)
+        with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+            self.assertEqual(json.loads(archivo.readline())["nombre"], "Juan Cruz")
+
+    def test_dni_inexistente(self):
+        with self.assertRaises(PacienteNoEncontradoException):
+            exportar_historias(self.clinica, self.ruta("h.jsonl"), dnis=["00000000"])
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(DatosInvalidosException):
+            exportar_historias(self.clinica, self.ruta("historias.xml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
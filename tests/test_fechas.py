@@ -0,0 +1,56 @@
+import unittest
+from datetime import date, time
+from src.modelo.fechas import (
+    DIAS_SEMANA,
+    parsear_fecha,
+    parsear_hora,
+    formatear_fecha,
+    formatear_hora,
+    _parsear_fecha,
+)
+from src.excepciones import DatosInvalidosException
+
+
+class TestFechas(unittest.TestCase):
+
+    def test_parsear_fecha_valida(self):
+        self.assertEqual(parsear_fecha("16/07/2025"), date(2025, 7, 16))
+        self.assertEqual(parsear_fecha("16/7/2025"), date(2025, 7, 16))
+
+    def test_parsear_fecha_invalida(self):
+        with self.assertRaises(DatosInvalidosException):
+            parsear_fecha("2025-07-16")
+
+        with self.assertRaises(DatosInvalidosException):
+            parsear_fecha("32/07/2025")
+
+        with self.assertRaises(DatosInvalidosException):
+            parsear_fecha(None)
+
+    def test_parsear_hora(self):
+        self.assertEqual(parsear_hora("10:30"), time(10, 30))
+
+        with self.assertRaises(DatosInvalidosException):
+            parsear_hora("25:30")
+
+        with self.assertRaises(DatosInvalidosException):
+            parsear_hora("10:70")
+
+    def test_cache_de_parseo(self):
+        parsear_fecha("01/03/2031")
+        aciertos = _parsear_fecha.cache_info().hits
+
+        parsear_fecha("01/03/2031")
+
+        self.assertEqual(_parsear_fecha.cache_info().hits, aciertos + 1)
+
+    def test_formatear(self):
+        self.assertEqual(formatear_fecha(date(2025, 7, 6)), "06/07/2025")
+        self.assertEqual(formatear_hora(time(9, 5)), "09:05")
+
+    def test_dias_semana(self):
+        self.assertEqual(DIAS_SEMANA[date(2025, 7, 16).weekday()], "miércoles")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ from src.modelo.especialidad import Especialidad
 from src.modelo.turno import Turno
 from src.modelo.receta import Receta
 from src.modelo.historia_clinica import HistoriaClinica
-from src.excepciones import DatosInvalidosException
+from src.excepciones import DatosInvalidosException, VersionObsoletaException
 
 
 class TestHistoriaClinica(unittest.TestCase):
@@ -56,6 +56,18 @@ class TestHistoriaClinica(unittest.TestCase):
         with self.assertRaises(DatosInvalidosException):
             self.historia.agregar_turno(turno_otro_paciente)
 
+    def test_agregar_turnos_en_bloque(self):
+        turno1 = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        turno2 = Turno(self.paciente, self.medico, "18/07/2025", "15:00", "Pediatría")
+        ajeno = Turno(self.otro_paciente, self.medico, "18/07/2025", "16:00", "Pediatría")
+
+        with self.assertRaises(DatosInvalidosException):
+            self.historia.agregar_turnos([turno1, ajeno])
+        self.assertEqual(len(self.historia.obtener_turnos()), 0)
+
+        self.historia.agregar_turnos([turno1, turno2])
+        self.assertEqual(len(self.historia.obtener_turnos()), 2)
+
     def test_agregar_receta_valida(self):
         receta = Receta(
             self.paciente,
@@ -141,6 +153,22 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertEqual(len(self.historia.obtener_turnos()), 2)
         self.assertEqual(len(self.historia.obtener_recetas()), 2)
 
+    def test_iterar_sin_copiar(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        receta = Receta(
+            self.paciente, self.medico, "15/07/2025", ["Paracetamol"], "Cada 8 horas"
+        )
+        self.historia.agregar_turno(turno)
+        self.historia.agregar_receta(receta)
+
+        self.assertEqual(list(self.historia.iter_turnos()), [turno])
+        self.assertEqual(list(self.historia.iter_recetas()), [receta])
+        self.assertEqual(self.historia.contar_turnos(), 1)
+        self.assertEqual(self.historia.contar_recetas(), 1)
+
+    def test_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(self.historia, "__dict__"))
+
     def test_representacion_historia_clinica(self):
         representacion_vacia = str(self.historia)
         self.assertIn("Juan Cruz", representacion_vacia)
@@ -165,5 +193,28 @@ class TestHistoriaClinica(unittest.TestCase):
         self.assertIn("1 recetas", representacion_con_datos)
 
 
+    def test_version_cuenta_cambios_y_protege_recetas(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        receta = Receta(
+            self.paciente,
+            self.medico,
+            "15/07/2025",
+            ["Paracetamol 500mg"],
+            "Tomar cada 7 horas",
+        )
+
+        self.historia.agregar_turnos([turno])
+        version = self.historia.obtener_version()
+        self.assertEqual(version, 1)
+
+        self.historia.agregar_receta(receta, version)
+        self.assertEqual(self.historia.obtener_version(), 2)
+        with self.assertRaises(VersionObsoletaException):
+            self.historia.agregar_receta(receta, version)
+        self.assertEqual(self.historia.contar_recetas(), 1)
+
+        reconstruida = HistoriaClinica.reconstruir(self.paciente, [turno], [receta])
+        self.assertEqual(reconstruida.obtener_version(), 2)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
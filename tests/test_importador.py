@@ -0,0 +1,270 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.importador import Importador, leer_filas
+from src.excepciones import DatosInvalidosException
+
+
+class TestImportador(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+        self.rechazos = self.ruta("rechazos.csv")
+        self.importador = Importador(self.clinica, self.rechazos, tamanio_lote=2)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio.name, nombre)
+
+    def escribir_csv(self, nombre: str, filas: list[list[str]]) -> str:
+        ruta = self.ruta(nombre)
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            csv.writer(archivo).writerows(filas)
+        return ruta
+
+    def escribir_jsonl(self, nombre: str, lineas: list) -> str:
+        ruta = self.ruta(nombre)
+        abrir = gzip.open if nombre.endswith(".gz") else open
+        with abrir(ruta, "wt", encoding="utf-8") as archivo:
+            for linea in lineas:
+                texto = linea if isinstance(linea, str) else json.dumps(linea)
+                archivo.write(texto + "\n")
+        return ruta
+
+    def leer_rechazos(self) -> list[dict]:
+        with open(self.rechazos, encoding="utf-8", newline="") as archivo:
+            return list(csv.DictReader(archivo))
+
+    def poblar_medico(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+
+    def test_importar_pacientes_csv_con_rechazos(self):
+        ruta = self.escribir_csv(
+            "pacientes.csv",
+            [
+                ["nombre", "dni", "fecha_nacimiento"],
+                ["Juan Cruz", "12345678", "03/02/1980"],
+                ["Martina Arias", "87654321", "1980-05-15"],
+                ["", "11111111", "01/01/1990"],
+                ["Juan Duplicado", "12345678", "03/02/1980"],
+                ["Lucía Gómez", "22222222", "01/01/1990"],
+            ],
+        )
+
+        resumen = self.importador.importar_pacientes(ruta)
+
+        self.assertEqual(resumen.obtener_importadas(), 2)
+        self.assertEqual(resumen.obtener_rechazadas(), 3)
+        self.assertEqual(len(self.clinica.listar_pacientes()), 2)
+        rechazos = self.leer_rechazos()
+        self.assertEqual([r["linea"] for r in rechazos], ["3", "4", "5"])
+        self.assertIn("Formato de fecha inválido", rechazos[0]["motivo"])
+        self.assertIn("Falta el campo nombre", rechazos[1]["motivo"])
+        self.assertIn("Ya existe un paciente", rechazos[2]["motivo"])
+        self.assertEqual(json.loads(rechazos[2]["fila"])["nombre"], "Juan Duplicado")
+
+    def test_importar_medicos_y_especialidades_jsonl(self):
+        medicos = self.escribir_jsonl(
+            "medicos.jsonl",
+            [
+                {"nombre": "Dr. Juan García", "matricula": "M12345"},
+                "{no es json",
+                [1, 2, 3],
+                {"nombre": "Dra. Ana López", "matricula": "M54321"},
+            ],
+        )
+        especialidades = self.escribir_jsonl(
+            "especialidades.jsonl.gz",
+            [
+                {"matricula": "M12345", "especialidad": "Pediatría", "dias": ["lunes"]},
+                {
+                    "matricula": "M54321",
+                    "especialidad": "Cardiología",
+                    "dias": "martes; jueves",
+                },
+                {"matricula": "M99999", "especialidad": "Clínica", "dias": "lunes"},
+                {"matricula": "M54321", "especialidad": "Clínica", "dias": [1]},
+            ],
+        )
+
+        resumen = self.importador.importar_medicos(medicos)
+        self.assertEqual(resumen.obtener_importadas(), 2)
+        resumen = self.importador.importar_especialidades(especialidades)
+
+        self.assertEqual(resumen.obtener_importadas(), 2)
+        medicos = self.clinica.buscar_medicos_por_especialidad_y_dia(
+            "Cardiología", "jueves"
+        )
+        self.assertEqual([m.obtener_matricula() for m in medicos], ["M54321"])
+        rechazos = self.leer_rechazos()
+        self.assertEqual(
+            [r["tipo"] for r in rechazos],
+            ["medicos", "medicos", "especialidades", "especialidades"],
+        )
+        self.assertIn("JSON inválido", rechazos[0]["motivo"])
+        self.assertIn("objeto JSON", rechazos[1]["motivo"])
+
+    def test_importar_turnos_descarta_solo_filas_invalidas(self):
+        self.poblar_medico()
+        ruta = self.escribir_csv(
+            "turnos.csv",
+            [
+                ["dni", "matricula", "fecha", "hora", "especialidad", "estado"],
+                ["12345678", "M12345", "14/07/2025", "09:00", "Pediatría", "Completado"],
+                ["87654321", "M12345", "14/07/2025", "09:00", "Pediatría", ""],
+                ["87654321", "M12345", "15/07/2025", "09:00", "Pediatría", ""],
+                ["87654321", "M12345", "16/07/2025", "09:00", "Pediatría", "Perdido"],
+                ["87654321", "M12345", "16/07/2025", "10:00", "Pediatría", ""],
+            ],
+        )
+
+        resumen = self.importador.importar_turnos(ruta)
+
+        self.assertEqual(resumen.obtener_importadas(), 2)
+        self.assertEqual(resumen.obtener_rechazadas(), 3)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 1)
+        motivos = [r["motivo"] for r in self.leer_rechazos()]
+        self.assertIn("ya tiene un turno", motivos[0])
+        self.assertIn("no atiende los martes", motivos[1])
+        self.assertIn("Estado de turno inválido", motivos[2])
+
+    def test_turno_cancelado_y_reagendado_en_el_mismo_lote(self):
+        self.poblar_medico()
+        importador = Importador(self.clinica, self.rechazos, tamanio_lote=10)
+        ruta = self.escribir_csv(
+            "turnos.csv",
+            [
+                ["dni", "matricula", "fecha", "hora", "especialidad", "estado"],
+                ["12345678", "M12345", "14/07/2025", "09:00", "Pediatría", "Cancelado"],
+                ["87654321", "M12345", "14/07/2025", "10:00", "Pediatría", ""],
+                ["87654321", "M12345", "14/07/2025", "09:00", "Pediatría", ""],
+                ["12345678", "M12345", "14/07/2025", "09:00", "Pediatría", ""],
+            ],
+        )
+
+        resumen = importador.importar_turnos(ruta)
+
+        self.assertEqual(resumen.obtener_importadas(), 3)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 2)
+        turnos = list(
+            self.clinica.obtener_turnos_medico("M12345", "14/07/2025", "14/07/2025")
+        )
+        self.assertEqual(
+            [t.obtener_paciente().obtener_dni() for t in turnos[1:]],
+            ["87654321", "87654321"],
+        )
+        rechazos = self.leer_rechazos()
+        self.assertEqual([r["linea"] for r in rechazos], ["5"])
+        self.assertIn("ya tiene un turno", rechazos[0]["motivo"])
+
+    def test_reagendado_con_fecha_y_hora_sin_ceros(self):
+        self.poblar_medico()
+        importador = Importador(self.clinica, self.rechazos, tamanio_lote=10)
+        ruta = self.escribir_csv(
+            "turnos.csv",
+            [
+                ["dni", "matricula", "fecha", "hora", "especialidad", "estado"],
+                ["12345678", "M12345", "01/09/2025", "09:00", "Pediatría", "Cancelado"],
+                ["87654321", "M12345", "1/9/2025", "9:00", "Pediatría", ""],
+                ["87654321", "M12345", "1/9/2025", "9:60", "Pediatría", ""],
+            ],
+        )
+
+        resumen = importador.importar_turnos(ruta)
+
+        self.assertEqual(resumen.obtener_importadas(), 2)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.CANCELADO), 1)
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.PROGRAMADO), 1)
+        rechazos = self.leer_rechazos()
+        self.assertEqual([r["linea"] for r in rechazos], ["4"])
+        self.assertIn("Formato de hora inválido", rechazos[0]["motivo"])
+
+    def test_estado_de_turno_que_no_es_texto(self):
+        self.poblar_medico()
+        ruta = self.escribir_jsonl(
+            "turnos.jsonl",
+            [
+                {
+                    "dni": "12345678",
+                    "matricula": "M12345",
+                    "fecha": "14/07/2025",
+                    "hora": "09:00",
+                    "especialidad": "Pediatría",
+                    "estado": estado,
+                }
+                for estado in (["Completado"], 1, {"valor": "Cancelado"})
+            ],
+        )
+
+        resumen = self.importador.importar_turnos(ruta)
+
+        self.assertEqual(resumen.obtener_rechazadas(), 3)
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+        motivos = [r["motivo"] for r in self.leer_rechazos()]
+        self.assertTrue(all("Estado de turno inválido" in m for m in motivos))
+
+    def test_importar_recetas(self):
+        self.poblar_medico()
+        ruta = self.escribir_csv(
+            "recetas.csv",
+            [
+                ["dni", "matricula", "fecha", "medicamentos", "indicaciones"],
+                ["12345678", "M12345", "15/07/2025", "Paracetamol; Ibuprofeno", "Cada 8 horas"],
+                ["12345678", "M12345", "15/07/2025", " ; ", "Cada 8 horas"],
+            ],
+        )
+
+        resumen = self.importador.importar_recetas(ruta)
+
+        self.assertEqual(resumen.obtener_importadas(), 1)
+        receta = self.clinica.obtener_historia_clinica("12345678").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"])
+
+    def test_informa_progreso(self):
+        informes = []
+        importador = Importador(
+            self.clinica, tamanio_lote=1, informar=informes.append, intervalo_informe=0
+        )
+        ruta = self.escribir_csv(
+            "pacientes.csv",
+            [
+                ["nombre", "dni", "fecha_nacimiento"],
+                ["Juan Cruz", "12345678", "03/02/1980"],
+                ["Martina Arias", "87654321", "15/05/1980"],
+            ],
+        )
+
+        resumen = importador.importar_pacientes(ruta)
+
+        self.assertGreaterEqual(len(informes), 2)
+        self.assertIs(informes[-1], resumen)
+        self.assertGreater(resumen.obtener_filas_por_segundo(), 0)
+
+    def test_formato_no_soportado(self):
+        ruta = self.ruta("pacientes.xml")
+        open(ruta, "w").close()
+        with self.assertRaises(DatosInvalidosException):
+            list(leer_filas(ruta))
+
+    def test_tamanio_lote_invalido(self):
+        with self.assertRaises(DatosInvalidosException):
+            Importador(self.clinica, tamanio_lote=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
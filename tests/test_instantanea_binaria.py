@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.binario import (
+    InstantaneaBinaria,
+    escribir_instantanea_binaria,
+    volcar_instantanea_binaria,
+)
+from src.excepciones import (
+    DatosInvalidosException,
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    TurnoNoEncontradoException,
+)
+
+
+class TestInstantaneaBinaria(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.clinica.registrar_paciente("Lucía Gómez", "11111111", "01/01/1990")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.registrar_medico("Dra. Ana López", "M54321")
+        self.clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        self.clinica.agregar_especialidad_a_medico("M12345", "Clínica", ["martes"])
+        self.clinica.agregar_especialidad_a_medico(
+            "M54321", "Cardiología", ["lunes"]
+        )
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "21/07/2025", "09:00", "Pediatría"
+        )
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        ).marcar_cancelado()
+        self.clinica.agendar_turno(
+            "87654321", "M12345", "18/07/2025", "09:00", "Pediatría"
+        ).marcar_completado()
+        self.clinica.agendar_turno(
+            "87654321", "M54321", "21/07/2025", "09:00", "Cardiología"
+        )
+        self.clinica.emitir_receta(
+            "12345678",
+            "M12345",
+            "15/07/2025",
+            ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+            "Cada 8 horas",
+        )
+        self.instantanea = InstantaneaBinaria(volcar_instantanea_binaria(self.clinica))
+
+    def tearDown(self):
+        self.instantanea.cerrar()
+
+    def test_buscar_paciente(self):
+        paciente = self.instantanea.buscar_paciente("87654321")
+        self.assertEqual(paciente.obtener_nombre(), "Martina Arias")
+        self.assertEqual(paciente.obtener_fecha_nacimiento(), "15/05/1980")
+        self.assertIs(self.instantanea.buscar_paciente("87654321"), paciente)
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.instantanea.buscar_paciente("99999999")
+
+    def test_buscar_medico(self):
+        medico = self.instantanea.buscar_medico("M12345")
+        self.assertEqual(medico.obtener_nombre(), "Dr. Juan García")
+        self.assertEqual(
+            [e.obtener_especialidad() for e in medico.obtener_especialidades()],
+            ["Pediatría", "Clínica"],
+        )
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Clínica")
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.instantanea.buscar_medico("M00000")
+
+    def test_historia_clinica(self):
+        historia = self.instantanea.obtener_historia_clinica("12345678")
+        turnos = historia.obtener_turnos()
+        self.assertEqual([t.obtener_fecha() for t in turnos], ["21/07/2025", "16/07/2025"])
+        self.assertEqual(turnos[1].obtener_estado_turno(), EstadoTurno.CANCELADO)
+        recetas = historia.obtener_recetas()
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(
+            recetas[0].obtener_medicamentos(), ["Paracetamol 500mg", "Ibuprofeno 400mg"]
+        )
+        self.assertEqual(recetas[0].obtener_fecha(), "15/07/2025")
+
+    def test_turnos(self):
+        turno = self.instantanea.buscar_turno(3)
+        self.assertEqual(turno.obtener_id(), 3)
+        self.assertEqual(turno.obtener_medico().obtener_matricula(), "M54321")
+        self.assertEqual(turno.obtener_hora(), "09:00")
+        self.assertEqual(len(list(self.instantanea.iter_turnos())), 4)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.instantanea.buscar_turno(4)
+
+    def test_turnos_medico_ordenados_por_fecha(self):
+        turnos = self.instantanea.obtener_turnos_medico(
+            "M12345", "16/07/2025", "18/07/2025"
+        )
+        self.assertEqual(
+            [t.obtener_fecha() for t in turnos], ["16/07/2025", "18/07/2025"]
+        )
+        todos = self.instantanea.obtener_turnos_medico(
+            "M12345", "01/01/2025", "31/12/2025"
+        )
+        self.assertEqual(len(list(todos)), 3)
+
+    def test_contar_turnos(self):
+        self.assertEqual(self.instantanea.contar_turnos(), 4)
+        self.assertEqual(self.instantanea.contar_turnos(EstadoTurno.PROGRAMADO), 2)
+        self.assertEqual(self.instantanea.contar_turnos("Cancelado"), 1)
+        with self.assertRaises(DatosInvalidosException):
+            self.instantanea.contar_turnos("Perdido")
+
+    def test_listados(self):
+        self.assertEqual(
+            sorted(p.obtener_dni() for p in self.instantanea.listar_pacientes()),
+            ["11111111", "12345678", "87654321"],
+        )
+        self.assertEqual(len(self.instantanea.listar_medicos()), 2)
+
+    def test_abrir_archivo_con_mmap(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.bin")
+            escribir_instantanea_binaria(self.clinica, ruta)
+            instantanea = InstantaneaBinaria.abrir(ruta)
+            self.assertEqual(
+                instantanea.buscar_paciente("11111111").obtener_nombre(), "Lucía Gómez"
+            )
+            instantanea.cerrar()
+
+    def test_datos_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            InstantaneaBinaria(b"no es una instantanea binaria valida" * 10)
+        with self.assertRaises(DatosInvalidosException):
+            InstantaneaBinaria(b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -96,6 +96,36 @@ class TestMedico(unittest.TestCase):
         especialidades.clear()
         self.assertEqual(len(medico.obtener_especialidades()), 2)
 
+    def test_especialidad_por_dia_semana(self):
+        medico = Medico("Dr. Lucas Gauna", "M12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"]))
+
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(0), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(1), "Cardiología")
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(2), "Pediatría")
+        self.assertIsNone(medico.obtener_especialidad_para_dia_semana(6))
+        self.assertEqual(medico.obtener_especialidad_para_dia("Miercoles"), "Pediatría")
+        self.assertIsNone(medico.obtener_especialidad_para_dia("feriado"))
+
+    def test_reconstruir_indexa_dias(self):
+        medico = Medico.reconstruir(
+            "Dr. Lucas Gauna",
+            "M12345",
+            [
+                Especialidad.reconstruir("Pediatría", 0b101),
+                Especialidad.reconstruir("Cardiología", 0b110),
+            ],
+        )
+        self.assertEqual(medico.obtener_matricula(), "M12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(0), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(1), "Cardiología")
+        self.assertEqual(medico.obtener_especialidad_para_dia_semana(2), "Pediatría")
+
+    def test_sin_dict_por_instancia(self):
+        medico = Medico("Dr. Lucas Gauna", "M12345")
+        self.assertFalse(hasattr(medico, "__dict__"))
+
     def test_representacion_medico_sin_especialidades(self):
         medico = Medico("Dr. Lucas Gauna", "M12345")
         representacion = str(medico)
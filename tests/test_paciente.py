@@ -52,6 +52,10 @@ class TestPaciente(unittest.TestCase):
         with self.assertRaises(DatosInvalidosException):
             Paciente("Juan Cruz", "12345678", 20240101)
 
+    def test_sin_dict_por_instancia(self):
+        paciente = Paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.assertFalse(hasattr(paciente, "__dict__"))
+
     def test_representacion_paciente(self):
         paciente = Paciente("Juan Cruz", "12345678", "03/02/1980")
         representacion = str(paciente)
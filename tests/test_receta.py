@@ -170,6 +170,16 @@ class TestReceta(unittest.TestCase):
         self.assertIn("Vitamina C", medicamentos)
         self.assertIn("Omega 3", medicamentos)
 
+    def test_sin_dict_por_instancia(self):
+        receta = Receta(
+            self.paciente,
+            self.medico,
+            "15/07/2025",
+            self.medicamentos,
+            self.indicaciones,
+        )
+        self.assertFalse(hasattr(receta, "__dict__"))
+
     def test_representacion_receta(self):
         receta = Receta(
             self.paciente,
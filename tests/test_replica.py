@@ -0,0 +1,189 @@
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import unittest
+from unittest import mock
+from multiprocessing import shared_memory
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.distribucion import PublicadorReplica, ReplicaClinica
+from src.distribucion.replica import GENERACION
+from src.excepciones import (
+    ClinicaException,
+    DatosInvalidosException,
+    PacienteNoEncontradoException,
+)
+
+
+def consultar_en_otro_proceso(nombre: str, conexion):
+    replica = ReplicaClinica(nombre)
+    historia = replica.obtener_historia_clinica("12345678")
+    conexion.send(
+        (
+            replica.obtener_generacion(),
+            replica.buscar_paciente("12345678").obtener_nombre(),
+            [turno.obtener_hora() for turno in historia.iter_turnos()],
+            [medico.obtener_matricula() for medico in replica.listar_medicos()],
+        )
+    )
+    replica.cerrar()
+
+
+class TestReplica(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        self.clinica.agendar_turno(
+            "12345678", "M12345", "14/07/2025", "09:00", "Pediatría"
+        )
+        self.publicador = PublicadorReplica(self.clinica)
+
+    def tearDown(self):
+        self.publicador.cerrar()
+
+    def test_sin_publicar_no_se_puede_adjuntar(self):
+        with self.assertRaises(DatosInvalidosException):
+            ReplicaClinica(self.publicador.obtener_nombre())
+
+    def test_replica_responde_como_la_clinica(self):
+        self.clinica.emitir_receta(
+            "12345678", "M12345", "14/07/2025", ["Ibuprofeno"], "Cada 8 horas"
+        )
+        self.assertEqual(self.publicador.publicar(), 1)
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+
+        paciente = replica.buscar_paciente("12345678")
+        self.assertEqual(paciente.obtener_nombre(), "Juan Cruz")
+        historia = replica.obtener_historia_clinica("12345678")
+        self.assertEqual(historia.contar_turnos(), 1)
+        self.assertEqual(historia.contar_recetas(), 1)
+        self.assertEqual(
+            [medico.obtener_matricula() for medico in replica.listar_medicos()],
+            ["M12345"],
+        )
+        self.assertEqual(replica.contar_turnos(EstadoTurno.PROGRAMADO), 1)
+        with self.assertRaises(PacienteNoEncontradoException):
+            replica.buscar_paciente("99999999")
+        replica.cerrar()
+
+    def test_actualizar_cambia_a_la_ultima_instantanea(self):
+        self.publicador.publicar()
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+        self.clinica.registrar_paciente("Ana Díaz", "87654321", "01/01/1990")
+
+        self.assertFalse(replica.actualizar())
+        for _ in range(3):
+            self.publicador.publicar()
+        with self.assertRaises(PacienteNoEncontradoException):
+            replica.buscar_paciente("87654321")
+
+        self.assertTrue(replica.actualizar())
+        self.assertEqual(replica.obtener_generacion(), 4)
+        paciente = replica.buscar_paciente("87654321")
+        self.assertEqual(paciente.obtener_nombre(), "Ana Díaz")
+        replica.cerrar()
+
+        nombre = self.publicador.obtener_nombre()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(f"{nombre}_2")
+
+    def test_lectores_en_otros_procesos(self):
+        self.publicador.publicar()
+        nombre = self.publicador.obtener_nombre()
+
+        for _ in range(2):
+            receptor, emisor = multiprocessing.Pipe(duplex=False)
+            proceso = multiprocessing.Process(
+                target=consultar_en_otro_proceso, args=(nombre, emisor)
+            )
+            proceso.start()
+            resultado = receptor.recv()
+            proceso.join()
+
+            self.assertEqual(resultado, (1, "Juan Cruz", ["09:00"], ["M12345"]))
+            self.assertEqual(proceso.exitcode, 0)
+
+    def test_recorridos_sobreviven_a_actualizar(self):
+        for hora in ("10:00", "11:00"):
+            self.clinica.agendar_turno(
+                "12345678", "M12345", "14/07/2025", hora, "Pediatría"
+            )
+        self.publicador.publicar()
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+        turnos = replica.iter_turnos()
+        del_medico = replica.obtener_turnos_medico("M12345", "14/07/2025", "14/07/2025")
+        sin_empezar = replica.iter_turnos()
+        self.assertEqual(next(turnos).obtener_hora(), "09:00")
+
+        self.clinica.cancelar_turno(0)
+        for _ in range(3):
+            self.publicador.publicar()
+        self.assertTrue(replica.actualizar())
+
+        self.assertEqual([t.obtener_hora() for t in turnos], ["10:00", "11:00"])
+        self.assertEqual([t.obtener_estado() for t in del_medico], ["Programado"] * 3)
+        del sin_empezar
+        self.assertEqual(
+            [t.obtener_estado() for t in replica.iter_turnos()],
+            ["Cancelado", "Programado", "Programado"],
+        )
+        replica.cerrar()
+
+    def test_publicar_en_segundo_plano(self):
+        generacion = asyncio.run(self.publicador.publicar_en_segundo_plano())
+        self.clinica.registrar_paciente("Ana Díaz", "87654321", "01/01/1990")
+
+        self.assertEqual(generacion, 1)
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+        paciente = replica.buscar_paciente("12345678")
+        self.assertEqual(paciente.obtener_nombre(), "Juan Cruz")
+        with self.assertRaises(PacienteNoEncontradoException):
+            replica.buscar_paciente("87654321")
+        replica.cerrar()
+
+    def test_errores_de_publicacion_no_detienen_la_tarea(self):
+        async def ejecutar(errores: io.StringIO):
+            tarea = asyncio.create_task(self.publicador.publicar_periodicamente(0.01))
+            with mock.patch(
+                "src.distribucion.replica.volcar_instantanea_binaria",
+                side_effect=ValueError("volcado roto"),
+            ):
+                while "volcado roto" not in errores.getvalue():
+                    await asyncio.sleep(0.01)
+            self.assertFalse(tarea.done())
+            self.assertEqual(self.publicador.obtener_generacion(), 0)
+            while self.publicador.obtener_generacion() == 0:
+                await asyncio.sleep(0.01)
+            tarea.cancel()
+
+        errores = io.StringIO()
+        with contextlib.redirect_stderr(errores):
+            asyncio.run(asyncio.wait_for(ejecutar(errores), 10))
+        self.assertIn("No se pudo publicar la réplica", errores.getvalue())
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+        self.assertEqual(replica.contar_turnos(), 1)
+        replica.cerrar()
+
+    def test_instalacion_interrumpida_no_bloquea_al_lector(self):
+        self.publicador.publicar()
+        replica = ReplicaClinica(self.publicador.obtener_nombre())
+        control = self.publicador.__control__.buf
+        (generacion,) = GENERACION.unpack_from(control)
+        GENERACION.pack_into(control, 0, generacion + 1)
+
+        with mock.patch("src.distribucion.replica.INTENTOS_LECTURA", 5):
+            with self.assertRaises(ClinicaException):
+                replica.actualizar()
+        self.assertEqual(replica.contar_turnos(), 1)
+
+        GENERACION.pack_into(control, 0, generacion)
+        self.assertFalse(replica.actualizar())
+        replica.cerrar()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import os
+import tempfile
+import unittest
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.diario import (
+    RepositorioDiario,
+    ARCHIVO_DIARIO,
+    ARCHIVO_INSTANTANEA,
+)
+from src.excepciones import DatosInvalidosException, TurnoOcupadoException
+
+
+class TestRepositorioDiario(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = self.directorio.name
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def abrir(self, **opciones) -> Clinica:
+        return Clinica(repositorio=RepositorioDiario(self.ruta, **opciones))
+
+    def poblar(self, clinica: Clinica):
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        clinica.registrar_medico("Dr. Juan García", "M12345")
+        clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        ).marcar_cancelado()
+        clinica.agendar_turno("87654321", "M12345", "16/07/2025", "10:30", "Pediatría")
+        clinica.agendar_turnos_lote(
+            [
+                ("12345678", "M12345", "18/07/2025", "09:00", "Pediatría"),
+                ("12345678", "M12345", "21/07/2025", "09:00", "Pediatría"),
+            ]
+        )[0].marcar_completado()
+        clinica.emitir_receta(
+            "12345678", "M12345", "15/07/2025", ["Paracetamol 500mg"], "Cada 8 horas"
+        )
+
+    def verificar(self, clinica: Clinica):
+        self.assertEqual(len(clinica.listar_pacientes()), 2)
+        historia = clinica.obtener_historia_clinica("12345678")
+        estados = [t.obtener_estado() for t in historia.obtener_turnos()]
+        self.assertEqual(estados, ["Cancelado", "Completado", "Programado"])
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+        self.assertEqual(clinica.contar_turnos(EstadoTurno.PROGRAMADO), 2)
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno(
+                "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+            )
+
+    def test_reproducir_diario(self):
+        clinica = self.abrir()
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        self.assertFalse(os.path.exists(os.path.join(self.ruta, ARCHIVO_INSTANTANEA)))
+        recargada = self.abrir()
+        self.verificar(recargada)
+        recargada.cerrar()
+
+    def test_instantanea_y_cola_del_diario(self):
+        clinica = self.abrir(instantanea_cada=5)
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        self.assertTrue(os.path.exists(os.path.join(self.ruta, ARCHIVO_INSTANTANEA)))
+        with open(os.path.join(self.ruta, ARCHIVO_DIARIO), "rb") as archivo:
+            self.assertLess(len(archivo.readlines()), 5)
+
+        recargada = self.abrir(instantanea_cada=5)
+        self.verificar(recargada)
+        recargada.registrar_paciente("Lucas Gauna", "11111111", "01/01/1990")
+        recargada.cerrar()
+
+        self.assertEqual(len(self.abrir().listar_pacientes()), 3)
+
+    def test_instantanea_justo_antes_de_un_cambio_de_estado(self):
+        clinica = self.abrir(instantanea_cada=5)
+        self.poblar(clinica)
+        clinica.confirmar()
+
+        recargada = self.abrir(instantanea_cada=5)
+        self.verificar(recargada)
+        turno = recargada.buscar_turno(3)
+        recargada.cancelar_turno(turno.obtener_id())
+        recargada.confirmar()
+
+        otra = self.abrir()
+        self.assertEqual(otra.contar_turnos(EstadoTurno.CANCELADO), 2)
+        otra.cerrar()
+        recargada.cerrar()
+        clinica.cerrar()
+
+    def test_recuperar_con_instantanea_en_cualquier_operacion(self):
+        for cada in range(1, 11):
+            with self.subTest(instantanea_cada=cada):
+                ruta = os.path.join(self.ruta, str(cada))
+                clinica = Clinica(
+                    repositorio=RepositorioDiario(ruta, instantanea_cada=cada)
+                )
+                self.poblar(clinica)
+                clinica.confirmar()
+
+                recargada = Clinica(repositorio=RepositorioDiario(ruta))
+                self.verificar(recargada)
+                recargada.cerrar()
+                clinica.cerrar()
+
+    def test_cola_incompleta_se_descarta(self):
+        clinica = self.abrir()
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        ruta_diario = os.path.join(self.ruta, ARCHIVO_DIARIO)
+        tamanio = os.path.getsize(ruta_diario)
+        with open(ruta_diario, "ab") as archivo:
+            archivo.write(b'0badc0de {"s":99,"o":"paciente"')
+
+        recargada = self.abrir()
+        self.verificar(recargada)
+        self.assertEqual(os.path.getsize(ruta_diario), tamanio)
+        recargada.cerrar()
+
+    def test_registro_con_suma_invalida_corta_la_reproduccion(self):
+        clinica = self.abrir()
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        clinica.cerrar()
+
+        ruta_diario = os.path.join(self.ruta, ARCHIVO_DIARIO)
+        with open(ruta_diario, "rb") as archivo:
+            lineas = archivo.readlines()
+        with open(ruta_diario, "wb") as archivo:
+            archivo.write(lineas[0])
+            archivo.write(lineas[1].replace(b"Martina", b"Martino"))
+
+        recargada = self.abrir()
+        self.assertEqual(
+            [p.obtener_dni() for p in recargada.listar_pacientes()], ["12345678"]
+        )
+        recargada.cerrar()
+
+    def test_instantanea_danada(self):
+        clinica = self.abrir(instantanea_cada=1)
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.cerrar()
+
+        with open(os.path.join(self.ruta, ARCHIVO_INSTANTANEA), "ab") as archivo:
+            archivo.write(b" ")
+
+        with self.assertRaises(DatosInvalidosException):
+            self.abrir()
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            RepositorioDiario(self.ruta, sincronizar_cada=0)
+        with self.assertRaises(DatosInvalidosException):
+            RepositorioDiario(self.ruta, instantanea_cada=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
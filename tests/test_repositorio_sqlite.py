@@ -0,0 +1,344 @@
+import gc
+import os
+import sqlite3
+import tempfile
+import unittest
+import weakref
+from src.modelo.almacen_turnos import AlmacenTurnos, AlmacenTurnosColumnar
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.sqlite import RepositorioSQLite
+from src.excepciones import DatosInvalidosException, TurnoOcupadoException
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def poblar(self, clinica: Clinica):
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        clinica.registrar_medico("Dr. Juan García", "M12345")
+        clinica.agregar_especialidad_a_medico(
+            "M12345", "Pediatría", ["lunes", "miércoles", "viernes"]
+        )
+        cancelado = clinica.agendar_turno(
+            "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+        )
+        cancelado.marcar_cancelado()
+        clinica.agendar_turno("87654321", "M12345", "16/07/2025", "10:30", "Pediatría")
+        clinica.agendar_turnos_lote(
+            [
+                ("12345678", "M12345", "18/07/2025", "09:00", "Pediatría"),
+                ("12345678", "M12345", "21/07/2025", "09:00", "Pediatría"),
+            ]
+        )[0].marcar_completado()
+        clinica.emitir_receta(
+            "12345678",
+            "M12345",
+            "15/07/2025",
+            ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+            "Tomar cada 8 horas",
+        )
+
+    def test_persistir_y_recargar(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        recargada = Clinica(repositorio=RepositorioSQLite(self.ruta))
+
+        self.assertEqual(len(recargada.listar_pacientes()), 2)
+        medico = recargada.buscar_medico("M12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("viernes"), "Pediatría")
+
+        historia = recargada.obtener_historia_clinica("12345678")
+        estados = [t.obtener_estado() for t in historia.obtener_turnos()]
+        self.assertEqual(estados, ["Cancelado", "Completado", "Programado"])
+        receta = historia.obtener_recetas()[0]
+        self.assertEqual(
+            receta.obtener_medicamentos(), ["Paracetamol 500mg", "Ibuprofeno 400mg"]
+        )
+        self.assertEqual(receta.obtener_fecha(), "15/07/2025")
+
+        self.assertEqual(recargada.contar_turnos(EstadoTurno.PROGRAMADO), 2)
+        with self.assertRaises(TurnoOcupadoException):
+            recargada.agendar_turno(
+                "12345678", "M12345", "16/07/2025", "10:30", "Pediatría"
+            )
+
+        recargada.agendar_turno(
+            "87654321", "M12345", "23/07/2025", "10:30", "Pediatría"
+        )
+        recargada.cerrar()
+
+        otra = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.assertEqual(otra.contar_turnos(), 5)
+        otra.cerrar()
+
+    def test_historias_perezosas_con_lru(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta), limite_historias=1)
+        self.poblar(clinica)
+
+        historia = clinica.obtener_historia_clinica("12345678")
+        estados = [t.obtener_estado() for t in historia.obtener_turnos()]
+        self.assertEqual(estados, ["Cancelado", "Completado", "Programado"])
+        self.assertEqual(
+            historia.obtener_recetas()[0].obtener_medicamentos(),
+            ["Paracetamol 500mg", "Ibuprofeno 400mg"],
+        )
+
+        clinica.obtener_historia_clinica("87654321")
+        clinica.emitir_receta(
+            "12345678", "M12345", "21/07/2025", ["Amoxicilina"], "Cada 12 horas"
+        )
+        clinica.agendar_turno("12345678", "M12345", "23/07/2025", "09:00", "Pediatría")
+        self.assertIs(
+            clinica.obtener_historia_clinica("87654321").obtener_paciente(),
+            clinica.buscar_paciente("87654321"),
+        )
+
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 4)
+        self.assertEqual(len(historia.obtener_recetas()), 2)
+        self.assertIs(clinica.obtener_historia_clinica("12345678"), historia)
+
+        estadisticas = clinica.obtener_estadisticas_historias()
+        self.assertEqual(estadisticas["entradas"], 1)
+        self.assertEqual(estadisticas["aciertos"], 2)
+        self.assertEqual(estadisticas["fallos"], 3)
+        self.assertGreaterEqual(estadisticas["desalojos"], 3)
+        clinica.cerrar()
+
+    def test_historias_limitadas_no_retienen_turnos(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta), limite_historias=1)
+        self.poblar(clinica)
+
+        referencia = weakref.ref(clinica.buscar_turno(3))
+        gc.collect()
+
+        self.assertIsNone(referencia())
+        self.assertEqual(clinica.buscar_turno(3).obtener_fecha(), "21/07/2025")
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 3)
+        clinica.cerrar()
+
+    def test_historias_perezosas_con_limite_de_memoria(self):
+        clinica = Clinica(
+            repositorio=RepositorioSQLite(self.ruta), limite_memoria_historias=2000
+        )
+        self.poblar(clinica)
+
+        clinica.obtener_historia_clinica("87654321")
+        clinica.obtener_historia_clinica("12345678")
+
+        estadisticas = clinica.obtener_estadisticas_historias()
+        self.assertLessEqual(estadisticas["peso"], 2000)
+        self.assertEqual(estadisticas["entradas"], 2)
+        clinica.cerrar()
+
+    def test_recargar_con_historias_perezosas(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        recargada = Clinica(
+            repositorio=RepositorioSQLite(self.ruta), limite_historias=1
+        )
+        historia = recargada.obtener_historia_clinica("12345678")
+
+        self.assertEqual(len(historia.obtener_turnos()), 3)
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+        self.assertEqual(recargada.obtener_estadisticas_historias()["entradas"], 1)
+        recargada.cerrar()
+
+    def fallar(self, repositorio: RepositorioSQLite, evento: str, tabla: str):
+        repositorio.__conexion__.execute(
+            f"CREATE TEMP TRIGGER falla BEFORE {evento} ON {tabla} "
+            "BEGIN SELECT RAISE(ABORT, 'falla simulada'); END"
+        )
+
+    def reparar(self, repositorio: RepositorioSQLite):
+        repositorio.__conexion__.execute("DROP TRIGGER temp.falla")
+
+    def test_fallo_al_guardar_turnos_no_modifica_la_memoria(self):
+        for almacen in (AlmacenTurnos, AlmacenTurnosColumnar):
+            with self.subTest(almacen=almacen.__name__):
+                ruta = os.path.join(self.directorio.name, f"{almacen.__name__}.db")
+                repositorio = RepositorioSQLite(ruta)
+                clinica = Clinica(almacen_turnos=almacen(), repositorio=repositorio)
+                clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+                clinica.registrar_medico("Dr. Juan García", "M12345")
+                clinica.agregar_especialidad_a_medico(
+                    "M12345", "Pediatría", ["lunes", "viernes"]
+                )
+                repositorio.__conexion__.execute(
+                    "CREATE TEMP TRIGGER falla BEFORE INSERT ON turnos "
+                    "WHEN NEW.fecha_hora = '2025-07-21T09:00' "
+                    "BEGIN SELECT RAISE(ABORT, 'falla simulada'); END"
+                )
+
+                with self.assertRaises(sqlite3.DatabaseError):
+                    clinica.agendar_turnos_lote(
+                        [
+                            ("12345678", "M12345", "18/07/2025", "09:00", "Pediatría"),
+                            ("12345678", "M12345", "21/07/2025", "09:00", "Pediatría"),
+                        ]
+                    )
+
+                self.assertEqual(clinica.contar_turnos(), 0)
+                self.assertEqual(list(clinica.iter_turnos()), [])
+                self.assertEqual(
+                    list(
+                        clinica.obtener_turnos_medico(
+                            "M12345", "01/07/2025", "31/07/2025"
+                        )
+                    ),
+                    [],
+                )
+                historia = clinica.obtener_historia_clinica("12345678")
+                self.assertEqual(historia.obtener_turnos(), [])
+
+                self.reparar(repositorio)
+                turno = clinica.agendar_turno(
+                    "12345678", "M12345", "18/07/2025", "09:00", "Pediatría"
+                )
+                self.assertEqual(turno.obtener_id(), 0)
+                clinica.cerrar()
+
+                recargada = Clinica(repositorio=RepositorioSQLite(ruta))
+                self.assertEqual(recargada.contar_turnos(), 1)
+                recargada.cerrar()
+
+    def test_fallo_al_actualizar_estado_no_modifica_la_memoria(self):
+        repositorio = RepositorioSQLite(self.ruta)
+        clinica = Clinica(repositorio=repositorio)
+        self.poblar(clinica)
+        turno = clinica.agendar_turno(
+            "87654321", "M12345", "23/07/2025", "10:30", "Pediatría"
+        )
+        self.fallar(repositorio, "UPDATE", "turnos")
+
+        with self.assertRaises(sqlite3.DatabaseError):
+            clinica.cancelar_turno(turno.obtener_id())
+
+        self.assertEqual(turno.obtener_estado_turno(), EstadoTurno.PROGRAMADO)
+        self.assertEqual(turno.obtener_version(), 0)
+        self.assertEqual(clinica.contar_turnos(EstadoTurno.PROGRAMADO), 3)
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno(
+                "12345678", "M12345", "23/07/2025", "10:30", "Pediatría"
+            )
+        self.reparar(repositorio)
+        clinica.cancelar_turno(turno.obtener_id(), 0)
+        self.assertEqual(clinica.contar_turnos(EstadoTurno.CANCELADO), 2)
+        clinica.cerrar()
+
+    def test_fallo_al_guardar_paciente_y_receta(self):
+        repositorio = RepositorioSQLite(self.ruta)
+        clinica = Clinica(repositorio=repositorio)
+        self.poblar(clinica)
+        self.fallar(repositorio, "INSERT", "pacientes")
+
+        with self.assertRaises(sqlite3.DatabaseError):
+            clinica.registrar_paciente("Lucas Gauna", "11111111", "01/01/1990")
+        self.assertEqual(clinica.contar_pacientes(), 2)
+
+        self.reparar(repositorio)
+        clinica.registrar_paciente("Lucas Gauna", "11111111", "01/01/1990")
+        self.fallar(repositorio, "INSERT", "recetas")
+        historia = clinica.obtener_historia_clinica("12345678")
+        version = historia.obtener_version()
+
+        with self.assertRaises(sqlite3.DatabaseError):
+            clinica.emitir_receta(
+                "12345678", "M12345", "21/07/2025", ["Amoxicilina"], "Cada 12 horas"
+            )
+        self.assertEqual(historia.obtener_version(), version)
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+        clinica.cerrar()
+
+    def test_cargar_no_revalida_turnos_guardados(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.poblar(clinica)
+        clinica.cerrar()
+
+        conexion = sqlite3.connect(self.ruta)
+        conexion.execute(
+            "INSERT INTO turnos (id, dni, matricula, fecha_hora, especialidad, estado) "
+            "VALUES (4, '12345678', 'M12345', '2025-07-15T09:00', 'Cardiología', "
+            "'Completado')"
+        )
+        conexion.commit()
+        conexion.close()
+
+        recargada = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.assertEqual(recargada.contar_turnos(), 5)
+        self.assertEqual(recargada.contar_turnos(EstadoTurno.COMPLETADO), 2)
+        turno = recargada.buscar_turno(4)
+        self.assertEqual(turno.obtener_especialidad(), "Cardiología")
+        recargada.cerrar()
+
+    def test_historias_perezosas_requieren_repositorio(self):
+        with self.assertRaises(DatosInvalidosException):
+            Clinica(limite_historias=10)
+
+    def test_modo_wal_e_indices(self):
+        repositorio = RepositorioSQLite(self.ruta)
+        repositorio.cerrar()
+
+        conexion = sqlite3.connect(self.ruta)
+        modo = conexion.execute("PRAGMA journal_mode").fetchone()[0]
+        indices = {
+            fila[0]
+            for fila in conexion.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        conexion.close()
+
+        self.assertEqual(modo, "wal")
+        self.assertIn("turnos_medico_fecha", indices)
+        self.assertIn("turnos_paciente", indices)
+        self.assertIn("recetas_paciente", indices)
+
+    def test_confirmacion_agrupada(self):
+        clinica = Clinica(repositorio=RepositorioSQLite(self.ruta, tamanio_lote=3))
+        lector = sqlite3.connect(self.ruta)
+
+        def contar():
+            return lector.execute("SELECT COUNT(*) FROM pacientes").fetchone()[0]
+
+        clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        clinica.registrar_paciente("Martina Arias", "87654321", "15/05/1980")
+        self.assertEqual(contar(), 0)
+
+        clinica.registrar_paciente("Lucas Gauna", "11111111", "01/01/1990")
+        self.assertEqual(contar(), 3)
+
+        clinica.registrar_paciente("Ana Ruiz", "22222222", "01/01/1990")
+        self.assertEqual(contar(), 3)
+        clinica.confirmar()
+        self.assertEqual(contar(), 4)
+
+        lector.close()
+        clinica.cerrar()
+
+    def test_tamanio_lote_invalido(self):
+        with self.assertRaises(DatosInvalidosException):
+            RepositorioSQLite(tamanio_lote=0)
+
+    def test_clinica_en_memoria_por_defecto(self):
+        clinica = Clinica()
+        self.poblar(clinica)
+        clinica.cerrar()
+        self.assertEqual(clinica.contar_turnos(), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
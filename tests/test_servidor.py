@@ -0,0 +1,248 @@
+import asyncio
+import contextlib
+import io
+import json
+import unittest
+from datetime import datetime
+from src.modelo.barrendero import BarrenderoTurnos
+from src.modelo.clinica import Clinica
+from src.modelo.turno import EstadoTurno
+from src.persistencia.repositorio import Repositorio
+from src.api.servidor import ServidorClinica
+from src.api.protocolo import formatear_solicitud, leer_respuesta
+from src.excepciones import RepositorioNoDisponibleException
+
+
+class RepositorioInestable(Repositorio):
+
+    def __init__(self):
+        self.fallar = False
+        self.confirmaciones = 0
+
+    def confirmar(self):
+        if self.fallar:
+            raise OSError("disco lleno")
+        self.confirmaciones += 1
+
+
+class TestServidorClinica(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.repositorio = RepositorioInestable()
+        self.clinica = Clinica(repositorio=self.repositorio)
+        self.clinica.registrar_medico("Dr. Juan García", "M12345")
+        self.clinica.agregar_especialidad_a_medico("M12345", "Pediatría", ["lunes"])
+        self.servidor = ServidorClinica(self.clinica, puerto=0)
+        self.puerto = await self.servidor.iniciar()
+        self.lector, self.escritor = await asyncio.open_connection(
+            "127.0.0.1", self.puerto
+        )
+
+    async def asyncTearDown(self):
+        self.escritor.close()
+        await self.servidor.detener()
+
+    async def enviar(self, *solicitudes) -> list[tuple[int, object]]:
+        self.escritor.write(
+            b"".join(formatear_solicitud(*solicitud) for solicitud in solicitudes)
+        )
+        await self.escritor.drain()
+        respuestas = []
+        for _ in solicitudes:
+            estado, _, cuerpo = await leer_respuesta(self.lector)
+            respuestas.append((estado, json.loads(cuerpo)))
+        return respuestas
+
+    def turno(self, dni: str, hora: str) -> dict:
+        return {
+            "dni": dni,
+            "matricula": "M12345",
+            "fecha": "14/07/2025",
+            "hora": hora,
+            "especialidad": "Pediatría",
+        }
+
+    async def test_canalizacion_respeta_el_orden_de_la_conexion(self):
+        respuestas = await self.enviar(
+            (
+                "POST",
+                "/pacientes",
+                {
+                    "nombre": "Juan Cruz",
+                    "dni": "12345678",
+                    "fecha_nacimiento": "03/02/1980",
+                },
+            ),
+            ("GET", "/pacientes/12345678"),
+            ("POST", "/turnos", self.turno("12345678", "09:00")),
+            ("POST", "/turnos", self.turno("12345678", "09:00")),
+            ("GET", "/pacientes/12345678/historia"),
+        )
+
+        self.assertEqual([e for e, _ in respuestas], [201, 200, 201, 409, 200])
+        self.assertEqual(respuestas[1][1]["nombre"], "Juan Cruz")
+        self.assertEqual(len(respuestas[4][1]["turnos"]), 1)
+        self.assertEqual(self.clinica.contar_turnos(), 1)
+
+    async def test_conexion_persistente_y_cierre(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        for _ in range(3):
+            (respuesta,) = await self.enviar(("GET", "/estadisticas"))
+            self.assertEqual(respuesta[1]["pacientes"], 1)
+
+        self.escritor.write(b"GET /pacientes HTTP/1.1\r\nConnection: close\r\n\r\n")
+        estado, encabezados, cuerpo = await leer_respuesta(self.lector)
+        self.assertEqual(estado, 200)
+        self.assertEqual(encabezados["connection"], "close")
+        self.assertEqual(json.loads(cuerpo)[0]["dni"], "12345678")
+        self.assertIsNone(await leer_respuesta(self.lector))
+
+    async def test_errores(self):
+        respuestas = await self.enviar(
+            ("GET", "/pacientes/99999999"),
+            ("GET", "/inexistente"),
+            ("DELETE", "/pacientes"),
+            ("POST", "/medicos", {"nombre": "Sin matrícula"}),
+            ("POST", "/turnos/lote", {"solicitudes": [self.turno("1", "09:00")]}),
+            ("POST", "/turnos/7/cancelar"),
+        )
+
+        self.assertEqual(
+            [estado for estado, _ in respuestas], [404, 404, 405, 400, 400, 404]
+        )
+        self.assertIn("Falta el campo matricula", respuestas[3][1]["error"])
+        self.assertEqual(respuestas[4][1]["errores"][0]["indice"], 0)
+
+    async def test_solicitud_malformada_cierra_la_conexion(self):
+        self.escritor.write(b"esto no es http\r\n\r\n")
+
+        estado, _, _ = await leer_respuesta(self.lector)
+
+        self.assertEqual(estado, 400)
+        self.assertIsNone(await leer_respuesta(self.lector))
+
+    async def test_escrituras_rechazadas_hasta_que_el_repositorio_se_recupera(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        self.repositorio.fallar = True
+
+        respuestas = await self.enviar(
+            ("POST", "/turnos", self.turno("12345678", "09:00")),
+            ("POST", "/turnos", self.turno("12345678", "09:00")),
+        )
+        self.assertEqual([e for e, _ in respuestas], [202, 409])
+        self.assertTrue(respuestas[0][1]["pendiente"])
+        self.assertIn("disco lleno", respuestas[0][1]["error"])
+        self.assertEqual(respuestas[0][1]["resultado"]["hora"], "09:00")
+        self.assertEqual(self.clinica.contar_turnos(), 1)
+
+        respuestas = await self.enviar(
+            ("POST", "/turnos", self.turno("12345678", "10:00")),
+            ("GET", "/estadisticas"),
+        )
+        self.assertEqual([e for e, _ in respuestas], [503, 200])
+        self.assertIn("disco lleno", respuestas[0][1]["error"])
+        self.assertEqual(self.clinica.contar_turnos(), 1)
+
+        self.repositorio.fallar = False
+        respuestas = await self.enviar(
+            ("POST", "/turnos", self.turno("12345678", "09:00")),
+            ("POST", "/turnos", self.turno("12345678", "10:00")),
+        )
+        self.assertEqual([e for e, _ in respuestas], [409, 201])
+        self.assertEqual(self.clinica.contar_turnos(), 2)
+
+    async def test_escrituras_concurrentes_se_serializan(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        conexiones = [
+            await asyncio.open_connection("127.0.0.1", self.puerto) for _ in range(5)
+        ]
+        for _, escritor in conexiones:
+            escritor.write(
+                formatear_solicitud("POST", "/turnos", self.turno("12345678", "09:00"))
+            )
+
+        estados = []
+        for lector, escritor in conexiones:
+            estados.append((await leer_respuesta(lector))[0])
+            escritor.close()
+
+        self.assertEqual(sorted(estados), [201, 409, 409, 409, 409])
+        self.assertEqual(self.clinica.contar_turnos(), 1)
+
+
+    async def test_cambios_de_estado_con_version(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        (creado,) = await self.enviar(
+            ("POST", "/turnos", self.turno("12345678", "09:00"))
+        )
+        identificador = creado[1]["id"]
+        version = creado[1]["version"]
+
+        respuestas = await self.enviar(
+            ("POST", f"/turnos/{identificador}/cancelar", {"version": version}),
+            ("POST", f"/turnos/{identificador}/completar", {"version": version}),
+            ("POST", f"/turnos/{identificador}/completar", {"version": "1"}),
+            ("GET", "/pacientes/12345678/historia"),
+        )
+
+        self.assertEqual([estado for estado, _ in respuestas], [200, 409, 400, 200])
+        self.assertEqual(respuestas[0][1]["version"], version + 1)
+        self.assertEqual(respuestas[3][1]["version"], 1)
+
+    async def test_registrar_ausencia(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        (creado,) = await self.enviar(
+            ("POST", "/turnos", self.turno("12345678", "09:00"))
+        )
+        identificador = creado[1]["id"]
+
+        respuestas = await self.enviar(
+            ("POST", f"/turnos/{identificador}/ausente"),
+            ("POST", f"/turnos/{identificador}/ausente"),
+            ("GET", "/estadisticas"),
+        )
+
+        self.assertEqual([estado for estado, _ in respuestas], [200, 409, 200])
+        self.assertEqual(respuestas[0][1]["estado"], "Ausente")
+        self.assertEqual(respuestas[2][1]["turnos"]["Ausente"], 1)
+
+    async def test_barrido_pasa_por_la_cola_de_escrituras(self):
+        self.clinica.registrar_paciente("Juan Cruz", "12345678", "03/02/1980")
+        for hora in ("09:00", "09:30", "10:00"):
+            self.clinica.agendar_turno(
+                "12345678", "M12345", "14/07/2025", hora, "Pediatría"
+            )
+        barrendero = BarrenderoTurnos(
+            self.clinica, tamanio_lote=2, reloj=lambda: datetime(2025, 7, 14, 23, 59)
+        )
+        confirmaciones = self.repositorio.confirmaciones
+
+        tarea = asyncio.create_task(
+            barrendero.barrer_periodicamente(60, self.servidor.aplicar)
+        )
+        while barrendero.obtener_barridos() < 3:
+            await asyncio.sleep(0)
+        tarea.cancel()
+
+        self.assertEqual(self.clinica.contar_turnos(EstadoTurno.COMPLETADO), 3)
+        self.assertGreaterEqual(self.repositorio.confirmaciones, confirmaciones + 2)
+
+    async def test_aplicar_respeta_la_politica_de_confirmacion(self):
+        with self.assertRaises(ZeroDivisionError):
+            await self.servidor.aplicar(lambda: 1 / 0)
+
+        self.repositorio.fallar = True
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(await self.servidor.aplicar(lambda: 1), 1)
+        aplicadas = []
+        with self.assertRaises(RepositorioNoDisponibleException):
+            await self.servidor.aplicar(lambda: aplicadas.append(1))
+        self.assertEqual(aplicadas, [])
+
+        self.repositorio.fallar = False
+        await self.servidor.aplicar(lambda: aplicadas.append(1))
+        self.assertEqual(aplicadas, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,15 @@
+import pickle
 import unittest
 from src.modelo.paciente import Paciente
 from src.modelo.medico import Medico
 from src.modelo.especialidad import Especialidad
-from src.modelo.turno import Turno
+from src.modelo.turno import Turno, EstadoTurno
 from src.excepciones import (
     DatosInvalidosException,
     MedicoNoDisponibleException,
     EspecialidadInvalidaException,
+    EstadoTurnoInvalidoException,
+    VersionObsoletaException,
 )
 
 
@@ -28,6 +31,12 @@ class TestTurno(unittest.TestCase):
         self.assertEqual(turno.obtener_especialidad(), "Pediatría")
         self.assertEqual(turno.obtener_estado(), "Programado")
 
+    def test_crear_turno_fecha_normalizada(self):
+        turno = Turno(self.paciente, self.medico, "16/7/2025", "9:05", "Pediatría")
+
+        self.assertEqual(turno.obtener_fecha(), "16/07/2025")
+        self.assertEqual(turno.obtener_hora(), "09:05")
+
     def test_crear_turno_sin_paciente(self):
         with self.assertRaises(DatosInvalidosException):
             Turno(None, self.medico, "16/07/2025", "10:30", "Pediatría")
@@ -87,6 +96,70 @@ class TestTurno(unittest.TestCase):
         turno.marcar_cancelado()
         self.assertEqual(turno.obtener_estado(), "Cancelado")
 
+    def test_marcar_turno_ausente(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        turno.marcar_ausente(0)
+        self.assertEqual(turno.obtener_estado(), "Ausente")
+        self.assertEqual(turno.obtener_version(), 1)
+        with self.assertRaises(EstadoTurnoInvalidoException):
+            turno.marcar_completado()
+
+    def test_observador_cambio_estado(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        cambios = []
+        turno.agregar_observador(
+            lambda t, anterior: cambios.append((anterior, t.obtener_estado()))
+        )
+
+        turno.marcar_cancelado()
+
+        self.assertEqual(cambios, [(EstadoTurno.PROGRAMADO, "Cancelado")])
+
+    def test_transiciones_invalidas(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        turno.marcar_completado()
+
+        with self.assertRaises(EstadoTurnoInvalidoException):
+            turno.marcar_cancelado()
+        with self.assertRaises(EstadoTurnoInvalidoException):
+            turno.marcar_completado()
+
+        self.assertEqual(turno.obtener_estado_turno(), EstadoTurno.COMPLETADO)
+
+    def test_cambio_de_estado_con_version(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        self.assertEqual(turno.obtener_version(), 0)
+
+        with self.assertRaises(VersionObsoletaException):
+            turno.marcar_cancelado(1)
+        self.assertEqual(turno.obtener_estado_turno(), EstadoTurno.PROGRAMADO)
+
+        turno.marcar_completado(0)
+        self.assertEqual(turno.obtener_version(), 1)
+        with self.assertRaises(VersionObsoletaException):
+            turno.marcar_cancelado(0)
+        with self.assertRaises(EstadoTurnoInvalidoException):
+            turno.marcar_cancelado(1)
+
+    def test_reconstruir_conserva_version(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        turno.marcar_cancelado()
+
+        copia = pickle.loads(pickle.dumps(turno))
+        self.assertEqual(copia.obtener_version(), 1)
+        derivado = Turno.reconstruir(
+            self.paciente,
+            self.medico,
+            turno.obtener_fecha_hora(),
+            "Pediatría",
+            EstadoTurno.CANCELADO,
+        )
+        self.assertEqual(derivado.obtener_version(), 1)
+
+    def test_sin_dict_por_instancia(self):
+        turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
+        self.assertFalse(hasattr(turno, "__dict__"))
+
     def test_representacion_turno(self):
         turno = Turno(self.paciente, self.medico, "16/07/2025", "10:30", "Pediatría")
         representacion = str(turno)